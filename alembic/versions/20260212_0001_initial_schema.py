@@ -40,7 +40,7 @@ role_enum = sa.Enum(
 )
 
 
-def upgrade() -> None:
+def _create_tables() -> None:
     op.create_table(
         "users",
         sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
@@ -56,8 +56,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
     )
     op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
-    op.create_index(op.f("ix_users_username"), "users", ["username"], unique=True)
-    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
 
     op.create_table(
         "user_sessions",
@@ -74,20 +72,37 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
     )
     op.create_index(op.f("ix_user_sessions_id"), "user_sessions", ["id"], unique=False)
+
+
+def _create_secondary_indexes() -> None:
+    # Built after the tables so any rows loaded in between are indexed in one
+    # bulk pass instead of maintaining every b-tree row by row.
+    op.create_index(op.f("ix_users_username"), "users", ["username"], unique=True)
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
     op.create_index(op.f("ix_user_sessions_user_id"), "user_sessions", ["user_id"], unique=False)
     op.create_index(op.f("ix_user_sessions_refresh_token_hash"), "user_sessions", ["refresh_token_hash"], unique=False)
     op.create_index(op.f("ix_user_sessions_expires_at"), "user_sessions", ["expires_at"], unique=False)
 
 
-def downgrade() -> None:
+def _drop_secondary_indexes() -> None:
     op.drop_index(op.f("ix_user_sessions_expires_at"), table_name="user_sessions")
     op.drop_index(op.f("ix_user_sessions_refresh_token_hash"), table_name="user_sessions")
     op.drop_index(op.f("ix_user_sessions_user_id"), table_name="user_sessions")
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+    op.drop_index(op.f("ix_users_username"), table_name="users")
+
+
+def upgrade() -> None:
+    _create_tables()
+    _create_secondary_indexes()
+
+
+def downgrade() -> None:
+    _drop_secondary_indexes()
+
     op.drop_index(op.f("ix_user_sessions_id"), table_name="user_sessions")
     op.drop_table("user_sessions")
 
-    op.drop_index(op.f("ix_users_email"), table_name="users")
-    op.drop_index(op.f("ix_users_username"), table_name="users")
     op.drop_index(op.f("ix_users_id"), table_name="users")
     op.drop_table("users")
 
@@ -17,6 +17,23 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Foreign keys are attached by trailing ALTERs once the tables and indexes
+# exist, so rows loaded right after table creation skip per-row RI checks.
+_FOREIGN_KEYS = (
+    ("fk_transcriptions_user_id", "transcriptions", "users", ["user_id"], ["id"]),
+    ("fk_chat_messages_user_id", "chat_messages", "users", ["user_id"], ["id"]),
+    ("fk_projects_user_id", "projects", "users", ["user_id"], ["id"]),
+)
+
+
+def _create_foreign_keys() -> None:
+    # batch_alter_table emits a plain ALTER on Postgres and falls back to a
+    # table copy on SQLite, which cannot add constraints in place.
+    for name, source, referent, local_cols, remote_cols in _FOREIGN_KEYS:
+        with op.batch_alter_table(source) as batch_op:
+            batch_op.create_foreign_key(name, referent, local_cols, remote_cols)
+
+
 def upgrade() -> None:
     op.create_table(
         "transcriptions",
@@ -29,7 +46,6 @@ def upgrade() -> None:
         sa.Column("error_message", sa.Text(), nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
-        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
         sa.PrimaryKeyConstraint("id"),
     )
     op.create_index(op.f("ix_transcriptions_id"), "transcriptions", ["id"], unique=False)
@@ -43,7 +59,6 @@ def upgrade() -> None:
         sa.Column("user_message", sa.Text(), nullable=False),
         sa.Column("assistant_message", sa.Text(), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
-        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
         sa.PrimaryKeyConstraint("id"),
     )
     op.create_index(op.f("ix_chat_messages_id"), "chat_messages", ["id"], unique=False)
@@ -63,13 +78,14 @@ def upgrade() -> None:
         sa.Column("is_public", sa.Boolean(), nullable=False, server_default=sa.text("true")),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
-        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
         sa.PrimaryKeyConstraint("id"),
     )
     op.create_index(op.f("ix_projects_id"), "projects", ["id"], unique=False)
     op.create_index(op.f("ix_projects_user_id"), "projects", ["user_id"], unique=False)
     op.create_index(op.f("ix_projects_name"), "projects", ["name"], unique=False)
 
+    _create_foreign_keys()
+
 
 def downgrade() -> None:
     op.drop_index(op.f("ix_projects_name"), table_name="projects")
@@ -17,6 +17,35 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Same ordering as 20260213_0002: constraints are added after the tables,
+# grouped per table so SQLite copies each table at most once.
+_FOREIGN_KEYS = {
+    "software_packages": (
+        ("fk_software_packages_owner_id", "users", ["owner_id"], ["id"]),
+    ),
+    "file_versions": (
+        ("fk_file_versions_blob_id", "file_blobs", ["blob_id"], ["id"]),
+        ("fk_file_versions_package_id", "software_packages", ["package_id"], ["id"]),
+    ),
+    "upload_sessions": (
+        (
+            "fk_upload_sessions_completed_file_version_id",
+            "file_versions",
+            ["completed_file_version_id"],
+            ["id"],
+        ),
+        ("fk_upload_sessions_user_id", "users", ["user_id"], ["id"]),
+    ),
+}
+
+
+def _create_foreign_keys() -> None:
+    for source, constraints in _FOREIGN_KEYS.items():
+        with op.batch_alter_table(source) as batch_op:
+            for name, referent, local_cols, remote_cols in constraints:
+                batch_op.create_foreign_key(name, referent, local_cols, remote_cols)
+
+
 def upgrade() -> None:
     op.create_table(
         "software_packages",
@@ -28,7 +57,6 @@ def upgrade() -> None:
         sa.Column("latest_version", sa.String(length=64), nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
-        sa.ForeignKeyConstraint(["owner_id"], ["users.id"]),
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("owner_id", "name", name="uq_software_packages_owner_name"),
     )
@@ -63,8 +91,6 @@ def upgrade() -> None:
         sa.Column("checksum_sha256", sa.String(length=64), nullable=False),
         sa.Column("download_count", sa.Integer(), nullable=False, server_default="0"),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
-        sa.ForeignKeyConstraint(["blob_id"], ["file_blobs.id"]),
-        sa.ForeignKeyConstraint(["package_id"], ["software_packages.id"]),
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("package_id", "version", name="uq_file_versions_package_version"),
     )
@@ -90,12 +116,12 @@ def upgrade() -> None:
         sa.Column("completed_file_version_id", sa.Integer(), nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
-        sa.ForeignKeyConstraint(["completed_file_version_id"], ["file_versions.id"]),
-        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
         sa.PrimaryKeyConstraint("id"),
     )
     op.create_index(op.f("ix_upload_sessions_user_id"), "upload_sessions", ["user_id"], unique=False)
 
+    _create_foreign_keys()
+
 
 def downgrade() -> None:
     op.drop_index(op.f("ix_upload_sessions_user_id"), table_name="upload_sessions")
@@ -17,11 +17,28 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _relax_commit_durability() -> None:
+    # The backfills below rewrite every row. synchronous_commit is only read
+    # at COMMIT, so it cannot be narrowed to the UPDATEs: env.py runs every
+    # pending revision in one transaction and this covers that whole commit.
+    # That is safe because a lost commit also loses the alembic_version bump,
+    # so the run simply repeats. The new category/language indexes are built
+    # after the backfill, so there is no index to drop and recreate around it.
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("SET LOCAL synchronous_commit = off")
+
+
 def upgrade() -> None:
+    _relax_commit_durability()
     op.add_column("software_packages", sa.Column("category", sa.String(length=80), nullable=True))
     op.add_column("software_packages", sa.Column("language", sa.String(length=80), nullable=True))
-    op.execute("UPDATE software_packages SET category='student projects' WHERE category IS NULL")
-    op.execute("UPDATE software_packages SET language='Unknown' WHERE language IS NULL")
+    # One pass per table: both backfills share the same scan.
+    op.execute(
+        "UPDATE software_packages "
+        "SET category = COALESCE(category, 'student projects'), "
+        "language = COALESCE(language, 'Unknown') "
+        "WHERE category IS NULL OR language IS NULL"
+    )
     # Use batch mode for SQLite compatibility (ALTER COLUMN unsupported).
     with op.batch_alter_table("software_packages") as batch_op:
         batch_op.alter_column("category", nullable=False)
@@ -31,8 +48,12 @@ def upgrade() -> None:
 
     op.add_column("upload_sessions", sa.Column("package_category", sa.String(length=80), nullable=True))
     op.add_column("upload_sessions", sa.Column("package_language", sa.String(length=80), nullable=True))
-    op.execute("UPDATE upload_sessions SET package_category='student projects' WHERE package_category IS NULL")
-    op.execute("UPDATE upload_sessions SET package_language='Unknown' WHERE package_language IS NULL")
+    op.execute(
+        "UPDATE upload_sessions "
+        "SET package_category = COALESCE(package_category, 'student projects'), "
+        "package_language = COALESCE(package_language, 'Unknown') "
+        "WHERE package_category IS NULL OR package_language IS NULL"
+    )
     with op.batch_alter_table("upload_sessions") as batch_op:
         batch_op.alter_column("package_category", nullable=False)
         batch_op.alter_column("package_language", nullable=False)
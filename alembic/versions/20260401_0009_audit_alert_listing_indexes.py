@@ -0,0 +1,82 @@
+"""audit/alert listing indexes ordered by time desc
+
+Revision ID: 20260401_0009
+Revises: 20260320_0008
+Create Date: 2026-04-01 09:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "20260401_0009"
+down_revision: Union[str, None] = "20260320_0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_INDEXES = (
+    ("ix_audit_events_event_type_occurred_at", "audit_events", "event_type", "occurred_at"),
+    (
+        "ix_security_alerts_acknowledged_created_at",
+        "security_alerts",
+        "acknowledged",
+        "created_at",
+    ),
+)
+_REPLACED = (
+    ("ix_audit_events_type_occurred", "audit_events", "event_type", "occurred_at"),
+    ("ix_security_alerts_ack_created", "security_alerts", "acknowledged", "created_at"),
+)
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _create_listing_indexes(*, concurrently: bool) -> None:
+    for name, table, leading, ordered in _INDEXES:
+        if not _table_exists(table):
+            continue
+        op.create_index(
+            name,
+            table,
+            [leading, sa.text(f"{ordered} DESC")],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=concurrently,
+        )
+    for name, table, _leading, _ordered in _REPLACED:
+        if _table_exists(table):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=concurrently,
+            )
+
+
+def upgrade() -> None:
+    if _is_postgres():
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with context.get_context().autocommit_block():
+            _create_listing_indexes(concurrently=True)
+    else:
+        _create_listing_indexes(concurrently=False)
+
+
+def downgrade() -> None:
+    for name, table, leading, ordered in _REPLACED:
+        if _table_exists(table):
+            op.create_index(name, table, [leading, ordered], unique=False, if_not_exists=True)
+    for name, table, _leading, _ordered in _INDEXES:
+        if _table_exists(table):
+            op.drop_index(name, table_name=table, if_exists=True)
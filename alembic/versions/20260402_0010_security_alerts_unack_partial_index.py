@@ -0,0 +1,54 @@
+"""partial index over unacknowledged security alerts
+
+Revision ID: 20260402_0010
+Revises: 20260401_0009
+Create Date: 2026-04-02 09:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "20260402_0010"
+down_revision: Union[str, None] = "20260401_0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    if not _table_exists("security_alerts"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with context.get_context().autocommit_block():
+            op.create_index(
+                "ix_security_alerts_unack_created",
+                "security_alerts",
+                [sa.text("created_at DESC")],
+                unique=False,
+                if_not_exists=True,
+                postgresql_where=sa.text("acknowledged = false"),
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index(
+            "ix_security_alerts_unack_created",
+            "security_alerts",
+            [sa.text("created_at DESC")],
+            unique=False,
+            if_not_exists=True,
+            sqlite_where=sa.text("acknowledged = 0"),
+        )
+
+
+def downgrade() -> None:
+    if _table_exists("security_alerts"):
+        op.drop_index("ix_security_alerts_unack_created", table_name="security_alerts", if_exists=True)
@@ -0,0 +1,50 @@
+"""keyset pagination index for software listings
+
+Revision ID: 20260405_0011
+Revises: 20260402_0010
+Create Date: 2026-04-05 09:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "20260405_0011"
+down_revision: Union[str, None] = "20260402_0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _create_keyset_index(**kwargs) -> None:
+    op.create_index(
+        "ix_sms_softwares_updated_at_id",
+        "sms_softwares",
+        [sa.text("updated_at DESC"), sa.text("id DESC")],
+        unique=False,
+        if_not_exists=True,
+        **kwargs,
+    )
+
+
+def upgrade() -> None:
+    if not _table_exists("sms_softwares"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with context.get_context().autocommit_block():
+            _create_keyset_index(postgresql_concurrently=True)
+    else:
+        _create_keyset_index()
+
+
+def downgrade() -> None:
+    if _table_exists("sms_softwares"):
+        op.drop_index("ix_sms_softwares_updated_at_id", table_name="sms_softwares", if_exists=True)
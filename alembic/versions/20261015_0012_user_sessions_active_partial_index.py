@@ -0,0 +1,53 @@
+"""partial index over active user sessions
+
+Revision ID: 20261015_0012
+Revises: 20260405_0011
+Create Date: 2026-10-15 09:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "20261015_0012"
+down_revision: Union[str, None] = "20260405_0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _create_active_index(**kwargs) -> None:
+    op.create_index(
+        "ix_user_sessions_active_user",
+        "user_sessions",
+        ["user_id"],
+        unique=False,
+        if_not_exists=True,
+        **kwargs,
+    )
+
+
+def upgrade() -> None:
+    if not _table_exists("user_sessions"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with context.get_context().autocommit_block():
+            _create_active_index(
+                postgresql_where=sa.text("revoked_at IS NULL"),
+                postgresql_concurrently=True,
+            )
+    else:
+        _create_active_index(sqlite_where=sa.text("revoked_at IS NULL"))
+
+
+def downgrade() -> None:
+    if _table_exists("user_sessions"):
+        op.drop_index("ix_user_sessions_active_user", table_name="user_sessions", if_exists=True)
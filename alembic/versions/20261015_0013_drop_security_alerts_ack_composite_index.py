@@ -0,0 +1,57 @@
+"""drop the acknowledged/created_at composite index on security alerts
+
+Revision ID: 20261015_0013
+Revises: 20261015_0012
+Create Date: 2026-10-15 10:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "20261015_0013"
+down_revision: Union[str, None] = "20261015_0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # Unacknowledged listings are served by ix_security_alerts_unack_created
+    # (20260402_0010) and full listings by ix_security_alerts_created_at, so
+    # the composite only costs writes and space for every acknowledged row.
+    if not _table_exists("security_alerts"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        # DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+        with context.get_context().autocommit_block():
+            op.drop_index(
+                "ix_security_alerts_acknowledged_created_at",
+                table_name="security_alerts",
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
+    else:
+        op.drop_index(
+            "ix_security_alerts_acknowledged_created_at",
+            table_name="security_alerts",
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    if _table_exists("security_alerts"):
+        op.create_index(
+            "ix_security_alerts_acknowledged_created_at",
+            "security_alerts",
+            ["acknowledged", sa.text("created_at DESC")],
+            unique=False,
+            if_not_exists=True,
+        )
@@ -0,0 +1,64 @@
+"""newest-first version listing index for sms_versions
+
+Revision ID: 20261015_0014
+Revises: 20261015_0013
+Create Date: 2026-10-15 11:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "20261015_0014"
+down_revision: Union[str, None] = "20261015_0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _swap_indexes(*, concurrently: bool) -> None:
+    op.create_index(
+        "ix_sms_versions_software_created",
+        "sms_versions",
+        ["software_id", sa.text("created_at DESC")],
+        unique=False,
+        if_not_exists=True,
+        postgresql_concurrently=concurrently,
+    )
+    # The composite's leading column covers every software_id lookup.
+    op.drop_index(
+        "ix_sms_versions_software_id",
+        table_name="sms_versions",
+        if_exists=True,
+        postgresql_concurrently=concurrently,
+    )
+
+
+def upgrade() -> None:
+    if not _table_exists("sms_versions"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with context.get_context().autocommit_block():
+            _swap_indexes(concurrently=True)
+    else:
+        _swap_indexes(concurrently=False)
+
+
+def downgrade() -> None:
+    if _table_exists("sms_versions"):
+        op.create_index(
+            "ix_sms_versions_software_id",
+            "sms_versions",
+            ["software_id"],
+            unique=False,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_sms_versions_software_created", table_name="sms_versions", if_exists=True)
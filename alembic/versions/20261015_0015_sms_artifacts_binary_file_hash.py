@@ -0,0 +1,78 @@
+"""store sms_artifacts.file_hash as raw sha-256 bytes
+
+Revision ID: 20261015_0015
+Revises: 20261015_0014
+Create Date: 2026-10-15 12:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261015_0015"
+down_revision: Union[str, None] = "20261015_0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _rewrite_hashes(convert) -> None:
+    # SQLite has no decode()/encode() for hex, so rows are converted here.
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, file_hash FROM sms_artifacts")).all()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE sms_artifacts SET file_hash = :file_hash WHERE id = :id"),
+            [{"id": row.id, "file_hash": convert(row.file_hash)} for row in rows],
+        )
+
+
+def _to_digest(value) -> bytes:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        value = bytes(value).decode("ascii")
+    return bytes.fromhex(value)
+
+
+def _to_hex(value) -> str:
+    return bytes(value).hex()
+
+
+def upgrade() -> None:
+    if not _table_exists("sms_artifacts"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column(
+            "sms_artifacts",
+            "file_hash",
+            type_=sa.LargeBinary(),
+            existing_nullable=False,
+            postgresql_using="decode(file_hash, 'hex')",
+        )
+        return
+    with op.batch_alter_table("sms_artifacts") as batch_op:
+        batch_op.alter_column("file_hash", type_=sa.LargeBinary(length=32), existing_nullable=False)
+    _rewrite_hashes(_to_digest)
+
+
+def downgrade() -> None:
+    if not _table_exists("sms_artifacts"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column(
+            "sms_artifacts",
+            "file_hash",
+            type_=sa.String(length=64),
+            existing_nullable=False,
+            postgresql_using="encode(file_hash, 'hex')",
+        )
+        return
+    _rewrite_hashes(_to_hex)
+    with op.batch_alter_table("sms_artifacts") as batch_op:
+        batch_op.alter_column("file_hash", type_=sa.String(length=64), existing_nullable=False)
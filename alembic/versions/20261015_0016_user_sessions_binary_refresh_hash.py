@@ -0,0 +1,82 @@
+"""store user_sessions.refresh_token_hash as a raw 32-byte digest
+
+Revision ID: 20261015_0016
+Revises: 20261015_0015
+Create Date: 2026-10-15 13:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261015_0016"
+down_revision: Union[str, None] = "20261015_0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _rewrite_hashes(convert) -> None:
+    # SQLite has no decode()/encode() for hex, so rows are converted here.
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, refresh_token_hash FROM user_sessions")).all()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE user_sessions SET refresh_token_hash = :refresh_token_hash WHERE id = :id"),
+            [{"id": row.id, "refresh_token_hash": convert(row.refresh_token_hash)} for row in rows],
+        )
+
+
+def _to_digest(value) -> bytes:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        value = bytes(value).decode("ascii")
+    return bytes.fromhex(value)
+
+
+def _to_hex(value) -> str:
+    return bytes(value).hex()
+
+
+def upgrade() -> None:
+    # Existing rows hold unkeyed SHA-256 hex digests. They are carried over
+    # as raw bytes, which AuthService still matches as a legacy hash until
+    # REFRESH_LEGACY_HASH_SINCE + REFRESH_TOKEN_EXPIRE_DAYS and rehashes on
+    # the next refresh, so no live session is ended.
+    if not _table_exists("user_sessions"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column(
+            "user_sessions",
+            "refresh_token_hash",
+            type_=sa.LargeBinary(),
+            existing_nullable=False,
+            postgresql_using="decode(refresh_token_hash, 'hex')",
+        )
+        return
+    with op.batch_alter_table("user_sessions") as batch_op:
+        batch_op.alter_column("refresh_token_hash", type_=sa.LargeBinary(length=32), existing_nullable=False)
+    _rewrite_hashes(_to_digest)
+
+
+def downgrade() -> None:
+    if not _table_exists("user_sessions"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column(
+            "user_sessions",
+            "refresh_token_hash",
+            type_=sa.String(length=128),
+            existing_nullable=False,
+            postgresql_using="encode(refresh_token_hash, 'hex')",
+        )
+        return
+    _rewrite_hashes(_to_hex)
+    with op.batch_alter_table("user_sessions") as batch_op:
+        batch_op.alter_column("refresh_token_hash", type_=sa.String(length=128), existing_nullable=False)
@@ -0,0 +1,59 @@
+"""partial index over users still pending e-mail verification
+
+Revision ID: 20261015_0017
+Revises: 20261015_0016
+Create Date: 2026-10-15 14:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "20261015_0017"
+down_revision: Union[str, None] = "20261015_0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _swap_indexes(*, concurrently: bool) -> None:
+    op.create_index(
+        "ix_users_verification_pending",
+        "users",
+        ["created_at", "verification_email_next_retry_at"],
+        unique=False,
+        if_not_exists=True,
+        postgresql_where=sa.text("status <> 'VERIFIED'"),
+        sqlite_where=sa.text("status <> 'VERIFIED'"),
+        postgresql_concurrently=concurrently,
+    )
+    # Only ever created from the model metadata, so it may not exist.
+    op.drop_index(
+        "ix_users_verification_retry_lookup",
+        table_name="users",
+        if_exists=True,
+        postgresql_concurrently=concurrently,
+    )
+
+
+def upgrade() -> None:
+    if not _table_exists("users"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with context.get_context().autocommit_block():
+            _swap_indexes(concurrently=True)
+    else:
+        _swap_indexes(concurrently=False)
+
+
+def downgrade() -> None:
+    if _table_exists("users"):
+        op.drop_index("ix_users_verification_pending", table_name="users", if_exists=True)
@@ -0,0 +1,65 @@
+"""covering keyset index for software listings
+
+Revision ID: 20261015_0018
+Revises: 20261015_0017
+Create Date: 2026-10-15 15:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "20261015_0018"
+down_revision: Union[str, None] = "20261015_0017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _swap_indexes(*, concurrently: bool) -> None:
+    # INCLUDE is Postgres-only (11+); other dialects get the plain keyset index.
+    op.create_index(
+        "ix_sms_softwares_updated_cover",
+        "sms_softwares",
+        [sa.text("updated_at DESC"), sa.text("id DESC")],
+        unique=False,
+        if_not_exists=True,
+        postgresql_include=["owner_id", "name", "is_public", "created_at"],
+        postgresql_concurrently=concurrently,
+    )
+    op.drop_index(
+        "ix_sms_softwares_updated_at_id",
+        table_name="sms_softwares",
+        if_exists=True,
+        postgresql_concurrently=concurrently,
+    )
+
+
+def upgrade() -> None:
+    if not _table_exists("sms_softwares"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with context.get_context().autocommit_block():
+            _swap_indexes(concurrently=True)
+    else:
+        _swap_indexes(concurrently=False)
+
+
+def downgrade() -> None:
+    if _table_exists("sms_softwares"):
+        op.create_index(
+            "ix_sms_softwares_updated_at_id",
+            "sms_softwares",
+            [sa.text("updated_at DESC"), sa.text("id DESC")],
+            unique=False,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_sms_softwares_updated_cover", table_name="sms_softwares", if_exists=True)
@@ -0,0 +1,61 @@
+"""drop secondary indexes duplicating primary keys
+
+Revision ID: 20261015_0019
+Revises: 20261015_0018
+Create Date: 2026-10-15 16:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "20261015_0019"
+down_revision: Union[str, None] = "20261015_0018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Each of these is a plain btree on "id" next to the primary key's own
+# unique index, so every insert maintained two identical trees.
+_REDUNDANT = (
+    ("ix_users_id", "users"),
+    ("ix_user_sessions_id", "user_sessions"),
+    ("ix_chat_messages_id", "chat_messages"),
+    ("ix_projects_id", "projects"),
+    ("ix_resources_id", "resources"),
+    ("ix_transcriptions_id", "transcriptions"),
+)
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _drop_indexes(*, concurrently: bool) -> None:
+    for name, table in _REDUNDANT:
+        if _table_exists(table):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=concurrently,
+            )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+        with context.get_context().autocommit_block():
+            _drop_indexes(concurrently=True)
+    else:
+        _drop_indexes(concurrently=False)
+
+
+def downgrade() -> None:
+    for name, table in _REDUNDANT:
+        if _table_exists(table):
+            op.create_index(name, table, ["id"], unique=False, if_not_exists=True)
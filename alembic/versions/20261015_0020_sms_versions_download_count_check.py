@@ -0,0 +1,49 @@
+"""non-negative check on sms_versions.download_count
+
+Revision ID: 20261015_0020
+Revises: 20261015_0019
+Create Date: 2026-10-15 17:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261015_0020"
+down_revision: Union[str, None] = "20261015_0019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_CONSTRAINT = "ck_sms_versions_download_count"
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    if not _table_exists("sms_versions"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        # NOT VALID skips the full scan under ACCESS EXCLUSIVE; VALIDATE then
+        # checks existing rows while only holding SHARE UPDATE EXCLUSIVE.
+        op.execute(
+            f"ALTER TABLE sms_versions ADD CONSTRAINT {_CONSTRAINT} "
+            "CHECK (download_count >= 0) NOT VALID"
+        )
+        op.execute(f"ALTER TABLE sms_versions VALIDATE CONSTRAINT {_CONSTRAINT}")
+    else:
+        with op.batch_alter_table("sms_versions") as batch_op:
+            batch_op.create_check_constraint(_CONSTRAINT, "download_count >= 0")
+
+
+def downgrade() -> None:
+    if not _table_exists("sms_versions"):
+        return
+    with op.batch_alter_table("sms_versions") as batch_op:
+        batch_op.drop_constraint(_CONSTRAINT, type_="check")
@@ -0,0 +1,60 @@
+"""dedup bucket and unique dedup index on security_alerts
+
+Revision ID: 20261015_0021
+Revises: 20261015_0020
+Create Date: 2026-10-15 18:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "20261015_0021"
+down_revision: Union[str, None] = "20261015_0020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _create_dedup_index(*, concurrently: bool) -> None:
+    # Existing rows keep a NULL bucket, so they never collide with each other.
+    op.create_index(
+        "uq_security_alerts_dedup",
+        "security_alerts",
+        [
+            "rule_code",
+            sa.text("coalesce(actor_user_id, 0)"),
+            sa.text("coalesce(ip_address, '')"),
+            "dedup_bucket",
+        ],
+        unique=True,
+        if_not_exists=True,
+        postgresql_concurrently=concurrently,
+    )
+
+
+def upgrade() -> None:
+    if not _table_exists("security_alerts"):
+        return
+    op.add_column("security_alerts", sa.Column("dedup_bucket", sa.BigInteger(), nullable=True))
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with context.get_context().autocommit_block():
+            _create_dedup_index(concurrently=True)
+    else:
+        _create_dedup_index(concurrently=False)
+
+
+def downgrade() -> None:
+    if not _table_exists("security_alerts"):
+        return
+    op.drop_index("uq_security_alerts_dedup", table_name="security_alerts", if_exists=True)
+    with op.batch_alter_table("security_alerts") as batch_op:
+        batch_op.drop_column("dedup_bucket")
@@ -0,0 +1,67 @@
+"""keyset listing indexes for projects
+
+Revision ID: 20261015_0022
+Revises: 20261015_0021
+Create Date: 2026-10-15 18:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "20261015_0022"
+down_revision: Union[str, None] = "20261015_0021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_INDEXES = (
+    ("ix_projects_user_id_id_desc", ["user_id", "id"]),
+    ("ix_projects_is_public_id_desc", ["is_public", "id"]),
+)
+
+
+def _table_exists(table_name: str) -> bool:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _create_indexes(*, concurrently: bool) -> None:
+    for name, columns in _INDEXES:
+        op.create_index(
+            name,
+            "projects",
+            columns,
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=concurrently,
+        )
+
+
+def _drop_indexes(*, concurrently: bool) -> None:
+    for name, _ in _INDEXES:
+        op.drop_index(name, table_name="projects", if_exists=True, postgresql_concurrently=concurrently)
+
+
+def upgrade() -> None:
+    if not _table_exists("projects"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with context.get_context().autocommit_block():
+            _create_indexes(concurrently=True)
+    else:
+        _create_indexes(concurrently=False)
+
+
+def downgrade() -> None:
+    if not _table_exists("projects"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        with context.get_context().autocommit_block():
+            _drop_indexes(concurrently=True)
+    else:
+        _drop_indexes(concurrently=False)
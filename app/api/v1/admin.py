@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import re
 from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, Path as ApiPath, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Path as ApiPath, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import String, false, literal, select, union_all, update
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -15,38 +18,123 @@ from app.database.db_setup import get_db
 from app.models.audit_event import AuditEvent
 from app.models.security_alert import SecurityAlert
 
-router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
+router = APIRouter(
+    prefix="/api/v1/admin",
+    tags=["Admin"],
+    default_response_class=ORJSONResponse,
+)
 
-_BEARER_RE = re.compile(r"(bearer\s+)[A-Za-z0-9\-\._~\+\/]+=*", flags=re.IGNORECASE)
-_PASSWORD_RE = re.compile(r"(password\s*[:=]\s*)\S+", flags=re.IGNORECASE)
-_TOKEN_RE = re.compile(r"((?:refresh|access)?_?token\s*[:=]\s*)\S+", flags=re.IGNORECASE)
+# Single alternation so each log line is scanned once instead of three times.
+_REDACT_RE = re.compile(
+    r"(?P<bearer>bearer\s+)[A-Za-z0-9\-\._~\+\/]+=*"
+    r"|(?P<pw>password\s*[:=]\s*)\S+"
+    r"|(?P<tok>(?:refresh|access)?_?token\s*[:=]\s*)\S+",
+    flags=re.IGNORECASE,
+)
+
+
+def _redact_match(match: re.Match[str]) -> str:
+    prefix = match.group("bearer") or match.group("pw") or match.group("tok")
+    return f"{prefix}[REDACTED]"
 
 
 def _sanitize_log_line(line: str) -> str:
-    line = _BEARER_RE.sub(r"\1[REDACTED]", line)
-    line = _PASSWORD_RE.sub(r"\1[REDACTED]", line)
-    line = _TOKEN_RE.sub(r"\1[REDACTED]", line)
-    return line
+    return _REDACT_RE.sub(_redact_match, line)
+
+
+_TAIL_BLOCK_SIZE = 64 * 1024
+_LOG_PATH = Path(settings.log_file_path)
+_LOG_PATH_STR = str(_LOG_PATH)
+
+# Column projections for the list endpoints: rows come back as plain tuples
+# instead of hydrated ORM instances.
+_ALERT_COLUMNS = (
+    SecurityAlert.id,
+    SecurityAlert.rule_code,
+    SecurityAlert.severity,
+    SecurityAlert.title,
+    SecurityAlert.description,
+    SecurityAlert.actor_user_id,
+    SecurityAlert.ip_address,
+    SecurityAlert.audit_event_id,
+    SecurityAlert.acknowledged,
+    SecurityAlert.acknowledged_at,
+    SecurityAlert.acknowledged_by_user_id,
+    SecurityAlert.created_at,
+)
+_AUDIT_EVENT_COLUMNS = (
+    AuditEvent.id,
+    AuditEvent.event_type,
+    AuditEvent.actor_user_id,
+    AuditEvent.method,
+    AuditEvent.path,
+    AuditEvent.status_code,
+    AuditEvent.ip_address,
+    AuditEvent.user_agent,
+    AuditEvent.request_id,
+    AuditEvent.metadata_json,
+    AuditEvent.occurred_at,
+)
+_COOKIE_ACTIVITY_COLUMNS = (
+    AuditEvent.id,
+    AuditEvent.event_type,
+    AuditEvent.actor_user_id,
+    AuditEvent.ip_address,
+    AuditEvent.user_agent,
+    AuditEvent.metadata_json,
+    AuditEvent.occurred_at,
+)
+
+# Cookie/activity event types as a tiny relation joined against audit_events,
+# so each type drives its own (event_type, occurred_at) index range scan.
+# Built from literal SELECTs because SQLite rejects aliased VALUES lists.
+_TRACKED_TYPES = union_all(
+    *(
+        select(literal(event_type, String(120)).label("event_type"))
+        for event_type in (
+            "cookie.consent.accepted",
+            "cookie.consent.declined",
+            "client.activity",
+        )
+    )
+).cte("tracked_types")
 
 
 def _tail_lines(path: Path, lines: int) -> list[str]:
-    if not path.exists():
+    # Read fixed-size blocks backwards from EOF so the cost scales with the
+    # requested window rather than with the size of the log file.
+    try:
+        fh = path.open("rb")
+    except FileNotFoundError:
         return []
-    with path.open("r", encoding="utf-8", errors="replace") as fh:
-        recent = deque(fh, maxlen=lines)
-    return [_sanitize_log_line(line.rstrip("\r\n")) for line in recent]
+    with fh:
+        position = fh.seek(0, os.SEEK_END)
+        blocks: deque[bytes] = deque()
+        newlines = 0
+        while position > 0 and newlines <= lines:
+            step = min(_TAIL_BLOCK_SIZE, position)
+            position -= step
+            fh.seek(position)
+            block = fh.read(step)
+            blocks.appendleft(block)
+            newlines += block.count(b"\n")
+    text = b"".join(blocks).decode("utf-8", errors="replace")
+    recent = text.split("\n")
+    if recent and not recent[-1]:
+        recent.pop()
+    return [_sanitize_log_line(line.rstrip("\r")) for line in recent[-lines:]]
 
 
 @router.get("/logs", status_code=200)
-def get_logs(
+async def get_logs(
     lines: int = Query(200, ge=1, le=1000),
     _admin: dict = Depends(admin_access),
 ):
-    log_path = Path(settings.LOG_FILE_PATH)
+    entries = await asyncio.to_thread(_tail_lines, _LOG_PATH, lines)
     return {
-        "log_file": str(log_path),
+        "log_file": _LOG_PATH_STR,
         "lines_requested": lines,
-        "entries": _tail_lines(log_path, lines),
+        "entries": entries,
     }
 
 
@@ -57,11 +145,13 @@ def list_security_alerts(
     db: Session = Depends(get_db),
     _admin: dict = Depends(admin_access),
 ):
-    stmt = select(SecurityAlert).order_by(SecurityAlert.created_at.desc()).limit(limit)
+    stmt = select(*_ALERT_COLUMNS).order_by(SecurityAlert.created_at.desc()).limit(limit)
     if only_unacknowledged:
-        stmt = stmt.where(SecurityAlert.acknowledged.is_(False))
-    alerts = db.execute(stmt).scalars().all()
-    return {
+        # Spelled "= false" (not "IS false") so the planner matches the
+        # predicate of the partial ix_security_alerts_unack_created index.
+        stmt = stmt.where(SecurityAlert.acknowledged == false())
+    alerts = db.execute(stmt).all()
+    return ORJSONResponse({
         "count": len(alerts),
         "items": [
             {
@@ -80,43 +170,60 @@ def list_security_alerts(
             }
             for alert in alerts
         ],
-    }
+    })
 
 
-@router.patch("/alerts/{alert_id}/ack", status_code=200)
+@router.patch("/alerts/{alert_id}/ack", status_code=204)
 def acknowledge_security_alert(
     alert_id: int = ApiPath(..., ge=1),
     db: Session = Depends(get_db),
     admin: dict = Depends(admin_access),
 ):
-    alert = db.get(SecurityAlert, alert_id)
-    if not alert:
-        return {"detail": "Alert not found"}
-    if alert.acknowledged:
-        return {"detail": "Alert already acknowledged", "alert_id": alert_id}
-    alert.acknowledged = True
-    alert.acknowledged_at = datetime.now(timezone.utc)
-    alert.acknowledged_by_user_id = int(admin["user_id"])
-    db.commit()
-    return {"detail": "Alert acknowledged", "alert_id": alert_id}
+    stmt = (
+        update(SecurityAlert)
+        .where(SecurityAlert.id == alert_id, SecurityAlert.acknowledged == false())
+        .values(
+            acknowledged=True,
+            acknowledged_at=datetime.now(timezone.utc),
+            acknowledged_by_user_id=int(admin["user_id"]),
+        )
+        .returning(SecurityAlert.id)
+    )
+    if db.execute(stmt).scalar_one_or_none() is not None:
+        db.commit()
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    # Nothing updated: a narrow probe tells "missing" apart from "already acked".
+    existing_id = db.execute(
+        select(SecurityAlert.id).where(SecurityAlert.id == alert_id)
+    ).scalar_one_or_none()
+    if existing_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found")
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Alert already acknowledged")
 
 
 @router.get("/audit-events", status_code=200)
 def list_audit_events(
     event_type: str | None = Query(None, max_length=120),
     actor_user_id: int | None = Query(None, ge=1),
+    before_id: int | None = Query(None, ge=1),
     limit: int = Query(200, ge=1, le=1000),
     db: Session = Depends(get_db),
     _admin: dict = Depends(admin_access),
 ):
-    stmt = select(AuditEvent).order_by(AuditEvent.occurred_at.desc()).limit(limit)
+    # Keyset on the primary key: ids are assigned in insert order, so paging
+    # with before_id walks the same sequence as occurred_at without OFFSET.
+    stmt = select(*_AUDIT_EVENT_COLUMNS).order_by(AuditEvent.id.desc()).limit(limit)
     if event_type:
         stmt = stmt.where(AuditEvent.event_type == event_type)
     if actor_user_id is not None:
         stmt = stmt.where(AuditEvent.actor_user_id == actor_user_id)
-    events = db.execute(stmt).scalars().all()
-    return {
+    if before_id is not None:
+        stmt = stmt.where(AuditEvent.id < before_id)
+    events = db.execute(stmt).all()
+    return ORJSONResponse({
         "count": len(events),
+        "next_before_id": events[-1].id if len(events) == limit else None,
         "items": [
             {
                 "id": event.id,
@@ -133,7 +240,7 @@ def list_audit_events(
             }
             for event in events
         ],
-    }
+    })
 
 
 @router.get("/cookie-activity", status_code=200)
@@ -143,21 +250,16 @@ def list_cookie_activity(
     db: Session = Depends(get_db),
     _admin: dict = Depends(admin_access),
 ):
-    tracked_types = (
-        "cookie.consent.accepted",
-        "cookie.consent.declined",
-        "client.activity",
-    )
     stmt = (
-        select(AuditEvent)
-        .where(AuditEvent.event_type.in_(tracked_types))
+        select(*_COOKIE_ACTIVITY_COLUMNS)
+        .join(_TRACKED_TYPES, AuditEvent.event_type == _TRACKED_TYPES.c.event_type)
         .order_by(AuditEvent.occurred_at.desc())
         .limit(limit)
     )
     if actor_user_id is not None:
         stmt = stmt.where(AuditEvent.actor_user_id == actor_user_id)
-    events = db.execute(stmt).scalars().all()
-    return {
+    events = db.execute(stmt).all()
+    return ORJSONResponse({
         "count": len(events),
         "items": [
             {
@@ -171,4 +273,4 @@ def list_cookie_activity(
             }
             for event in events
         ],
-    }
+    })
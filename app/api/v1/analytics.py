@@ -1,53 +1,78 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal, Union
+
+import orjson
+from fastapi import APIRouter, Depends, Request
+from pydantic import BaseModel, BeforeValidator, Field
 
 from app.core.security import get_current_user
-from app.services.audit_service import log_http_audit_event
+from app.services.audit_queue import submit_http_audit_event
 
 router = APIRouter(prefix="/api/v1/analytics", tags=["Analytics"])
 
 
-class AnalyticsEventRequest(BaseModel):
-    event_type: str = Field(..., pattern="^(cookie_consent|user_activity)$")
-    action: str = Field(..., min_length=1, max_length=80)
+class _AnalyticsEventBase(BaseModel):
     page: str | None = Field(None, max_length=120)
     client_id: str | None = Field(None, max_length=64)
     metadata: dict = Field(default_factory=dict)
 
 
+def _lowercase(value: object) -> object:
+    return value.lower() if isinstance(value, str) else value
+
+
+class CookieConsentEvent(_AnalyticsEventBase):
+    event_type: Literal["cookie_consent"]
+    # Clients historically sent "Accepted"/"Declined"; normalise before the check.
+    action: Annotated[Literal["accepted", "declined"], BeforeValidator(_lowercase)]
+
+
+class UserActivityEvent(_AnalyticsEventBase):
+    event_type: Literal["user_activity"]
+    action: str = Field(..., min_length=1, max_length=80)
+
+
+# Discriminated on event_type so pydantic-core picks the model (and checks the
+# cookie action) without a regex or a branch in the handler.
+AnalyticsEventRequest = Annotated[
+    Union[CookieConsentEvent, UserActivityEvent],
+    Field(discriminator="event_type"),
+]
+
+
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _flatten_value(value: object) -> str:
+    try:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()[:500]
+    except orjson.JSONEncodeError:
+        # Valid JSON orjson refuses to emit (ints beyond 64 bits, lone
+        # surrogates) never reaches default=, so fall back to repr-style text.
+        return str(value)[:500]
+
+
 def _safe_metadata(raw: dict | None) -> dict:
     if not isinstance(raw, dict):
         return {}
-    safe: dict[str, object] = {}
-    for key, value in raw.items():
-        key_str = str(key)[:80]
-        if isinstance(value, (str, int, float, bool)) or value is None:
-            safe[key_str] = value
-        else:
-            safe[key_str] = str(value)[:500]
-    return safe
+    # Payloads come from a parsed JSON body, so non-primitive values are nested
+    # lists/dicts; orjson flattens those to a string in a single C call.
+    return {
+        str(key)[:80]: value if type(value) in _PRIMITIVE_TYPES else _flatten_value(value)
+        for key, value in raw.items()
+    }
 
 
 @router.post("/events", status_code=202)
-def capture_analytics_event(
+async def capture_analytics_event(
     payload: AnalyticsEventRequest,
     request: Request,
     current_user: dict = Depends(get_current_user),
 ):
-    is_cookie_event = payload.event_type == "cookie_consent"
-    action = payload.action.lower()
-    if is_cookie_event and action not in {"accepted", "declined"}:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cookie consent action must be accepted or declined.",
-        )
     event_type = (
-        "cookie.consent.accepted"
-        if is_cookie_event and action == "accepted"
-        else "cookie.consent.declined"
-        if is_cookie_event and action == "declined"
+        f"cookie.consent.{payload.action}"
+        if isinstance(payload, CookieConsentEvent)
         else "client.activity"
     )
 
@@ -61,7 +86,8 @@ def capture_analytics_event(
     ip_address = request.client.host if request.client else None
     user_agent = request.headers.get("user-agent")
 
-    log_http_audit_event(
+    # Telemetry rows are queued and bulk-inserted by the audit flush loop.
+    await submit_http_audit_event(
         event_type=event_type,
         actor_user_id=int(current_user["user_id"]),
         method=request.method,
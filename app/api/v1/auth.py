@@ -2,15 +2,13 @@ from pathlib import Path
 import json
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Form, HTTPException, Request, Response, status
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
 
 from app.services.auth_service import AuthService
-from app.core.unit_of_work import UnitOfWork
+from app.core.unit_of_work import service_dep
 from app.schemas.user import ProfileResponse
-from app.database.db_setup import get_db
 from app.core.config import settings
 from app.core.abuse_protection import abuse_protection
 
@@ -21,11 +19,6 @@ router = APIRouter(
 )
 logger = logging.getLogger(__name__)
 
-# Get auth service
-def get_service(session: Session = Depends(get_db))->AuthService:
-    uow = UnitOfWork(session=session)
-    return AuthService(uow)
-
 # Rate limiting functionality
 def _enforce_rate_limit(
     *,
@@ -93,7 +86,7 @@ def login(
     request: Request,
     response: Response,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    service: AuthService = Depends(get_service),
+    service: AuthService = Depends(service_dep(AuthService)),
       ):
     username = (form_data.username or "").strip()
     password = form_data.password
@@ -140,7 +133,7 @@ def login(
 def refresh_session(
     request: Request,
     response: Response,
-    service: AuthService = Depends(get_service),
+    service: AuthService = Depends(service_dep(AuthService)),
 ):
     _enforce_rate_limit(
         request=request,
@@ -167,6 +160,7 @@ def refresh_session(
         user_agent=user_agent,
         ip_address=ip_address,
     )
+    request.state.audit_actor_user_id = user.id
     _set_auth_cookies(response, access_token, new_refresh)
     logger.info(
         "[auth.refresh] user_id=%s rotated_refresh_cookie=true",
@@ -187,11 +181,11 @@ def refresh_session(
 def logout(
     request: Request,
     response: Response,
-    service: AuthService = Depends(get_service),
+    service: AuthService = Depends(service_dep(AuthService)),
 ):
     refresh_token = request.cookies.get(settings.REFRESH_COOKIE_NAME) if request else None
     if refresh_token:
-        service.revoke_session(refresh_token=refresh_token)
+        request.state.audit_actor_user_id = service.revoke_session(refresh_token=refresh_token)
     _clear_auth_cookies(response)
     return None
 
@@ -199,7 +193,7 @@ def logout(
 @router.get("/verify", status_code=200)
 def verify_email(
     token: str,
-    service: AuthService = Depends(get_service),
+    service: AuthService = Depends(service_dep(AuthService)),
 ):
     service.verify_user_account(token=token)
     return {"message": "Account verified"}
@@ -226,9 +220,8 @@ def verify_page():
 @router.post("/password-reset/requests", status_code=200)
 def request_password_reset(
     request: Request,
-    background_tasks: BackgroundTasks,
     email: str = Form(...),
-    service: AuthService = Depends(get_service),
+    service: AuthService = Depends(service_dep(AuthService)),
 ):
     # Enforce rate limiting
     _enforce_rate_limit(
@@ -238,7 +231,7 @@ def request_password_reset(
         window_seconds=settings.AUTH_PASSWORD_RESET_REQUEST_WINDOW_SECONDS,
         identifier=email,
     )
-    detail = service.request_password_reset(email=email, background_tasks=background_tasks)
+    detail = service.request_password_reset(email=email)
     return {"detail": detail}
 
 # Password reset confirmation route
@@ -248,7 +241,7 @@ def confirm_password_reset(
     token: str = Form(...),
     new_password: str = Form(...),
     confirm_password: str = Form(...),
-    service: AuthService = Depends(get_service),
+    service: AuthService = Depends(service_dep(AuthService)),
 ):
     _enforce_rate_limit(
         request=request,
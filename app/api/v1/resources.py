@@ -1,41 +1,51 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 
+from app.core.http_cache import etag_matches, not_modified, weak_etag
 from app.core.security import admin_access, get_current_user
-from app.core.unit_of_work import UnitOfWork
-from app.database.db_setup import get_db
+from app.core.unit_of_work import service_dep
 from app.schemas.resource import ResourceCreate, ResourceRead
 from app.services.resource_service import ResourceService
 
 router = APIRouter(prefix="/api/v1/resources", tags=["Resources"])
 
-
-def get_service(db: Session = Depends(get_db)) -> ResourceService:
-    return ResourceService(UnitOfWork(session=db))
+_RESOURCE_READ_FIELDS = tuple(ResourceRead.model_fields)
 
 
 @router.get("", response_model=list[ResourceRead], status_code=200)
 def list_resources(
+    request: Request,
     type: str | None = Query(None),
-    service: ResourceService = Depends(get_service),
+    service: ResourceService = Depends(service_dep(ResourceService)),
     _user: dict = Depends(get_current_user),
 ):
-    return service.list_resources(type_filter=type)
+    items = [dict(resource) for resource in service.list_resources(type_filter=type)]
+    etag = weak_etag(*items)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return ORJSONResponse(items, headers={"ETag": etag})
 
 
 @router.get("/{slug}", response_model=ResourceRead, status_code=200)
 def get_resource(
     slug: str,
-    service: ResourceService = Depends(get_service),
+    request: Request,
+    response: Response,
+    service: ResourceService = Depends(service_dep(ResourceService)),
     _user: dict = Depends(get_current_user),
 ):
-    return service.get_by_slug(slug=slug)
+    resource = service.get_by_slug(slug=slug)
+    etag = weak_etag(*(getattr(resource, field) for field in _RESOURCE_READ_FIELDS))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return resource
 
 
 @router.post("", response_model=ResourceRead, status_code=201)
 def create_resource(
     payload: ResourceCreate,
-    service: ResourceService = Depends(get_service),
+    service: ResourceService = Depends(service_dep(ResourceService)),
     _admin: dict = Depends(admin_access),
 ):
     return service.create_resource(payload)
@@ -44,7 +54,7 @@ def create_resource(
 @router.delete("/{slug}", status_code=204)
 def delete_resource(
     slug: str,
-    service: ResourceService = Depends(get_service),
+    service: ResourceService = Depends(service_dep(ResourceService)),
     _admin: dict = Depends(admin_access),
 ):
     service.delete_resource(slug=slug)
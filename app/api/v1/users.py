@@ -1,13 +1,13 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 import logging
 
 from app.schemas.user import UserCreate, UserResponse, UserRead
 from app.services.user_service import UserService
-from app.core.unit_of_work import UnitOfWork
-from app.database.db_setup import get_db
+from app.core.unit_of_work import service_dep
 from app.services.auth_service import AuthService
 from app.core.security import admin_access, get_current_user
+from app.core.http_cache import etag_matches, not_modified, weak_etag
 
 from app.exceptions.exceptions import DomainError
 
@@ -18,23 +18,19 @@ router = APIRouter(
     tags=["Users"]
 )
 
+_USER_READ_FIELDS = tuple(UserRead.model_fields)
 
-# Get User Service
-def get_service(db: Session = Depends(get_db))->UserService:
-    uow = UnitOfWork(session=db)
-    return UserService(uow=uow)
 
-def get_auth_service(db: Session=Depends(get_db))->AuthService:
-    uow = UnitOfWork(session=db)
-    return AuthService(uow)
+def _user_etag(user) -> str:
+    return weak_etag(*(getattr(user, field) for field in _USER_READ_FIELDS))
+
 
 # Registration route
 @router.post("/users", response_model=UserResponse, status_code=201)
 def register_user(
     payload: UserCreate,
-    background_tasks: BackgroundTasks,
-    service: UserService = Depends(get_service),
-    auth_service: AuthService = Depends(get_auth_service)
+    service: UserService = Depends(service_dep(UserService)),
+    auth_service: AuthService = Depends(service_dep(AuthService))
     ):
     user = service.create_user(payload)
     try:
@@ -50,11 +46,18 @@ def register_user(
 # Get my profile 
 @router.get("/users/me", response_model=UserRead, status_code=200)
 def get_my_profile(
-    service: UserService = Depends(get_service),
+    request: Request,
+    response: Response,
+    service: UserService = Depends(service_dep(UserService)),
     current_user: dict = Depends(get_current_user),
 ):
     user_id = current_user["user_id"]
-    return service.get_user_by_id(user_id=user_id)
+    user = service.get_user_by_id(user_id=user_id)
+    etag = _user_etag(user)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return user
 
 
 # List users
@@ -62,17 +65,28 @@ def get_my_profile(
 def list_users(
     cursor: int | None = Query(None, ge=1),
     limit: int = Query(100, ge=1, le=200),
-    service: UserService = Depends(get_service),
+    service: UserService = Depends(service_dep(UserService)),
     _admin: dict = Depends(admin_access),
 ):
-    return service.list_users(cursor=cursor, limit=limit)
+    users = service.list_users(cursor=cursor, limit=limit)
+    # Rows are already projected to the UserRead columns; skip re-validation.
+    return ORJSONResponse([
+        dict(user) for user in users
+    ])
 
 # Get user by id
 @router.get("/users/{user_id}", response_model=UserRead, status_code=200)
 def get_user(
     user_id: int,
-    service: UserService = Depends(get_service),
+    request: Request,
+    response: Response,
+    service: UserService = Depends(service_dep(UserService)),
     _admin: dict = Depends(admin_access),
 ):
-    return service.get_user_by_id(user_id=user_id)
+    user = service.get_user_by_id(user_id=user_id)
+    etag = _user_etag(user)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return user
 
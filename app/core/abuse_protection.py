@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
 import logging
 import threading
 import time
@@ -8,9 +9,10 @@ import time
 from app.core.config import settings
 
 try:
-    from redis import Redis
+    from redis import ConnectionPool, Redis
     from redis.exceptions import RedisError
 except Exception:  # pragma: no cover - fallback path if redis package is unavailable
+    ConnectionPool = None
     Redis = None
 
     class RedisError(Exception):
@@ -19,6 +21,34 @@ except Exception:  # pragma: no cover - fallback path if redis package is unavai
 
 logger = logging.getLogger(__name__)
 
+# INCR + first-hit EXPIRE + TTL in one server-side round trip.
+_RATE_LIMIT_LUA = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+local ttl = redis.call('TTL', KEYS[1])
+if ttl < 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+    ttl = tonumber(ARGV[1])
+end
+return {count, ttl}
+"""
+
+# Adds to the current minute bucket and sums the window's buckets (KEYS[1] is
+# the current one) in a single round trip.
+_WINDOW_COUNT_LUA = """
+redis.call('INCRBY', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+local total = 0
+for _, value in ipairs(redis.call('MGET', unpack(KEYS))) do
+    if value then
+        total = total + tonumber(value)
+    end
+end
+return total
+"""
+
 
 class AbuseProtection:
     """Provides rate limiting and one-time token markers with Redis fallback."""
@@ -26,9 +56,13 @@ class AbuseProtection:
     def __init__(self) -> None:
         self._redis = None
         self._redis_checked = False
+        self._rate_limit_script = None
+        self._window_count_script = None
         self._lock = threading.Lock()
         self._rate_window: dict[str, tuple[int, int]] = {}
         self._one_time: dict[str, int] = {}
+        # Min-heap of (expires_at, bucket) so eviction only touches expired entries.
+        self._one_time_heap: list[tuple[int, str]] = []
 
     def _get_redis(self):
         if self._redis_checked:
@@ -37,16 +71,28 @@ class AbuseProtection:
         if Redis is None:
             return None
         try:
-            self._redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+            pool = ConnectionPool.from_url(
+                settings.REDIS_URL,
+                max_connections=64,
+                decode_responses=True,
+            )
+            self._redis = Redis(connection_pool=pool)
             self._redis.ping()
+            # register_script caches the SHA1 and uses EVALSHA after first load.
+            self._rate_limit_script = self._redis.register_script(_RATE_LIMIT_LUA)
+            self._window_count_script = self._redis.register_script(_WINDOW_COUNT_LUA)
         except Exception as exc:
             logger.warning("Redis unavailable for abuse protection, using memory fallback: %s", exc)
             self._redis = None
+            self._rate_limit_script = None
+            self._window_count_script = None
         return self._redis
 
     @staticmethod
     def _bucket(scope: str, key: str) -> str:
-        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        # Opaque bucket id only; a 128-bit BLAKE2b digest is cheaper than
+        # SHA-256 and keeps Redis keys short.
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16, usedforsecurity=False).hexdigest()
         return f"abuse:{scope}:{digest}"
 
     def hit_rate_limit(self, *, scope: str, key: str, limit: int, window_seconds: int) -> tuple[bool, int]:
@@ -56,16 +102,8 @@ class AbuseProtection:
         redis_client = self._get_redis()
         if redis_client is not None:
             try:
-                with redis_client.pipeline() as pipe:
-                    pipe.incr(bucket)
-                    pipe.ttl(bucket)
-                    count, ttl = pipe.execute()
-                count = int(count or 0)
-                ttl = int(ttl or -1)
-                if ttl < 0:
-                    redis_client.expire(bucket, window_seconds)
-                    ttl = window_seconds
-                return count > limit, max(1, ttl)
+                count, ttl = self._rate_limit_script(keys=[bucket], args=[window_seconds])
+                return int(count) > limit, max(1, int(ttl))
             except RedisError:
                 pass
 
@@ -80,6 +118,24 @@ class AbuseProtection:
             retry_after = max(1, reset_at - now)
         return count > limit, retry_after
 
+    def add_to_window(self, *, scope: str, key: str, amount: int, window_seconds: int) -> int | None:
+        """Count ``amount`` hits in per-minute buckets and return the window total.
+
+        Returns None without Redis: a per-process count would undercount across
+        workers, so callers fall back to their own source of truth.
+        """
+        redis_client = self._get_redis()
+        if redis_client is None:
+            return None
+        bucket = self._bucket(scope, key)
+        minute = int(time.time()) // 60
+        buckets = max(1, -(-window_seconds // 60))
+        keys = [f"{bucket}:{minute - offset}" for offset in range(buckets)]
+        try:
+            return int(self._window_count_script(keys=keys, args=[amount, buckets * 60 + 60]))
+        except RedisError:
+            return None
+
     def set_once(self, *, scope: str, key: str, ttl_seconds: int) -> bool:
         ttl_seconds = max(1, int(ttl_seconds))
         bucket = self._bucket(scope, key)
@@ -97,9 +153,13 @@ class AbuseProtection:
             if existing and existing > now:
                 return False
             self._one_time[bucket] = expires_at
-            stale_keys = [k for k, v in self._one_time.items() if v <= now]
-            for stale_key in stale_keys:
-                del self._one_time[stale_key]
+            heapq.heappush(self._one_time_heap, (expires_at, bucket))
+            heap = self._one_time_heap
+            while heap and heap[0][0] <= now:
+                stale_expires_at, stale_key = heapq.heappop(heap)
+                # Skip heap entries superseded by a later set_once on the same key.
+                if self._one_time.get(stale_key) == stale_expires_at:
+                    del self._one_time[stale_key]
         return True
 
 
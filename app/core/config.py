@@ -1,3 +1,6 @@
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from functools import cached_property, lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -5,25 +8,24 @@ from dataclasses import dataclass
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
 BACKEND_ROOT = Path(__file__).resolve().parents[2]
+PROJECT_ROOT = BACKEND_ROOT.parent
+_BACKEND_ROOT_STR = str(BACKEND_ROOT)
+
 
 def _normalize_smtp_host(value: str) -> str:
     host = (value or "").strip()
-    if not host:
+    # Bare hostnames are the common case; only URL-shaped values need urlparse.
+    if not host or "://" not in host:
         return host
-    parsed = urlparse(host)
-    if parsed.scheme:
-        return parsed.hostname or host
-    return host
+    return urlparse(host).hostname or host
 
 
 def _resolve_path(value: str, fallback: str) -> str:
     raw = (value or "").strip() or fallback
-    path = Path(raw)
-    if not path.is_absolute():
-        path = (BACKEND_ROOT / path).resolve()
-    return str(path)
+    if os.path.isabs(raw):
+        return os.path.normpath(raw)
+    return os.path.normpath(os.path.join(_BACKEND_ROOT_STR, raw))
 
 
 class AppSettings(BaseSettings):
@@ -52,6 +54,10 @@ class AppSettings(BaseSettings):
     ALERT_ACCESS_DENIED_THRESHOLD: int = 10
     ALERT_LOOKBACK_MINUTES: int = 15
     ALERT_DEDUP_MINUTES: int = 15
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 0.1
+    AUDIT_FLUSH_BATCH_SIZE: int = 500
+    AUDIT_QUEUE_MAX_SIZE: int = 10_000
+    DOWNLOAD_COUNT_FLUSH_INTERVAL_SECONDS: float = 10.0
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -66,6 +72,7 @@ class AppSettings(BaseSettings):
     SMTP_USE_TLS: bool = True
     SMTP_USE_SSL: bool = False
     SMTP_VALIDATE_CERTS: bool = True
+    SMTP_POOL_SIZE: int = 8
 
     # URLs
     BASE_URL: str = "http://127.0.0.1:8000"
@@ -77,11 +84,13 @@ class AppSettings(BaseSettings):
     PACKAGE_STORAGE_BACKEND: str = "local"
     PACKAGE_UPLOAD_MAX_SIZE_BYTES: int = 5 * 1024 * 1024 * 1024
     PACKAGE_UPLOAD_CHUNK_SIZE_BYTES: int = 1024 * 1024
+    PACKAGE_DOWNLOAD_CHUNK_SIZE_BYTES: int = 4 * 1024 * 1024
     PACKAGE_USER_QUOTA_BYTES: int = 25 * 1024 * 1024 * 1024
     PACKAGE_UPLOAD_RATE_LIMIT: int = 30
     PACKAGE_UPLOAD_RATE_WINDOW_SECONDS: int = 60
     PACKAGE_DOWNLOAD_RATE_LIMIT: int = 120
     PACKAGE_DOWNLOAD_RATE_WINDOW_SECONDS: int = 60
+    PACKAGE_ADMIN_SUMMARY_CACHE_TTL_SECONDS: float = 60.0
 
     # Authentication
     ALGORITHM: str = "HS256"
@@ -90,7 +99,11 @@ class AppSettings(BaseSettings):
     PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = 30
     EMAIL_VERIFY_SECRET: str = "dev_email_verify_secret_change_me_1234567890"
     PASSWORD_RESET_SECRET: str = ""
+    REFRESH_PEPPER: str = ""
     REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+    # Day the refresh-token hash scheme last changed. Older digests are still
+    # matched for REFRESH_TOKEN_EXPIRE_DAYS after it; None stops matching them.
+    REFRESH_LEGACY_HASH_SINCE: date | None = date(2026, 10, 15)
     REFRESH_REQUIRE_SAME_USER_AGENT: bool = True
     REFRESH_REQUIRE_SAME_IP: bool = False
 
@@ -103,6 +116,10 @@ class AppSettings(BaseSettings):
     AUTH_PASSWORD_RESET_REQUEST_WINDOW_SECONDS: int = 300
     AUTH_PASSWORD_RESET_CONFIRM_RATE_LIMIT: int = 10
     AUTH_PASSWORD_RESET_CONFIRM_WINDOW_SECONDS: int = 300
+    AUTH_BAD_TOKEN_CACHE_TTL_SECONDS: int = 60
+    AUTH_BAD_TOKEN_CACHE_MAX_SIZE: int = 50_000
+    AUTH_BAD_TOKEN_RATE_LIMIT: int = 60
+    AUTH_BAD_TOKEN_WINDOW_SECONDS: int = 60
 
     # Compatibility
     EXPOSE_ACCESS_TOKEN_IN_BODY: bool = False
@@ -136,11 +153,18 @@ class AppSettings(BaseSettings):
     EMAIL_RETRY_BASE_DELAY_SECONDS: int = 2
     EMAIL_RETRY_MAX_DELAY_SECONDS: int = 30
 
+    # Email dispatch queue
+    EMAIL_QUEUE_MAX_SIZE: int = 1000
+    EMAIL_QUEUE_PUT_TIMEOUT_SECONDS: float = 5.0
+    EMAIL_SEND_CONCURRENCY: int = 8
+    EMAIL_ARQ_ENABLED: bool = False
+
     # Email verification recovery loop
     EMAIL_RECOVERY_ENABLED: bool = True
     EMAIL_RECOVERY_INTERVAL_SECONDS: int = 120
     EMAIL_RECOVERY_ELIGIBLE_AGE_SECONDS: int = 120
     EMAIL_RECOVERY_MAX_BATCH_SIZE: int = 100
+    EMAIL_RECOVERY_CONCURRENCY: int = 8
     EMAIL_RECOVERY_MAX_RETRY_COUNT: int = 20
     EMAIL_RECOVERY_BACKOFF_BASE_SECONDS: int = 120
     EMAIL_RECOVERY_BACKOFF_MAX_SECONDS: int = 3600
@@ -149,19 +173,10 @@ class AppSettings(BaseSettings):
     @model_validator(mode="after")
     def normalize_and_validate(self) -> "AppSettings":
         self.LOG_LEVEL = (self.LOG_LEVEL or "INFO").upper()
-        self.LOG_DIR = _resolve_path(self.LOG_DIR, "logs")
-        self.LOG_FILE_PATH = _resolve_path(self.LOG_FILE_PATH, str(Path(self.LOG_DIR) / "app.log"))
-        self.SMTP_HOST = _normalize_smtp_host(self.SMTP_HOST)
         self.BACKEND_URL = (self.BACKEND_URL or self.BASE_URL or "http://127.0.0.1:8000").strip()
-        self.UPLOAD_ROOT = _resolve_path(self.UPLOAD_ROOT, "storage")
         self.PACKAGE_STORAGE_BACKEND = (self.PACKAGE_STORAGE_BACKEND or "local").lower()
         self.COOKIE_SAMESITE = (self.COOKIE_SAMESITE or "lax").lower()
         self.COOKIE_DOMAIN = (self.COOKIE_DOMAIN or "").strip() or None
-        self.PASSWORD_RESET_SECRET = (
-            (self.PASSWORD_RESET_SECRET or "").strip()
-            or self.EMAIL_VERIFY_SECRET
-            or self.SECRET_KEY
-        )
 
         if self.PACKAGE_STORAGE_BACKEND not in {"local", "object"}:
             raise RuntimeError("PACKAGE_STORAGE_BACKEND must be 'local' or 'object'.")
@@ -169,16 +184,59 @@ class AppSettings(BaseSettings):
             raise RuntimeError("COOKIE_SAMESITE must be one of: lax, strict, none.")
         return self
 
+    # Derived values are resolved on first access and cached, so a process
+    # only pays for the paths/hosts/secrets its code paths actually read.
+    @cached_property
+    def log_dir(self) -> str:
+        return _resolve_path(self.LOG_DIR, "logs")
+
+    @cached_property
+    def log_file_path(self) -> str:
+        return _resolve_path(self.LOG_FILE_PATH, os.path.join(self.log_dir, "app.log"))
+
+    @cached_property
+    def upload_root(self) -> str:
+        return _resolve_path(self.UPLOAD_ROOT, "storage")
+
+    @cached_property
+    def smtp_host(self) -> str:
+        return _normalize_smtp_host(self.SMTP_HOST)
+
+    @cached_property
+    def password_reset_secret(self) -> str:
+        return (
+            (self.PASSWORD_RESET_SECRET or "").strip()
+            or self.EMAIL_VERIFY_SECRET
+            or self.SECRET_KEY
+        )
+
+    @cached_property
+    def refresh_pepper(self) -> str:
+        return (self.REFRESH_PEPPER or "").strip() or self.SECRET_KEY
+
+    @cached_property
+    def refresh_legacy_hash_cutoff(self) -> datetime | None:
+        if self.REFRESH_LEGACY_HASH_SINCE is None:
+            return None
+        switched_at = datetime.combine(self.REFRESH_LEGACY_HASH_SINCE, time.min, tzinfo=timezone.utc)
+        return switched_at + timedelta(days=self.REFRESH_TOKEN_EXPIRE_DAYS)
+
     def validate_security(self) -> None:
         _assert_min_secret("SECRET_KEY", self.SECRET_KEY or "")
         _assert_min_secret("EMAIL_VERIFY_SECRET", self.EMAIL_VERIFY_SECRET or "")
-        _assert_min_secret("PASSWORD_RESET_SECRET", self.PASSWORD_RESET_SECRET or "")
+        _assert_min_secret("PASSWORD_RESET_SECRET", self.password_reset_secret)
+        _assert_min_secret("REFRESH_PEPPER", self.refresh_pepper)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    return AppSettings()
 
 
-settings = AppSettings()
+settings = get_settings()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MailConfig:
     MAIL_USERNAME: str
     MAIL_PASSWORD: str
@@ -197,7 +255,7 @@ mail_config = MailConfig(
     MAIL_PASSWORD=settings.SMTP_PASSWORD,
     MAIL_FROM=settings.EMAIL_FROM,
     MAIL_PORT=settings.SMTP_PORT,
-    MAIL_SERVER=settings.SMTP_HOST,
+    MAIL_SERVER=settings.smtp_host,
     MAIL_STARTTLS=settings.SMTP_USE_TLS,
     MAIL_SSL_TLS=settings.SMTP_USE_SSL,
     USE_CREDENTIALS=bool(settings.SMTP_USERNAME and settings.SMTP_PASSWORD),
@@ -206,5 +264,11 @@ mail_config = MailConfig(
 
 
 def _assert_min_secret(name: str, value: str, min_len: int = 32) -> None:
-    if not value or len(value.strip()) < min_len:
+    # The raw length bounds the stripped length, so short values fail without
+    # allocating; a stripped copy is only built when there is padding to trim.
+    if (
+        not value
+        or len(value) < min_len
+        or ((value[0].isspace() or value[-1].isspace()) and len(value.strip()) < min_len)
+    ):
         raise RuntimeError(f"{name} must be set and at least {min_len} characters long.")
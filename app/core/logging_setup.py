@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from app.core.config import settings
@@ -13,7 +15,7 @@ def configure_logging() -> None:
     if getattr(root_logger, "_techpulse_configured", False):
         return
 
-    log_file = Path(settings.LOG_FILE_PATH)
+    log_file = Path(settings.log_file_path)
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
     formatter = logging.Formatter(
@@ -32,7 +34,19 @@ def configure_logging() -> None:
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
 
+    # QueueHandler.prepare() still merges the message args (and renders any
+    # traceback) on the request thread; the listener thread applies the
+    # formatter below and does the locking and disk/console writes.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # The format never prints thread/process fields, so skip looking them up.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     root_logger.setLevel(settings.LOG_LEVEL)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(stream_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
     setattr(root_logger, "_techpulse_configured", True)
@@ -2,6 +2,9 @@ from jose import JWTError, jwt
 from datetime import datetime, timedelta, timezone
 import hashlib
 import secrets
+import threading
+import time
+from typing import NoReturn
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import Depends, HTTPException, status, Request
 
@@ -24,6 +27,11 @@ EXPECTED_PURPOSE = "email_verification"
 EXPECTED_RESET_PURPOSE = "password_reset"
 EXPECTED_ISSUER = "Tech_Pulse_Technologies"
 
+# Recently rejected access tokens (digest -> monotonic expiry). Scanners replay
+# the same bad token many times; a hit here answers 401 without verifying it.
+_bad_token_cache: dict[bytes, float] = {}
+_bad_token_lock = threading.Lock()
+
 
 # Create login token
 def create_login_token(data: dict, expires_delta: timedelta | None = None)->str:
@@ -66,28 +74,73 @@ def create_password_reset_token(user_id: int) -> str:
         "purpose": EXPECTED_RESET_PURPOSE,
         "iss": EXPECTED_ISSUER,
     }
-    return jwt.encode(payload, settings.PASSWORD_RESET_SECRET, algorithm=settings.ALGORITHM)
+    return jwt.encode(payload, settings.password_reset_secret, algorithm=settings.ALGORITHM)
 
 # Get the current user from the token sent to them in the header or cookie
+def _token_digest(token: str) -> bytes:
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16, usedforsecurity=False).digest()
+
+
+def _is_known_bad_token(digest: bytes) -> bool:
+    with _bad_token_lock:
+        expires_at = _bad_token_cache.get(digest)
+        if expires_at is None:
+            return False
+        if expires_at > time.monotonic():
+            return True
+        del _bad_token_cache[digest]
+        return False
+
+
+def _remember_bad_token(digest: bytes) -> None:
+    with _bad_token_lock:
+        if digest not in _bad_token_cache and len(_bad_token_cache) >= settings.AUTH_BAD_TOKEN_CACHE_MAX_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            del _bad_token_cache[next(iter(_bad_token_cache))]
+        _bad_token_cache[digest] = time.monotonic() + settings.AUTH_BAD_TOKEN_CACHE_TTL_SECONDS
+
+
+def _reject_bad_token(request: Request, digest: bytes) -> NoReturn:
+    _remember_bad_token(digest)
+    # Only fresh rejections count, so a stale cookie replayed by one browser
+    # stays in the cache while token-rotating scanners get throttled.
+    ip_address = request.client.host if request.client else "unknown"
+    limited, retry_after = abuse_protection.hit_rate_limit(
+        scope="bad_jwt",
+        key=ip_address,
+        limit=settings.AUTH_BAD_TOKEN_RATE_LIMIT,
+        window_seconds=settings.AUTH_BAD_TOKEN_WINDOW_SECONDS,
+    )
+    if limited:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests. Please try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+    raise credentials_exception
+
+
 def get_current_user(
         request: Request,
         token: str = Depends(oauth2_scheme),
 ):
+    if not token:
+        token = request.cookies.get(settings.ACCESS_COOKIE_NAME)
+    if not token:
+        raise credentials_exception
+    digest = _token_digest(token)
+    if _is_known_bad_token(digest):
+        raise credentials_exception
     try:
-        
-        if not token:
-            token = request.cookies.get(settings.ACCESS_COOKIE_NAME)
-        if not token:
-            raise credentials_exception
-        
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id = int(payload.get("sub"))
         role: str = str(payload.get("role"))
-        
-        if not user_id or not role:
-           raise credentials_exception
     except (JWTError, ValueError, TypeError):
-        raise credentials_exception
+        _reject_bad_token(request, digest)
+    if not user_id or not role:
+        _reject_bad_token(request, digest)
+    # Let the audit middleware attribute the request without decoding again.
+    request.state.audit_actor_user_id = user_id
     return {
         "user_id": user_id,
         "role": role
@@ -144,7 +197,7 @@ def get_password_reset_user(token: str):
     try:
         payload = jwt.decode(
             token,
-            settings.PASSWORD_RESET_SECRET,
+            settings.password_reset_secret,
             algorithms=[settings.ALGORITHM],
             options={"require": ["sub", "exp", "iat", "jti", "purpose", "iss"]},
         )
@@ -1,7 +1,10 @@
 from contextlib import contextmanager
-from typing import Iterator
+from functools import lru_cache
+from typing import Callable, Iterator, TypeVar
 
+from fastapi import Depends
 from sqlalchemy.orm import Session
+from app.database.db_setup import get_db
 from app.repositories.user import UserRepo
 from app.repositories.session import SessionRepo
 from app.repositories.chat_message import ChatMessageRepo
@@ -12,53 +15,31 @@ class UnitOfWork:
     """Unit of Work pattern implementation for managing database transactions.
     
     Provides centralized access to all repositories and manages transaction boundaries
-    (commit/rollback). Uses lazy-loading to instantiate repositories only when needed.
+    (commit/rollback). Repositories are thin wrappers over the session, so they are
+    built up front rather than behind lazy properties.
     Supports context manager protocol for automatic transaction handling.
     """
+    # One UnitOfWork is built per request; slots skip the instance __dict__.
+    __slots__ = (
+        "session",
+        "user_repo",
+        "session_repo",
+        "chat_message_repo",
+        "project_repo",
+        "resource_repo",
+    )
+
     def __init__(self, session: Session):
         """Initialize the UnitOfWork with a database session.
         Args:
             session: SQLAlchemy session object for database operations.
         """
         self.session = session
-        self._user_repo = None
-        self._session_repo = None
-        self._transcription_repo = None
-        self._chat_message_repo = None
-        self._project_repo = None
-        self._resource_repo = None
-
-
-    @property
-    def user_repo(self)-> UserRepo:
-        if self._user_repo is None:
-            self._user_repo = UserRepo(self.session)
-        return self._user_repo
-
-    @property
-    def session_repo(self) -> SessionRepo:
-        if self._session_repo is None:
-            self._session_repo = SessionRepo(self.session)
-        return self._session_repo
-
-    @property
-    def chat_message_repo(self) -> ChatMessageRepo:
-        if self._chat_message_repo is None:
-            self._chat_message_repo = ChatMessageRepo(self.session)
-        return self._chat_message_repo
-
-    @property
-    def project_repo(self) -> ProjectRepo:
-        if self._project_repo is None:
-            self._project_repo = ProjectRepo(self.session)
-        return self._project_repo
-
-    @property
-    def resource_repo(self) -> ResourceRepo:
-        if self._resource_repo is None:
-            self._resource_repo = ResourceRepo(self.session)
-        return self._resource_repo
-        
+        self.user_repo = UserRepo(session)
+        self.session_repo = SessionRepo(session)
+        self.chat_message_repo = ChatMessageRepo(session)
+        self.project_repo = ProjectRepo(session)
+        self.resource_repo = ResourceRepo(session)
 
     def commit(self) -> None:
         """Commit the current transaction to the database."""
@@ -99,3 +80,20 @@ class UnitOfWork:
         except Exception:
             self.rollback()
             raise
+
+
+ServiceT = TypeVar("ServiceT")
+
+
+@lru_cache(maxsize=None)
+def service_dep(service_cls: Callable[[UnitOfWork], ServiceT]) -> Callable[..., ServiceT]:
+    """Build the request dependency that wires ``service_cls`` to a fresh UnitOfWork.
+
+    Cached per class, so every ``Depends(service_dep(X))`` shares one callable
+    and FastAPI resolves it once per request.
+    """
+    def _dependency(db: Session = Depends(get_db)) -> ServiceT:
+        return service_cls(UnitOfWork(session=db))
+
+    _dependency.__name__ = f"get_{service_cls.__name__}"
+    return _dependency
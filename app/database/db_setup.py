@@ -1,24 +1,35 @@
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
 
 if not settings.DATABASE_URL:
     raise RuntimeError("DATABASE_URL is not set.")
 
-engine_kwargs = {"pool_pre_ping": True}
-if settings.DATABASE_URL and settings.DATABASE_URL.startswith("sqlite"):
-    engine_kwargs["connect_args"] = {"check_same_thread": False}
+if settings.DATABASE_URL.startswith("sqlite"):
+    # In-process database: there is no network connection to go stale, so
+    # the per-checkout SELECT 1 of pool_pre_ping is pure overhead.
+    engine_kwargs = {
+        "pool_pre_ping": False,
+        "connect_args": {"check_same_thread": False},
+    }
+    if ":memory:" in settings.DATABASE_URL or settings.DATABASE_URL.rstrip("/") == "sqlite:":
+        # An in-memory database only exists on its one connection.
+        engine_kwargs["poolclass"] = StaticPool
 else:
-    engine_kwargs.update(
-        {
-            "pool_size": settings.DB_POOL_SIZE,
-            "max_overflow": settings.DB_MAX_OVERFLOW,
-            "pool_timeout": settings.DB_POOL_TIMEOUT,
-            "pool_recycle": settings.DB_POOL_RECYCLE,
-        }
-    )
+    engine_kwargs = {
+        "pool_pre_ping": True,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if make_url(settings.DATABASE_URL).get_driver_name() == "psycopg2":
+        # INSERT executemany already becomes multi-row VALUES; this also
+        # pages executemany UPDATE/DELETE through execute_batch.
+        engine_kwargs["executemany_mode"] = "values_plus_batch"
 
 
 engine = create_engine(settings.DATABASE_URL, **engine_kwargs)
@@ -5,6 +5,10 @@ from pathlib import Path
 
 from alembic import command
 from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+from app.database.db_setup import engine
 
 from app.models import (  # noqa: F401
     audit_event,
@@ -18,13 +22,32 @@ from app.models import (  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
+_BACKEND_ROOT = Path(__file__).resolve().parents[2]
+_initialized = False
+
+
+def _alembic_config() -> Config:
+    config = Config(str(_BACKEND_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(_BACKEND_ROOT / "alembic"))
+    return config
+
+
 def init_db():
+    global _initialized
+    if _initialized:
+        return
     try:
-        backend_root = Path(__file__).resolve().parents[2]
-        alembic_ini_path = backend_root / "alembic.ini"
-        config = Config(str(alembic_ini_path))
-        config.set_main_option("script_location", str(backend_root / "alembic"))
-        command.upgrade(config, "head")
+        config = _alembic_config()
+        head_revisions = set(ScriptDirectory.from_config(config).get_heads())
+        with engine.connect() as connection:
+            current_revisions = set(MigrationContext.configure(connection).get_current_heads())
+        # A single alembic_version read decides whether anything is pending;
+        # only then pay for env.py, its logging fileConfig and the upgrade run.
+        if current_revisions != head_revisions:
+            command.upgrade(config, "head")
+        else:
+            logger.info("[startup] Database schema already at head %s", ", ".join(sorted(head_revisions)))
     except Exception as exc:
         logger.exception("[-] Failed to apply database migrations: %s", exc)
         raise
+    _initialized = True
@@ -1,5 +1,7 @@
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, Request, Response, status
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 
 from app.exceptions.exceptions import (
@@ -12,27 +14,50 @@ from app.exceptions.exceptions import (
 )
 
 
-def register_exception_handlers(app: FastAPI) -> None:
-    @app.exception_handler(NotFoundError)
-    async def _not_found_handler(_request: Request, exc: NotFoundError) -> JSONResponse:
-        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": str(exc)})
+_STATUS_MAP: dict[type[DomainError], int] = {
+    NotFoundError: status.HTTP_404_NOT_FOUND,
+    ConflictError: status.HTTP_409_CONFLICT,
+    ValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    PermissionError: status.HTTP_403_FORBIDDEN,
+    ExternalServiceError: status.HTTP_503_SERVICE_UNAVAILABLE,
+    DomainError: status.HTTP_400_BAD_REQUEST,
+}
+
+_JSON_MEDIA_TYPE = "application/json"
 
-    @app.exception_handler(ConflictError)
-    async def _conflict_handler(_request: Request, exc: ConflictError) -> JSONResponse:
-        return JSONResponse(status_code=status.HTTP_409_CONFLICT, content={"detail": str(exc)})
 
-    @app.exception_handler(ValidationError)
-    async def _validation_handler(_request: Request, exc: ValidationError) -> JSONResponse:
-        return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content={"detail": str(exc)})
+def _status_for(exc_type: type) -> int:
+    status_code = _STATUS_MAP.get(exc_type)
+    if status_code is None:
+        # Subclasses of the mapped errors resolve through their MRO once and
+        # are then memoized, so later raises are a single dict lookup.
+        status_code = next(
+            (_STATUS_MAP[base] for base in exc_type.__mro__ if base in _STATUS_MAP),
+            status.HTTP_400_BAD_REQUEST,
+        )
+        _STATUS_MAP[exc_type] = status_code
+    return status_code
 
-    @app.exception_handler(PermissionError)
-    async def _permission_handler(_request: Request, exc: PermissionError) -> JSONResponse:
-        return JSONResponse(status_code=status.HTTP_403_FORBIDDEN, content={"detail": str(exc)})
 
-    @app.exception_handler(ExternalServiceError)
-    async def _external_service_handler(_request: Request, exc: ExternalServiceError) -> JSONResponse:
-        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"detail": str(exc)})
+def _detail_response(detail, status_code: int, headers: dict[str, str] | None = None) -> Response:
+    # Error bodies are a single {"detail": ...} object: encode it with orjson
+    # and hand the bytes to a plain Response instead of a JSONResponse.
+    return Response(
+        orjson.dumps({"detail": detail}, default=str),
+        status_code=status_code,
+        headers=headers,
+        media_type=_JSON_MEDIA_TYPE,
+    )
 
+
+def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(DomainError)
-    async def _domain_handler(_request: Request, exc: DomainError) -> JSONResponse:
-        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+    async def _domain_handler(_request: Request, exc: DomainError) -> Response:
+        return _detail_response(str(exc), _status_for(type(exc)))
+
+    @app.exception_handler(StarletteHTTPException)
+    async def _http_exception_handler(_request: Request, exc: StarletteHTTPException) -> Response:
+        headers = getattr(exc, "headers", None)
+        if not is_body_allowed_for_status_code(exc.status_code):
+            return Response(status_code=exc.status_code, headers=headers)
+        return _detail_response(exc.detail, exc.status_code, headers)
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
@@ -13,6 +14,10 @@ from app.database.db_setup import SessionLocal
 from app.database.initialize_db import init_db
 from app.services.superuser_seeder import seed_superuser
 from app.services.email_service.verification_recovery import run_verification_recovery_loop
+from app.services.audit_queue import run_audit_flush_loop
+from app.services.download_counter import run_download_count_flush_loop
+from app.services.email_service.email_service import smtp_pool
+from app.services.email_service.email_worker import run_email_dispatch_loop
 from app.core.security import get_current_user
 from software_management.bootstrap import SMSBootstrapConfig, build_sms_module
 
@@ -32,19 +37,23 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Web Application Backend",
     description="This is a backend service for Tech pulse web application.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 sms_module = build_sms_module(
     config=SMSBootstrapConfig(
         database_url=settings.DATABASE_URL,
-        storage_root=Path(settings.UPLOAD_ROOT) / "software_management",
+        storage_root=Path(settings.upload_root) / "software_management",
         upload_chunk_size=settings.PACKAGE_UPLOAD_CHUNK_SIZE_BYTES,
+        download_chunk_size=settings.PACKAGE_DOWNLOAD_CHUNK_SIZE_BYTES,
         upload_max_size_bytes=settings.PACKAGE_UPLOAD_MAX_SIZE_BYTES,
         upload_rate_limit=settings.PACKAGE_UPLOAD_RATE_LIMIT,
         upload_rate_window_seconds=settings.PACKAGE_UPLOAD_RATE_WINDOW_SECONDS,
         download_rate_limit=settings.PACKAGE_DOWNLOAD_RATE_LIMIT,
         download_rate_window_seconds=settings.PACKAGE_DOWNLOAD_RATE_WINDOW_SECONDS,
+        admin_summary_cache_ttl_seconds=settings.PACKAGE_ADMIN_SUMMARY_CACHE_TTL_SECONDS,
+        download_count_flush_interval_seconds=settings.DOWNLOAD_COUNT_FLUSH_INTERVAL_SECONDS,
         pool_size=settings.DB_POOL_SIZE,
         max_overflow=settings.DB_MAX_OVERFLOW,
         pool_timeout=settings.DB_POOL_TIMEOUT,
@@ -92,6 +101,18 @@ async def startup():
           seed_superuser(db)
       finally:
           db.close()
+      app.state.audit_flush_stop_event = asyncio.Event()
+      app.state.audit_flush_task = asyncio.create_task(
+          run_audit_flush_loop(app.state.audit_flush_stop_event)
+      )
+      app.state.download_count_stop_event = asyncio.Event()
+      app.state.download_count_task = asyncio.create_task(
+          run_download_count_flush_loop(app.state.download_count_stop_event)
+      )
+      app.state.email_dispatch_stop_event = asyncio.Event()
+      app.state.email_dispatch_task = asyncio.create_task(
+          run_email_dispatch_loop(app.state.email_dispatch_stop_event)
+      )
       if settings.EMAIL_RECOVERY_ENABLED:
           app.state.email_recovery_stop_event = asyncio.Event()
           app.state.email_recovery_task = asyncio.create_task(
@@ -108,6 +129,22 @@ async def shutdown():
         stop_event.set()
         await recovery_task
         logging.info("[shutdown] Verification email recovery loop stopped.")
+    audit_stop_event = getattr(app.state, "audit_flush_stop_event", None)
+    audit_flush_task = getattr(app.state, "audit_flush_task", None)
+    if audit_stop_event and audit_flush_task:
+        audit_stop_event.set()
+        await audit_flush_task
+    download_count_stop_event = getattr(app.state, "download_count_stop_event", None)
+    download_count_task = getattr(app.state, "download_count_task", None)
+    if download_count_stop_event and download_count_task:
+        download_count_stop_event.set()
+        await download_count_task
+    email_stop_event = getattr(app.state, "email_dispatch_stop_event", None)
+    email_dispatch_task = getattr(app.state, "email_dispatch_task", None)
+    if email_stop_event and email_dispatch_task:
+        email_stop_event.set()
+        await email_dispatch_task
+    await smtp_pool.close()
     await sms_module.close()
      
 
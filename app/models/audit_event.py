@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Index, Integer, JSON, String, func
+from sqlalchemy import DateTime, Index, Integer, JSON, String, desc, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.db_setup import Base
@@ -12,7 +12,7 @@ class AuditEvent(Base):
     __tablename__ = "audit_events"
     __table_args__ = (
         Index("ix_audit_events_occurred_at", "occurred_at"),
-        Index("ix_audit_events_type_occurred", "event_type", "occurred_at"),
+        Index("ix_audit_events_event_type_occurred_at", "event_type", desc("occurred_at")),
         Index("ix_audit_events_actor_occurred", "actor_user_id", "occurred_at"),
         Index("ix_audit_events_ip_occurred", "ip_address", "occurred_at"),
     )
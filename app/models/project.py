@@ -15,7 +15,7 @@ class Project(Base):
         Index("ix_projects_is_public_id_desc", "is_public", "id"),
     )
 
-    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(150), nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=False)
@@ -11,7 +11,7 @@ from app.database.db_setup import Base
 class Resource(Base):
     __tablename__ = "resources"
 
-    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(150), nullable=False)
     slug: Mapped[str] = mapped_column(String(150), nullable=False, unique=True, index=True)
     type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
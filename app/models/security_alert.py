@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, Integer, String, Text, desc, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.db_setup import Base
@@ -13,7 +13,22 @@ class SecurityAlert(Base):
     __table_args__ = (
         Index("ix_security_alerts_created_at", "created_at"),
         Index("ix_security_alerts_rule_created", "rule_code", "created_at"),
-        Index("ix_security_alerts_ack_created", "acknowledged", "created_at"),
+        Index(
+            "ix_security_alerts_unack_created",
+            desc("created_at"),
+            postgresql_where=text("acknowledged = false"),
+            sqlite_where=text("acknowledged = 0"),
+        ),
+        # Dedup key for alert inserts; coalesced so alerts without an actor or
+        # ip still collide.
+        Index(
+            "uq_security_alerts_dedup",
+            "rule_code",
+            text("coalesce(actor_user_id, 0)"),
+            text("coalesce(ip_address, '')"),
+            "dedup_bucket",
+            unique=True,
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -27,6 +42,8 @@ class SecurityAlert(Base):
     acknowledged: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     acknowledged_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     acknowledged_by_user_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Epoch seconds // (ALERT_DEDUP_MINUTES * 60) at detection; NULL on older rows.
+    dedup_bucket: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
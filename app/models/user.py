@@ -1,6 +1,6 @@
 from __future__ import annotations
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import Index, String, func
+from sqlalchemy import Index, String, func, text
 from datetime import datetime
 
 from app.database.db_setup import Base
@@ -12,15 +12,18 @@ class User(Base):
 
      __tablename__ = "users"
      __table_args__ = (
+          # Only unverified users are ever scanned for retries, so the index
+          # holds just that working set, already in created_at order.
           Index(
-               "ix_users_verification_retry_lookup",
-               "status",
+               "ix_users_verification_pending",
                "created_at",
                "verification_email_next_retry_at",
+               postgresql_where=text("status <> 'VERIFIED'"),
+               sqlite_where=text("status <> 'VERIFIED'"),
           ),
      )
 
-     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, index=True)
+     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
      full_name: Mapped[str] = mapped_column(String(150), nullable=False)
      username: Mapped[str] = mapped_column(String(50), nullable=False, unique=True, index=True)
      email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
@@ -1,8 +1,17 @@
-from sqlalchemy import select
+from sqlalchemy import RowMapping, select
 from sqlalchemy.orm import Session
 
 from app.models.chat_message import ChatMessage
 
+_CHAT_MESSAGE_LIST_COLUMNS = (
+    ChatMessage.id,
+    ChatMessage.user_id,
+    ChatMessage.role,
+    ChatMessage.user_message,
+    ChatMessage.assistant_message,
+    ChatMessage.created_at,
+)
+
 
 class ChatMessageRepo:
     def __init__(self, db: Session):
@@ -11,15 +20,17 @@ class ChatMessageRepo:
     def add(self, message: ChatMessage) -> ChatMessage:
         self.db.add(message)
         self.db.flush()
-        self.db.refresh(message)
         return message
 
-    def list_for_user(self, user_id: int, limit: int = 25) -> list[ChatMessage]:
-        stmt = (
-            select(ChatMessage)
+    def list_for_user(self, user_id: int, limit: int = 25) -> list[RowMapping]:
+        # The newest `limit` rows, handed back oldest-first by the database.
+        latest = (
+            select(*_CHAT_MESSAGE_LIST_COLUMNS)
             .where(ChatMessage.user_id == user_id)
             .order_by(ChatMessage.created_at.desc())
             .limit(limit)
+            .subquery()
         )
-        return list(reversed(self.db.execute(stmt).scalars().all()))
+        stmt = select(latest).order_by(latest.c.created_at.asc())
+        return self.db.execute(stmt).mappings().all()
 
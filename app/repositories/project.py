@@ -1,10 +1,24 @@
 from typing import Optional
 
-from sqlalchemy import or_, select, update
+from sqlalchemy import RowMapping, select, union_all, update
 from sqlalchemy.orm import Session
 
 from app.models.project import Project
 
+# Columns exposed by ProjectRead; file_path and updated_at stay server-side.
+_PROJECT_LIST_COLUMNS = (
+    Project.id,
+    Project.user_id,
+    Project.name,
+    Project.description,
+    Project.version,
+    Project.file_name,
+    Project.file_size_bytes,
+    Project.download_count,
+    Project.is_public,
+    Project.created_at,
+)
+
 
 class ProjectRepo:
     def __init__(self, db: Session):
@@ -12,23 +26,31 @@ class ProjectRepo:
 
     def add(self, project: Project) -> Project:
         self.db.add(project)
+        # Mappers default to eager_defaults="auto": the INSERT's RETURNING
+        # clause hands back id/created_at, so no follow-up SELECT is needed.
         self.db.flush()
-        self.db.refresh(project)
         return project
 
     def get_by_id(self, project_id: int) -> Optional[Project]:
         return self.db.get(Project, project_id)
 
-    def list_visible_for_user(self, user_id: int, cursor: int | None = None, limit: int = 50) -> list[Project]:
-        stmt = (
-            select(Project)
-            .where(or_(Project.is_public.is_(True), Project.user_id == user_id))
-            .order_by(Project.id.desc())
-            .limit(limit)
-        )
-        if cursor is not None:
-            stmt = stmt.where(Project.id < cursor)
-        return self.db.execute(stmt).scalars().all()
+    def list_visible_for_user(self, user_id: int, cursor: int | None = None, limit: int = 50) -> list[RowMapping]:
+        # An OR across is_public/user_id cannot use either composite index on
+        # its own, so each half walks its own (x, id) index and the two
+        # disjoint pages are merged; the owner's public rows come from the
+        # public half.
+        def _page(*predicates):
+            stmt = select(*_PROJECT_LIST_COLUMNS).where(*predicates)
+            if cursor is not None:
+                stmt = stmt.where(Project.id < cursor)
+            return select(stmt.order_by(Project.id.desc()).limit(limit).subquery())
+
+        visible = union_all(
+            _page(Project.is_public.is_(True)),
+            _page(Project.user_id == user_id, Project.is_public.is_(False)),
+        ).subquery()
+        stmt = select(visible).order_by(visible.c.id.desc()).limit(limit)
+        return self.db.execute(stmt).mappings().all()
 
     def increment_download_count(self, project_id: int) -> None:
         stmt = (
@@ -1,10 +1,23 @@
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import RowMapping, bindparam, select
 from sqlalchemy.orm import Session
 
 from app.models.resource import Resource
 
+# Columns exposed by ResourceRead; list pages select only these.
+_RESOURCE_LIST_COLUMNS = (
+    Resource.id,
+    Resource.title,
+    Resource.slug,
+    Resource.type,
+    Resource.description,
+    Resource.url,
+    Resource.created_at,
+)
+
+_RESOURCE_BY_SLUG = select(Resource).where(Resource.slug == bindparam("slug"))
+
 
 class ResourceRepo:
     def __init__(self, db: Session):
@@ -13,18 +26,16 @@ class ResourceRepo:
     def add(self, resource: Resource) -> Resource:
         self.db.add(resource)
         self.db.flush()
-        self.db.refresh(resource)
         return resource
 
     def get_by_slug(self, slug: str) -> Optional[Resource]:
-        stmt = select(Resource).where(Resource.slug == slug)
-        return self.db.execute(stmt).scalar_one_or_none()
+        return self.db.execute(_RESOURCE_BY_SLUG, {"slug": slug}).scalar_one_or_none()
 
-    def list_resources(self, type_filter: str | None = None) -> list[Resource]:
-        stmt = select(Resource).order_by(Resource.created_at.desc())
+    def list_resources(self, type_filter: str | None = None) -> list[RowMapping]:
+        stmt = select(*_RESOURCE_LIST_COLUMNS).order_by(Resource.created_at.desc())
         if type_filter:
             stmt = stmt.where(Resource.type == type_filter)
-        return self.db.execute(stmt).scalars().all()
+        return self.db.execute(stmt).mappings().all()
 
     def delete(self, resource: Resource) -> None:
         self.db.delete(resource)
@@ -1,10 +1,13 @@
 from datetime import datetime
-from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, select, update
 
 from app.models.session import UserSession
 
+_SESSIONS_BY_REFRESH_HASHES = select(UserSession).where(
+    UserSession.refresh_token_hash.in_(bindparam("refresh_hashes", expanding=True))
+)
+
 
 class SessionRepo:
     def __init__(self, db: Session):
@@ -13,12 +16,14 @@ class SessionRepo:
     def add_session(self, session: UserSession) -> UserSession:
         self.db.add(session)
         self.db.flush()
-        self.db.refresh(session)
         return session
 
-    def get_by_refresh_hash(self, refresh_hash: str) -> Optional[UserSession]:
-        stmt = select(UserSession).where(UserSession.refresh_token_hash == refresh_hash)
-        return self.db.execute(stmt).scalar_one_or_none()
+    def get_by_refresh_hashes(self, refresh_hashes: list[bytes]) -> list[UserSession]:
+        return list(
+            self.db.execute(
+                _SESSIONS_BY_REFRESH_HASHES, {"refresh_hashes": refresh_hashes}
+            ).scalars()
+        )
 
     def revoke_session(self, session: UserSession, revoked_at: datetime) -> None:
         session.revoked_at = revoked_at
@@ -2,9 +2,26 @@ from app.models.user import User
 from app.models.enums import UserStatus
 from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, or_
+from sqlalchemy import Row, RowMapping, bindparam, select, or_
 from datetime import datetime
 
+# Columns exposed by UserRead; list pages select only these.
+_USER_LIST_COLUMNS = (
+    User.id,
+    User.full_name,
+    User.username,
+    User.email,
+    User.gender,
+    User.role,
+    User.created_at,
+)
+
+# Login/registration lookups: built once and reused with bound values, so a
+# request only pays for the (already cached) compile-key lookup.
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+
 class UserRepo:
     def __init__(self, db: Session):
         self.db = db
@@ -21,7 +38,6 @@ class UserRepo:
         """
         self.db.add(user)
         self.db.flush()
-        self.db.refresh(user)
         return user
     
     def get_user_by_id(self, id: int)->Optional[User]:
@@ -47,18 +63,16 @@ class UserRepo:
         :return: Return a matched user or none
         :rtype: User | None
         """
-        stmt = select(User).where(User.username == username)
-        return self.db.execute(stmt).scalar_one_or_none()
+        return self.db.execute(_USER_BY_USERNAME, {"username": username}).scalar_one_or_none()
     
     def get_user_by_email(self, email: str)-> Optional[User]:
-        stmt = select(User).where(User.email == email)
-        return self.db.execute(stmt).scalar_one_or_none()
+        return self.db.execute(_USER_BY_EMAIL, {"email": email}).scalar_one_or_none()
 
-    def list_users(self, cursor: int | None = None, limit: int = 100) -> list[User]:
-        stmt = select(User).order_by(User.id.desc()).limit(limit)
+    def list_users(self, cursor: int | None = None, limit: int = 100) -> list[RowMapping]:
+        stmt = select(*_USER_LIST_COLUMNS).order_by(User.id.desc()).limit(limit)
         if cursor is not None:
             stmt = stmt.where(User.id < cursor)
-        return self.db.execute(stmt).scalars().all()
+        return self.db.execute(stmt).mappings().all()
 
     def list_users_pending_verification_email_retry(
         self,
@@ -66,9 +80,10 @@ class UserRepo:
         created_before: datetime,
         max_retry_count: int,
         limit: int = 100,
-    ) -> list[User]:
+    ) -> list[Row]:
+        # Only what a resend needs; no User instances enter the session.
         stmt = (
-            select(User)
+            select(User.id, User.email, User.full_name, User.verification_email_retry_count)
             .where(User.status != UserStatus.VERIFIED)
             .where(User.created_at <= created_before)
             .where(User.verification_email_retry_count < max_retry_count)
@@ -81,4 +96,4 @@ class UserRepo:
             .order_by(User.created_at.asc())
             .limit(limit)
         )
-        return self.db.execute(stmt).scalars().all()
+        return self.db.execute(stmt).all()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.services.audit_service import log_http_audit_event, write_audit_batch
+
+logger = logging.getLogger(__name__)
+
+# Bounded queue drained by run_audit_flush_loop. It only exists while the loop
+# is running; producers fall back to a direct threaded write otherwise.
+_audit_queue: asyncio.Queue[dict] | None = None
+_audit_dropped_events = 0
+
+
+async def submit_http_audit_event(
+    *,
+    event_type: str,
+    actor_user_id: int | None,
+    method: str,
+    path: str,
+    status_code: int,
+    ip_address: str | None,
+    user_agent: str | None,
+    request_id: str | None,
+    metadata: dict | None = None,
+) -> None:
+    """Queue an audit row for the batch writer; must be called on the event loop."""
+    global _audit_dropped_events
+    queue = _audit_queue
+    if queue is None:
+        await asyncio.to_thread(
+            log_http_audit_event,
+            event_type=event_type,
+            actor_user_id=actor_user_id,
+            method=method,
+            path=path,
+            status_code=status_code,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            request_id=request_id,
+            metadata=metadata,
+        )
+        return
+
+    row = {
+        "event_type": event_type,
+        "actor_user_id": actor_user_id,
+        "method": method,
+        "path": path,
+        "status_code": status_code,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "request_id": request_id,
+        "metadata_json": metadata or {},
+    }
+    if queue.full():
+        # Shed the oldest row rather than block the response on the database.
+        queue.get_nowait()
+        _audit_dropped_events += 1
+        if _audit_dropped_events % 1000 == 1:
+            logger.warning("Audit queue full; %s event(s) dropped so far", _audit_dropped_events)
+    queue.put_nowait(row)
+
+
+async def _collect_audit_batch(queue: asyncio.Queue[dict]) -> list[dict]:
+    interval = settings.AUDIT_FLUSH_INTERVAL_SECONDS
+    try:
+        rows = [await asyncio.wait_for(queue.get(), timeout=interval)]
+    except asyncio.TimeoutError:
+        return []
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + interval
+    while len(rows) < settings.AUDIT_FLUSH_BATCH_SIZE:
+        if not queue.empty():
+            rows.append(queue.get_nowait())
+            continue
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            rows.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+        except asyncio.TimeoutError:
+            break
+    return rows
+
+
+async def run_audit_flush_loop(stop_event: asyncio.Event) -> None:
+    global _audit_queue
+    queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=settings.AUDIT_QUEUE_MAX_SIZE)
+    _audit_queue = queue
+    try:
+        while not stop_event.is_set():
+            rows = await _collect_audit_batch(queue)
+            if rows:
+                await asyncio.to_thread(write_audit_batch, rows)
+    finally:
+        _audit_queue = None
+        # Drain whatever was enqueued before shutdown.
+        while not queue.empty():
+            batch_size = min(queue.qsize(), settings.AUDIT_FLUSH_BATCH_SIZE)
+            rows = [queue.get_nowait() for _ in range(batch_size)]
+            await asyncio.to_thread(write_audit_batch, rows)
@@ -3,8 +3,11 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
+from app.core.abuse_protection import abuse_protection
 from app.core.config import settings
 from app.database.db_setup import SessionLocal
 from app.models.audit_event import AuditEvent
@@ -12,6 +15,8 @@ from app.models.security_alert import SecurityAlert
 
 logger = logging.getLogger(__name__)
 
+_ALERT_EVENT_TYPES = frozenset({"auth.login.failed", "auth.access.denied"})
+
 
 def log_http_audit_event(
     *,
@@ -40,7 +45,13 @@ def log_http_audit_event(
         )
         session.add(event)
         session.flush()
-        _detect_and_create_alerts(session=session, event=event)
+        _detect_and_create_alerts(
+            session=session,
+            event_id=event.id,
+            event_type=event.event_type,
+            actor_user_id=event.actor_user_id,
+            ip_address=event.ip_address,
+        )
         session.commit()
     except Exception as exc:
         session.rollback()
@@ -49,17 +60,57 @@ def log_http_audit_event(
         session.close()
 
 
-def _detect_and_create_alerts(*, session, event: AuditEvent) -> None:
+def write_audit_batch(rows: list[dict]) -> None:
+    session = SessionLocal()
+    try:
+        stmt = insert(AuditEvent).returning(AuditEvent.id, sort_by_parameter_order=True)
+        event_ids = session.execute(stmt, rows).scalars().all()
+        # Detection counts every row already inserted above, so one pass per
+        # (event type, actor, ip) group sees the same totals as one per row.
+        # The group's latest event is the one linked to a new alert.
+        groups: dict[tuple[str, int | None, str | None], tuple[int, int]] = {}
+        for row, event_id in zip(rows, event_ids):
+            if row["event_type"] in _ALERT_EVENT_TYPES:
+                group = (row["event_type"], row["actor_user_id"], row["ip_address"])
+                occurrences = groups[group][1] + 1 if group in groups else 1
+                groups[group] = (event_id, occurrences)
+        for (event_type, actor_user_id, ip_address), (event_id, occurrences) in groups.items():
+            _detect_and_create_alerts(
+                session=session,
+                event_id=event_id,
+                event_type=event_type,
+                actor_user_id=actor_user_id,
+                ip_address=ip_address,
+                occurrences=occurrences,
+            )
+        session.commit()
+    except Exception as exc:
+        session.rollback()
+        logger.exception("Failed to write %s queued audit event(s): %s", len(rows), exc)
+    finally:
+        session.close()
+
+
+def _detect_and_create_alerts(
+    *,
+    session,
+    event_id: int | None,
+    event_type: str,
+    actor_user_id: int | None,
+    ip_address: str | None,
+    occurrences: int = 1,
+) -> None:
     now = datetime.now(timezone.utc)
     lookback_from = now - timedelta(minutes=settings.ALERT_LOOKBACK_MINUTES)
-    dedup_from = now - timedelta(minutes=settings.ALERT_DEDUP_MINUTES)
+    dedup_bucket = int(now.timestamp()) // (settings.ALERT_DEDUP_MINUTES * 60)
 
-    if event.event_type == "auth.login.failed" and event.ip_address:
-        failures = _count_events(
+    if event_type == "auth.login.failed" and ip_address:
+        failures = _window_count(
             session=session,
             event_type="auth.login.failed",
-            ip_address=event.ip_address,
+            ip_address=ip_address,
             from_time=lookback_from,
+            occurrences=occurrences,
         )
         if failures >= settings.ALERT_LOGIN_FAILURE_THRESHOLD:
             _create_alert_if_needed(
@@ -68,22 +119,23 @@ def _detect_and_create_alerts(*, session, event: AuditEvent) -> None:
                 severity="high",
                 title="Possible brute force login attempts",
                 description=(
-                    f"{failures} failed login attempts from IP {event.ip_address} "
+                    f"{failures} failed login attempts from IP {ip_address} "
                     f"in the last {settings.ALERT_LOOKBACK_MINUTES} minute(s)."
                 ),
-                actor_user_id=event.actor_user_id,
-                ip_address=event.ip_address,
-                audit_event_id=event.id,
-                dedup_from=dedup_from,
+                actor_user_id=actor_user_id,
+                ip_address=ip_address,
+                audit_event_id=event_id,
+                dedup_bucket=dedup_bucket,
             )
 
-    if event.event_type == "auth.access.denied":
-        denied_count = _count_events(
+    if event_type == "auth.access.denied":
+        denied_count = _window_count(
             session=session,
             event_type="auth.access.denied",
-            actor_user_id=event.actor_user_id,
-            ip_address=event.ip_address,
+            actor_user_id=actor_user_id,
+            ip_address=ip_address,
             from_time=lookback_from,
+            occurrences=occurrences,
         )
         if denied_count >= settings.ALERT_ACCESS_DENIED_THRESHOLD:
             _create_alert_if_needed(
@@ -95,13 +147,44 @@ def _detect_and_create_alerts(*, session, event: AuditEvent) -> None:
                     f"{denied_count} forbidden requests detected in the last "
                     f"{settings.ALERT_LOOKBACK_MINUTES} minute(s)."
                 ),
-                actor_user_id=event.actor_user_id,
-                ip_address=event.ip_address,
-                audit_event_id=event.id,
-                dedup_from=dedup_from,
+                actor_user_id=actor_user_id,
+                ip_address=ip_address,
+                audit_event_id=event_id,
+                dedup_bucket=dedup_bucket,
             )
 
 
+def _window_count(
+    *,
+    session,
+    event_type: str,
+    from_time: datetime,
+    occurrences: int,
+    actor_user_id: int | None = None,
+    ip_address: str | None = None,
+) -> int:
+    # Redis minute buckets keep the COUNT off the database on the auth path.
+    # The key mirrors _count_events' predicates. Redis is not transactional,
+    # so events whose batch later rolls back stay counted; that can only make
+    # an alert fire early, never suppress one.
+    key = f"{event_type}|{actor_user_id if actor_user_id is not None else ''}|{ip_address or ''}"
+    total = abuse_protection.add_to_window(
+        scope="audit-window",
+        key=key,
+        amount=occurrences,
+        window_seconds=settings.ALERT_LOOKBACK_MINUTES * 60,
+    )
+    if total is not None:
+        return total
+    return _count_events(
+        session=session,
+        event_type=event_type,
+        from_time=from_time,
+        actor_user_id=actor_user_id,
+        ip_address=ip_address,
+    )
+
+
 def _count_events(
     *,
     session,
@@ -129,35 +212,26 @@ def _create_alert_if_needed(
     actor_user_id: int | None,
     ip_address: str | None,
     audit_event_id: int | None,
-    dedup_from: datetime,
+    dedup_bucket: int,
 ) -> None:
-    predicates = [
-        SecurityAlert.rule_code == rule_code,
-        SecurityAlert.acknowledged.is_(False),
-        SecurityAlert.created_at >= dedup_from,
-    ]
-    if actor_user_id is not None:
-        predicates.append(SecurityAlert.actor_user_id == actor_user_id)
-    else:
-        predicates.append(SecurityAlert.actor_user_id.is_(None))
-    if ip_address:
-        predicates.append(SecurityAlert.ip_address == ip_address)
-    else:
-        predicates.append(SecurityAlert.ip_address.is_(None))
-
-    exists_stmt = select(SecurityAlert.id).where(and_(*predicates)).limit(1)
-    existing = session.execute(exists_stmt).scalar_one_or_none()
-    if existing:
-        return
-
-    alert = SecurityAlert(
-        rule_code=rule_code,
-        severity=severity,
-        title=title,
-        description=description,
-        actor_user_id=actor_user_id,
-        ip_address=ip_address,
-        audit_event_id=audit_event_id,
+    # uq_security_alerts_dedup allows one alert per rule/actor/ip in each
+    # ALERT_DEDUP_MINUTES bucket, so DO NOTHING replaces the SELECT probe.
+    # The claim lives in the same transaction as the event, so a rollback
+    # releases it too.
+    insert_fn = pg_insert if session.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = (
+        insert_fn(SecurityAlert)
+        .values(
+            rule_code=rule_code,
+            severity=severity,
+            title=title,
+            description=description,
+            actor_user_id=actor_user_id,
+            ip_address=ip_address,
+            audit_event_id=audit_event_id,
+            dedup_bucket=dedup_bucket,
+        )
+        .on_conflict_do_nothing()
     )
-    session.add(alert)
-    logger.warning("Security alert generated: %s", rule_code)
+    if session.execute(stmt).rowcount:
+        logger.warning("Security alert generated: %s", rule_code)
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
 import hashlib
+import hmac
 import secrets
 import logging
 
@@ -17,12 +18,22 @@ from app.core.unit_of_work import UnitOfWork
 from app.exceptions.exceptions import ValidationError, DomainError, NotFoundError
 from app.models.enums import UserStatus
 from app.models.session import UserSession
-from app.services.email_service.email_worker import queue_verification_email
-from app.services.email_service.email_service import send_password_reset_email
+from app.services.email_service.email_worker import (
+    queue_password_reset_email,
+    queue_verification_email,
+)
 from app.core.config import settings
 
 from sqlalchemy.exc import SQLAlchemyError
 
+# BLAKE2b keys are capped at 64 bytes, so the pepper is condensed to 32.
+_REFRESH_HASH_KEY = hashlib.sha256(settings.refresh_pepper.encode("utf-8")).digest()
+# Key of the previous HMAC-SHA256 scheme. Sessions hashed with it, or with
+# the original unkeyed SHA-256, are still found until
+# settings.refresh_legacy_hash_cutoff and are rehashed on refresh.
+_LEGACY_REFRESH_HASH_KEY = settings.SECRET_KEY.encode("utf-8")
+
+
 class AuthService:
     def __init__(self, uow: UnitOfWork):
         self.uow = uow # Context manager
@@ -79,11 +90,10 @@ class AuthService:
     
 
     # Enqueue a verification email           
-    def enqueue_verification_email(self, background_tasks, payload) -> None:
+    def enqueue_verification_email(self, payload) -> None:
         try:
             token = create_email_verification_token(payload.id)
             queue_verification_email(
-                background_tasks=background_tasks,
                 token=token,
                 email=payload.email,
                 name=payload.full_name,
@@ -110,7 +120,7 @@ class AuthService:
         return refresh_token, session
 
     # 
-    def request_password_reset(self, email: str, background_tasks) -> str:
+    def request_password_reset(self, email: str) -> str:
         # Intentional generic response to avoid account enumeration.
         normalized_email = (email or "").strip().lower()
         if not normalized_email:
@@ -126,12 +136,7 @@ class AuthService:
             return "If the e-mail is registered, you will receive a reset link."
 
         token = create_password_reset_token(user.id)
-        background_tasks.add_task(
-            send_password_reset_email,
-            token,
-            user.email,
-            user.full_name,
-        )
+        queue_password_reset_email(token, user.email, user.full_name)
         return "If the e-mail is registered, you will receive a reset link."
 
     def reset_password(self, token: str, new_password: str, confirm_password: str) -> None:
@@ -153,10 +158,9 @@ class AuthService:
             )
 
     def rotate_session(self, refresh_token: str, user_agent: str | None, ip_address: str | None):
-        refresh_hash = self._hash_refresh_token(refresh_token)
         now = datetime.now(timezone.utc)
         with self.uow:
-            session = self.uow.session_repo.get_by_refresh_hash(refresh_hash)
+            session = self._find_session(refresh_token)
             expires_at = self._as_utc(session.expires_at) if session else None
             if not session or session.revoked_at or not expires_at or expires_at <= now:
                 raise ValidationError("Invalid or expired session")
@@ -177,17 +181,42 @@ class AuthService:
         access_token = create_login_token(data=payload)
         return user, access_token, new_refresh
 
-    def revoke_session(self, refresh_token: str) -> None:
-        refresh_hash = self._hash_refresh_token(refresh_token)
+    def revoke_session(self, refresh_token: str) -> int | None:
+        """Revokes the session and returns its user id, if one was found."""
         now = datetime.now(timezone.utc)
         with self.uow:
-            session = self.uow.session_repo.get_by_refresh_hash(refresh_hash)
+            session = self._find_session(refresh_token)
             if not session:
-                return
+                return None
+            user_id = session.user_id
             self.uow.session_repo.revoke_session(session=session, revoked_at=now)
-
-    def _hash_refresh_token(self, refresh_token: str) -> str:
-        return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+        return user_id
+
+    def _find_session(self, refresh_token: str) -> UserSession | None:
+        # One IN (...) lookup covers the current and grace-period digests, so
+        # a forged cookie costs a single round trip.
+        candidates = self._refresh_hash_candidates(refresh_token)
+        sessions = self.uow.session_repo.get_by_refresh_hashes(candidates)
+        by_hash = {bytes(session.refresh_token_hash): session for session in sessions}
+        return next((by_hash[digest] for digest in candidates if digest in by_hash), None)
+
+    def _refresh_hash_candidates(self, refresh_token: str) -> list[bytes]:
+        candidates = [self._hash_refresh_token(refresh_token)]
+        cutoff = settings.refresh_legacy_hash_cutoff
+        if cutoff is not None and datetime.now(timezone.utc) < cutoff:
+            token = refresh_token.encode("utf-8")
+            candidates.append(hmac.digest(_LEGACY_REFRESH_HASH_KEY, token, "sha256"))
+            # Pre-0016 rows: unkeyed SHA-256 hex, converted to raw bytes.
+            candidates.append(hashlib.sha256(token).digest())
+        return candidates
+
+    def _hash_refresh_token(self, refresh_token: str) -> bytes:
+        # Keyed so a leaked sessions table cannot be checked against guesses;
+        # the raw 32-byte digest keeps the unique index half the size of hex.
+        # Keyed BLAKE2b needs one pass where HMAC-SHA256 needs two.
+        return hashlib.blake2b(
+            refresh_token.encode("utf-8"), digest_size=32, key=_REFRESH_HASH_KEY
+        ).digest()
 
     @staticmethod
     def _as_utc(value: datetime | None) -> datetime | None:
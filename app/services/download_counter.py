@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+
+from sqlalchemy import bindparam, update
+
+from app.core.config import settings
+from app.database.db_setup import SessionLocal
+from app.models.project import Project
+
+logger = logging.getLogger(__name__)
+
+# Per-project download increments waiting for run_download_count_flush_loop.
+# Producers run in the sync threadpool, hence the lock rather than a queue.
+_pending_downloads: dict[int, int] = {}
+_pending_lock = threading.Lock()
+_buffering = False
+
+_projects = Project.__table__
+_ADD_DOWNLOADS_STMT = (
+    update(_projects)
+    .where(_projects.c.id == bindparam("project_id"))
+    .values(download_count=_projects.c.download_count + bindparam("delta"))
+)
+
+
+def record_project_download(project_id: int) -> bool:
+    """Buffer one download; returns False when no flush loop is running."""
+    with _pending_lock:
+        if not _buffering:
+            return False
+        _pending_downloads[project_id] = _pending_downloads.get(project_id, 0) + 1
+        return True
+
+
+def _take_pending() -> dict[int, int]:
+    global _pending_downloads
+    with _pending_lock:
+        pending, _pending_downloads = _pending_downloads, {}
+    return pending
+
+
+def _restore_pending(counts: dict[int, int]) -> None:
+    with _pending_lock:
+        for project_id, delta in counts.items():
+            _pending_downloads[project_id] = _pending_downloads.get(project_id, 0) + delta
+
+
+def _write_download_counts(counts: dict[int, int]) -> None:
+    session = SessionLocal()
+    try:
+        session.execute(
+            _ADD_DOWNLOADS_STMT,
+            [{"project_id": project_id, "delta": delta} for project_id, delta in counts.items()],
+        )
+        session.commit()
+    except Exception as exc:
+        session.rollback()
+        # Keep the counts for the next tick rather than losing them.
+        _restore_pending(counts)
+        logger.exception("Failed to flush %s project download counter(s): %s", len(counts), exc)
+    finally:
+        session.close()
+
+
+async def run_download_count_flush_loop(stop_event: asyncio.Event) -> None:
+    global _buffering
+    interval = settings.DOWNLOAD_COUNT_FLUSH_INTERVAL_SECONDS
+    if interval <= 0:
+        return
+    with _pending_lock:
+        _buffering = True
+    try:
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            counts = _take_pending()
+            if counts:
+                await asyncio.to_thread(_write_download_counts, counts)
+    finally:
+        with _pending_lock:
+            _buffering = False
+        counts = _take_pending()
+        if counts:
+            await asyncio.to_thread(_write_download_counts, counts)
@@ -0,0 +1,72 @@
+"""ARQ worker for outgoing email.
+
+Run with ``arq app.services.email_service.arq_tasks.WorkerSettings`` and set
+EMAIL_ARQ_ENABLED on the API so its queue_* helpers enqueue here.
+"""
+
+import asyncio
+import logging
+
+from arq import Retry
+from arq.connections import RedisSettings
+
+from app.core.config import settings
+from app.services.email_service.email_service import (
+    send_password_reset_email,
+    send_verification_email,
+    smtp_pool,
+)
+from app.services.email_service.email_worker import compute_retry_delay_seconds
+from app.services.email_service.verification_recovery import (
+    mark_verification_email_failed,
+    mark_verification_email_sent,
+)
+
+
+async def send_verification_email_task(
+    ctx: dict,
+    token: str,
+    email: str,
+    name: str,
+    user_id: int | None = None,
+) -> None:
+    attempt = ctx["job_try"]
+    try:
+        await send_verification_email(token=token, email=email, name=name)
+        if user_id is not None:
+            await asyncio.to_thread(mark_verification_email_sent, user_id=user_id)
+    except Exception as exc:
+        if user_id is not None:
+            await asyncio.to_thread(
+                mark_verification_email_failed,
+                user_id=user_id,
+                error_message=str(exc),
+                override_retry_count=attempt,
+            )
+        if attempt >= settings.EMAIL_RETRY_MAX_ATTEMPTS:
+            # Left to the recovery loop, which works from the users table.
+            logging.error(
+                "[-] Failed to send verification email to %s after %s attempts: %s",
+                email,
+                attempt,
+                exc,
+            )
+            return
+        # The job goes back to Redis; no worker slot is held during the wait.
+        raise Retry(defer=compute_retry_delay_seconds(attempt)) from exc
+
+
+async def send_password_reset_email_task(ctx: dict, token: str, email: str, name: str) -> None:
+    await send_password_reset_email(token=token, email=email, name=name)
+
+
+async def _on_shutdown(ctx: dict) -> None:
+    await smtp_pool.close()
+
+
+class WorkerSettings:
+    functions = [send_verification_email_task, send_password_reset_email_task]
+    on_shutdown = _on_shutdown
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
+    max_jobs = settings.EMAIL_SEND_CONCURRENCY
+    max_tries = settings.EMAIL_RETRY_MAX_ATTEMPTS
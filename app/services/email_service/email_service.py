@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from email.message import EmailMessage
 
@@ -8,9 +9,92 @@ from app.core.config import mail_config, settings
 
 
 env = Environment(loader=FileSystemLoader("app/services/email_service/templates"))
+# get_template compiles each template to Python once; render only runs it.
 template = env.get_template("verification_email.html")
 password_reset_template = env.get_template("password_reset_email.html")
 
+_VERIFICATION_LINK_PREFIX = f"{settings.BACKEND_URL}/api/v1/auth/verify-page?token="
+_PASSWORD_RESET_LINK_PREFIX = f"{settings.BACKEND_URL}/api/v1/auth/password-reset/page?token="
+
+
+class SMTPPool:
+    """Keeps authenticated SMTP connections open between sends.
+
+    At most ``size`` connections exist at once; extra senders wait for one to
+    be returned instead of paying for another TCP/TLS/AUTH handshake.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = max(1, size)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._idle: list[aiosmtplib.SMTP] = []
+
+    @staticmethod
+    async def _connect() -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=mail_config.MAIL_SERVER,
+            port=mail_config.MAIL_PORT,
+            start_tls=mail_config.MAIL_STARTTLS and not mail_config.MAIL_SSL_TLS,
+            use_tls=mail_config.MAIL_SSL_TLS,
+            username=mail_config.MAIL_USERNAME if mail_config.USE_CREDENTIALS else None,
+            password=mail_config.MAIL_PASSWORD if mail_config.USE_CREDENTIALS else None,
+            validate_certs=mail_config.VALIDATE_CERTS,
+        )
+        await client.connect()
+        return client
+
+    async def send(self, message: EmailMessage, recipients: list[str]) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is None or self._loop.is_closed():
+            # First send, or the bound loop (e.g. an inline asyncio.run send
+            # made before the dispatcher started) is gone: adopt this loop and
+            # forget connections whose transports died with the old one.
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self._size)
+            self._idle = []
+        elif loop is not self._loop:
+            # Pooled connections belong to another event loop (e.g. an inline
+            # send from a worker thread), so use a one-off connection.
+            client = await self._connect()
+            try:
+                await client.send_message(message, recipients=recipients)
+            finally:
+                client.close()
+            return
+        async with self._slots:
+            client = self._idle.pop() if self._idle else None
+            try:
+                if client is None or not client.is_connected:
+                    client = await self._connect()
+                    await client.send_message(message, recipients=recipients)
+                else:
+                    try:
+                        await client.send_message(message, recipients=recipients)
+                    except aiosmtplib.SMTPServerDisconnected:
+                        # The server closed the idle connection; redial once.
+                        client.close()
+                        client = await self._connect()
+                        await client.send_message(message, recipients=recipients)
+            except BaseException:
+                if client is not None:
+                    client.close()
+                raise
+            self._idle.append(client)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        self._loop, self._slots = None, None
+        for client in idle:
+            try:
+                await client.quit()
+            except aiosmtplib.SMTPException:
+                client.close()
+
+
+smtp_pool = SMTPPool(settings.SMTP_POOL_SIZE)
+
+
 async def _send_html_email(
     *,
     subject: str,
@@ -34,22 +118,12 @@ async def _send_html_email(
         message["Reply-To"] = ", ".join(reply_to)
     message.set_content(body, subtype="html")
 
-    await aiosmtplib.send(
-        message,
-        hostname=mail_config.MAIL_SERVER,
-        port=mail_config.MAIL_PORT,
-        start_tls=mail_config.MAIL_STARTTLS and not mail_config.MAIL_SSL_TLS,
-        use_tls=mail_config.MAIL_SSL_TLS,
-        username=mail_config.MAIL_USERNAME if mail_config.USE_CREDENTIALS else None,
-        password=mail_config.MAIL_PASSWORD if mail_config.USE_CREDENTIALS else None,
-        validate_certs=mail_config.VALIDATE_CERTS,
-        recipients=[*recipients, *cc, *bcc],
-    )
+    await smtp_pool.send(message, recipients=[*recipients, *cc, *bcc])
 
 
 # Send verification email
 async def send_verification_email(token: str, email: str, name: str):
-    verification_link = f"{settings.BACKEND_URL}/api/v1/auth/verify-page?token={token}"
+    verification_link = _VERIFICATION_LINK_PREFIX + token
     body = template.render(email=email, verification_link=verification_link, name=name)
 
     await _send_html_email(
@@ -64,7 +138,7 @@ async def send_verification_email(token: str, email: str, name: str):
 
 
 async def send_password_reset_email(token: str, email: str, name: str):
-    reset_link = f"{settings.BACKEND_URL}/api/v1/auth/password-reset/page?token={token}"
+    reset_link = _PASSWORD_RESET_LINK_PREFIX + token
     body = password_reset_template.render(email=email, password_reset_link=reset_link, name=name)
 
     await _send_html_email(
@@ -1,24 +1,113 @@
 import asyncio
 import logging
 import random
-from fastapi import BackgroundTasks
+from collections.abc import Awaitable, Callable
+
+from arq import ArqRedis, create_pool
+from arq.connections import RedisSettings
 
 from app.core.config import settings
-from app.services.email_service.email_service import send_verification_email
+from app.services.email_service.email_service import (
+    send_password_reset_email,
+    send_verification_email,
+)
 from app.services.email_service.verification_recovery import (
     mark_verification_email_failed,
     mark_verification_email_sent,
 )
 
+EmailJob = tuple[Callable[..., Awaitable[None]], tuple]
+
+_email_queue: asyncio.Queue[EmailJob] | None = None
+_email_loop: asyncio.AbstractEventLoop | None = None
+# Set when EMAIL_ARQ_ENABLED and Redis answered at startup; jobs then go to the
+# ARQ worker (app.services.email_service.arq_tasks) instead of this process.
+_arq_pool: ArqRedis | None = None
+
+
+def compute_retry_delay_seconds(
+    attempt: int,
+    base_delay_seconds: int = settings.EMAIL_RETRY_BASE_DELAY_SECONDS,
+    max_delay_seconds: int = settings.EMAIL_RETRY_MAX_DELAY_SECONDS,
+) -> float:
+    # Exponential backoff with full jitter
+    cap = min(max_delay_seconds, base_delay_seconds * (2 ** (attempt - 1)))
+    return random.uniform(0, cap)
+
+
+_pending_puts: set[asyncio.Task] = set()
+
+
+def _is_recoverable(job: EmailJob) -> bool:
+    # Unsent verification mails are picked up again by the recovery loop;
+    # nothing retries any other mail, so those must not be discarded.
+    return job[0] is _send_verification_email_with_retries
+
+
+async def _put_with_timeout(queue: asyncio.Queue[EmailJob], job: EmailJob) -> None:
+    try:
+        await asyncio.wait_for(queue.put(job), timeout=settings.EMAIL_QUEUE_PUT_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logging.error(
+            "[-] Email queue still full after %.1fs; dropped %s job.",
+            settings.EMAIL_QUEUE_PUT_TIMEOUT_SECONDS,
+            job[0].__name__,
+        )
+
+
+def _put_email_job(queue: asyncio.Queue[EmailJob], job: EmailJob) -> None:
+    try:
+        queue.put_nowait(job)
+    except asyncio.QueueFull:
+        if _is_recoverable(job):
+            logging.warning("[!] Email queue full; dropping %s job.", job[0].__name__)
+            return
+        task = asyncio.get_running_loop().create_task(_put_with_timeout(queue, job))
+        _pending_puts.add(task)
+        task.add_done_callback(_pending_puts.discard)
+
+
+async def _enqueue_arq_job(
+    pool: ArqRedis,
+    queue: asyncio.Queue[EmailJob],
+    task_name: str,
+    job: EmailJob,
+) -> None:
+    try:
+        await pool.enqueue_job(task_name, *job[1])
+    except Exception as exc:
+        logging.warning("[!] ARQ enqueue of %s failed, sending in-process: %s", task_name, exc)
+        _put_email_job(queue, job)
+
+
+def _submit_email_job(task_name: str, send: Callable[..., Awaitable[None]], *args) -> None:
+    # Routes are sync and run in the threadpool, so the job is handed to the
+    # dispatcher's loop instead of being awaited on the request path.
+    queue, loop, pool = _email_queue, _email_loop, _arq_pool
+    if queue is None or loop is None or loop.is_closed():
+        if _is_recoverable((send, args)):
+            logging.warning("[!] Email dispatcher not running; dropping %s job.", send.__name__)
+            return
+        logging.error("[-] Email dispatcher not running; sending %s inline.", send.__name__)
+        try:
+            asyncio.run(send(*args))
+        except Exception as exc:
+            logging.exception("[-] Inline email job %s failed: %s", send.__name__, exc)
+        return
+    if pool is not None:
+        asyncio.run_coroutine_threadsafe(_enqueue_arq_job(pool, queue, task_name, (send, args)), loop)
+        return
+    loop.call_soon_threadsafe(_put_email_job, queue, (send, args))
+
 
 def queue_verification_email(
-    background_tasks: BackgroundTasks,
     token: str,
     email: str,
     name: str,
     user_id: int | None = None,
 ) -> None:
-    background_tasks.add_task(
+    _submit_email_job(
+        "send_verification_email_task",
         _send_verification_email_with_retries,
         token,
         email,
@@ -27,6 +116,59 @@ def queue_verification_email(
     )
 
 
+def queue_password_reset_email(token: str, email: str, name: str) -> None:
+    _submit_email_job("send_password_reset_email_task", send_password_reset_email, token, email, name)
+
+
+async def _run_email_job(semaphore: asyncio.Semaphore, job: EmailJob) -> None:
+    send, args = job
+    try:
+        await send(*args)
+    except Exception as exc:
+        logging.exception("[-] Email job %s failed: %s", send.__name__, exc)
+    finally:
+        semaphore.release()
+
+
+async def _connect_arq_pool() -> ArqRedis | None:
+    if not settings.EMAIL_ARQ_ENABLED:
+        return None
+    try:
+        return await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+    except Exception as exc:
+        logging.warning("[!] ARQ unavailable, sending email in-process: %s", exc)
+        return None
+
+
+async def run_email_dispatch_loop(stop_event: asyncio.Event) -> None:
+    global _email_queue, _email_loop, _arq_pool
+    queue: asyncio.Queue[EmailJob] = asyncio.Queue(maxsize=settings.EMAIL_QUEUE_MAX_SIZE)
+    semaphore = asyncio.Semaphore(settings.EMAIL_SEND_CONCURRENCY)
+    in_flight: set[asyncio.Task] = set()
+    # Jobs submitted while ARQ connects are sent in-process.
+    _email_queue, _email_loop = queue, asyncio.get_running_loop()
+    pool = None
+    try:
+        pool = _arq_pool = await _connect_arq_pool()
+        while not stop_event.is_set() or not queue.empty():
+            try:
+                job = await asyncio.wait_for(queue.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                continue
+            # At most EMAIL_SEND_CONCURRENCY SMTP conversations run at once;
+            # further jobs wait in the queue rather than piling up tasks.
+            await semaphore.acquire()
+            task = asyncio.create_task(_run_email_job(semaphore, job))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+    finally:
+        _email_queue, _email_loop, _arq_pool = None, None, None
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        if pool is not None:
+            await pool.aclose()
+
+
 async def _send_verification_email_with_retries(
     token: str,
     email: str,
@@ -40,11 +182,12 @@ async def _send_verification_email_with_retries(
         try:
             await send_verification_email(token=token, email=email, name=name)
             if user_id is not None:
-                mark_verification_email_sent(user_id=user_id)
+                await asyncio.to_thread(mark_verification_email_sent, user_id=user_id)
             return
         except Exception as exc:
             if user_id is not None:
-                mark_verification_email_failed(
+                await asyncio.to_thread(
+                    mark_verification_email_failed,
                     user_id=user_id,
                     error_message=str(exc),
                     override_retry_count=attempt,
@@ -58,9 +201,7 @@ async def _send_verification_email_with_retries(
                 )
                 return
 
-            # Exponential backoff with full jitter
-            cap = min(max_delay_seconds, base_delay_seconds * (2 ** (attempt - 1)))
-            delay = random.uniform(0, cap)
+            delay = compute_retry_delay_seconds(attempt, base_delay_seconds, max_delay_seconds)
             logging.warning(
                 "[!] Email send attempt %s failed for %s. Retrying in %.1f seconds.",
                 attempt,
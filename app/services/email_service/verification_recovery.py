@@ -91,7 +91,6 @@ async def process_unverified_users_once() -> None:
                     "retry_count": user.verification_email_retry_count or 0,
                 }
                 for user in users
-                if user.status != UserStatus.VERIFIED
             ]
     finally:
         db.close()
@@ -99,29 +98,37 @@ async def process_unverified_users_once() -> None:
     if not candidates:
         return
 
-    for candidate in candidates:
-        token = create_email_verification_token(candidate["id"])
-        try:
-            await send_verification_email(
-                token=token,
-                email=candidate["email"],
-                name=candidate["full_name"],
-            )
-            mark_verification_email_sent(user_id=candidate["id"])
-        except Exception as exc:
-            retry_count = candidate["retry_count"] + 1
-            mark_verification_email_failed(
-                user_id=candidate["id"],
-                error_message=str(exc),
-                override_retry_count=retry_count,
-            )
-            logging.warning(
-                "[recovery] Verification resend failed for user_id=%s email=%s retry_count=%s: %s",
-                candidate["id"],
-                candidate["email"],
-                retry_count,
-                exc,
-            )
+    # SMTP round trips dominate, so up to EMAIL_RECOVERY_CONCURRENCY resends
+    # overlap; the per-user bookkeeping runs off the event loop.
+    semaphore = asyncio.Semaphore(settings.EMAIL_RECOVERY_CONCURRENCY)
+
+    async def _resend(candidate: dict[str, int | str]) -> None:
+        async with semaphore:
+            token = create_email_verification_token(candidate["id"])
+            try:
+                await send_verification_email(
+                    token=token,
+                    email=candidate["email"],
+                    name=candidate["full_name"],
+                )
+                await asyncio.to_thread(mark_verification_email_sent, user_id=candidate["id"])
+            except Exception as exc:
+                retry_count = candidate["retry_count"] + 1
+                await asyncio.to_thread(
+                    mark_verification_email_failed,
+                    user_id=candidate["id"],
+                    error_message=str(exc),
+                    override_retry_count=retry_count,
+                )
+                logging.warning(
+                    "[recovery] Verification resend failed for user_id=%s email=%s retry_count=%s: %s",
+                    candidate["id"],
+                    candidate["email"],
+                    retry_count,
+                    exc,
+                )
+
+    await asyncio.gather(*(_resend(candidate) for candidate in candidates))
     logging.info("[recovery] Processed %s verification email candidate(s).", len(candidates))
 
 
@@ -1,25 +1,55 @@
 from __future__ import annotations
 
 import logging
+import os
 import uuid
+from collections.abc import AsyncIterator
+from functools import lru_cache, partial
 from pathlib import Path
 
+import anyio
+from sqlalchemy import RowMapping
+
 from app.core.config import settings
 from app.core.unit_of_work import UnitOfWork
+from app.services.download_counter import record_project_download
 from app.exceptions.exceptions import NotFoundError, PermissionError, ValidationError
 from app.models.project import Project
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _projects_dir() -> Path:
+    # Resolved and created once per process instead of on every request.
+    path = Path(settings.upload_root) / "projects"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+# One descriptor per upload: the file is opened once and every chunk goes
+# straight to write(2) instead of through a per-write file-object hop.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+
+def _open_for_write(path: Path) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return os.open(path, _WRITE_FLAGS, 0o644)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
 class ProjectHubService:
     ALLOWED_EXTENSIONS = {".zip", ".tar", ".gz", ".rar", ".7z", ".exe", ".msi", ".deb", ".rpm"}
     MAX_FILE_SIZE = 1024 * 1024 * 200  # 200 MB
 
     def __init__(self, uow: UnitOfWork):
         self.uow = uow
-        self.projects_dir = Path(settings.UPLOAD_ROOT) / "projects"
-        self.projects_dir.mkdir(parents=True, exist_ok=True)
+        self.projects_dir = _projects_dir()
 
     def create_project(
         self,
@@ -32,37 +62,110 @@ class ProjectHubService:
         filename: str,
         content: bytes,
     ) -> Project:
-        cleaned_name = (name or "").strip()
-        cleaned_desc = (description or "").strip()
-        if not cleaned_name or not cleaned_desc:
-            raise ValidationError("Project name and description are required")
+        cleaned_name, cleaned_desc, suffix = self._validate_upload_metadata(
+            name=name, description=description, filename=filename
+        )
         if not content:
             raise ValidationError("Uploaded project file is empty")
         if len(content) > self.MAX_FILE_SIZE:
             raise ValidationError("Project file is too large")
 
+        file_path = self.projects_dir / f"{uuid.uuid4().hex}{suffix}"
+        file_path.write_bytes(content)
+        return self._persist_project(
+            user_id=user_id,
+            name=cleaned_name,
+            description=cleaned_desc,
+            version=version,
+            is_public=is_public,
+            filename=filename,
+            file_path=file_path,
+            size_bytes=len(content),
+        )
+
+    async def create_project_streaming(
+        self,
+        *,
+        user_id: int,
+        name: str,
+        description: str,
+        version: str | None,
+        is_public: bool,
+        filename: str,
+        chunk_stream: AsyncIterator[bytes],
+    ) -> Project:
+        cleaned_name, cleaned_desc, suffix = self._validate_upload_metadata(
+            name=name, description=description, filename=filename
+        )
+        file_path = self.projects_dir / f"{uuid.uuid4().hex}{suffix}"
+        size_bytes = 0
+        try:
+            # Directory creation and open(2) can block on slow disks, so both
+            # happen off the event loop like the chunk writes.
+            fd = await anyio.to_thread.run_sync(_open_for_write, file_path)
+            try:
+                async for chunk in chunk_stream:
+                    size_bytes += len(chunk)
+                    if size_bytes > self.MAX_FILE_SIZE:
+                        raise ValidationError("Project file is too large")
+                    await anyio.to_thread.run_sync(_write_all, fd, chunk)
+            finally:
+                os.close(fd)
+            if not size_bytes:
+                raise ValidationError("Uploaded project file is empty")
+            return await anyio.to_thread.run_sync(
+                partial(
+                    self._persist_project,
+                    user_id=user_id,
+                    name=cleaned_name,
+                    description=cleaned_desc,
+                    version=version,
+                    is_public=is_public,
+                    filename=filename,
+                    file_path=file_path,
+                    size_bytes=size_bytes,
+                )
+            )
+        except BaseException:
+            file_path.unlink(missing_ok=True)
+            raise
+
+    def _validate_upload_metadata(self, *, name: str, description: str, filename: str) -> tuple[str, str, str]:
+        cleaned_name = (name or "").strip()
+        cleaned_desc = (description or "").strip()
+        if not cleaned_name or not cleaned_desc:
+            raise ValidationError("Project name and description are required")
         suffix = Path(filename or "").suffix.lower()
         if suffix not in self.ALLOWED_EXTENSIONS:
             raise ValidationError("Unsupported project file format")
+        return cleaned_name, cleaned_desc, suffix
 
-        safe_filename = f"{uuid.uuid4().hex}{suffix}"
-        file_path = self.projects_dir / safe_filename
-        file_path.write_bytes(content)
-
+    def _persist_project(
+        self,
+        *,
+        user_id: int,
+        name: str,
+        description: str,
+        version: str | None,
+        is_public: bool,
+        filename: str,
+        file_path: Path,
+        size_bytes: int,
+    ) -> Project:
         project = Project(
             user_id=user_id,
-            name=cleaned_name,
-            description=cleaned_desc,
+            name=name,
+            description=description,
             version=(version or "").strip() or None,
             file_name=filename,
             file_path=str(file_path),
-            file_size_bytes=len(content),
+            file_size_bytes=size_bytes,
             is_public=is_public,
         )
         with self.uow:
             return self.uow.project_repo.add(project)
 
-    def list_projects(self, *, user_id: int, cursor: int | None = None, limit: int = 50) -> list[Project]:
+    def list_projects(self, *, user_id: int, cursor: int | None = None, limit: int = 50) -> list[RowMapping]:
         with self.uow.read_only():
             projects = self.uow.project_repo.list_visible_for_user(user_id=user_id, cursor=cursor, limit=limit)
             logger.debug(
@@ -81,14 +184,11 @@ class ProjectHubService:
             return project
 
     def register_download(self, *, user_id: int, project_id: int) -> Project:
-        with self.uow:
-            project = self.uow.project_repo.get_by_id(project_id)
-            if not project:
-                raise NotFoundError("Project not found")
-            if not project.is_public and project.user_id != user_id:
-                raise PermissionError("You do not have access to this project")
-            self.uow.project_repo.increment_download_count(project_id=project.id)
-            return project
+        project = self.get_project_for_user(user_id=user_id, project_id=project_id)
+        if not record_project_download(project.id):
+            with self.uow:
+                self.uow.project_repo.increment_download_count(project_id=project.id)
+        return project
 
     def delete_project(self, *, user_id: int, project_id: int) -> None:
         file_path: str | None = None
@@ -1,7 +1,15 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import RowMapping
+
 from app.core.unit_of_work import UnitOfWork
 from app.exceptions.exceptions import ConflictError, NotFoundError, ValidationError
 from app.models.resource import Resource
-from app.schemas.resource import ResourceCreate
+
+if TYPE_CHECKING:
+    from app.schemas.resource import ResourceCreate
 
 
 class ResourceService:
@@ -10,7 +18,7 @@ class ResourceService:
     def __init__(self, uow: UnitOfWork):
         self.uow = uow
 
-    def list_resources(self, type_filter: str | None = None) -> list[Resource]:
+    def list_resources(self, type_filter: str | None = None) -> list[RowMapping]:
         normalized = type_filter.strip().lower() if type_filter else None
         with self.uow:
             return self.uow.resource_repo.list_resources(type_filter=normalized)
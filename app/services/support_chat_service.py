@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import requests
+from sqlalchemy import RowMapping
 
 from app.core.config import settings
 from app.core.unit_of_work import UnitOfWork
@@ -37,7 +38,7 @@ class SupportChatService:
         with self.uow:
             return self.uow.chat_message_repo.add(chat_message)
 
-    def list_messages(self, *, user_id: int, limit: int = 25) -> list[ChatMessage]:
+    def list_messages(self, *, user_id: int, limit: int = 25) -> list[RowMapping]:
         with self.uow:
             return self.uow.chat_message_repo.list_for_user(user_id=user_id, limit=limit)
 
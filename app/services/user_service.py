@@ -1,14 +1,20 @@
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
-from app.schemas.user import UserCreate
 from app.exceptions.exceptions import ConflictError, NotFoundError
 from app.core.hashing import hash_password
 from app.models.user import User
 from app.core.unit_of_work import UnitOfWork
 from app.core.security import validate_password_strength
 
+from sqlalchemy import RowMapping
 from sqlalchemy.exc import IntegrityError
 
+if TYPE_CHECKING:
+    from app.schemas.user import UserCreate
+
 logger = logging.getLogger(__name__)
 
 class UserService:
@@ -47,7 +53,7 @@ class UserService:
             return user
 
     # List users
-    def list_users(self, cursor: int | None = None, limit: int = 100) -> list[User]:
+    def list_users(self, cursor: int | None = None, limit: int = 100) -> list[RowMapping]:
         with self.uow.read_only():
             users = self.uow.user_repo.list_users(cursor=cursor, limit=limit)
             logger.debug("Fetched users page", extra={"cursor": cursor, "limit": limit, "count": len(users)})
@@ -19,7 +19,14 @@ from .dtos import (
     UploadSoftwareOutput,
     VersionListItem,
 )
-from .errors import ApplicationError, ConflictError, ForbiddenError, NotFoundError, ValidationError
+from .errors import (
+    ApplicationError,
+    ConflictError,
+    ForbiddenError,
+    NotFoundError,
+    RangeNotSatisfiableError,
+    ValidationError,
+)
 from .interfaces import AccessControlService, SoftwareRepository, StorageService, VirusScannerService
 from .use_cases import (
     DeleteSoftware,
@@ -61,6 +68,7 @@ __all__ = [
     "PublishVersion",
     "PublishVersionInput",
     "PublishVersionOutput",
+    "RangeNotSatisfiableError",
     "RevokeVersion",
     "RevokeVersionInput",
     "RevokeVersionOutput",
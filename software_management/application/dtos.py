@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import AsyncIterator
 from uuid import UUID
 
@@ -103,6 +104,7 @@ class DownloadSoftwareInput:
     actor_id: str
     software_id: UUID
     version: str
+    byte_range: tuple[int | None, int | None] | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -114,7 +116,9 @@ class DownloadSoftwareOutput:
     content_type: str
     size_bytes: int
     file_hash: str
-    stream: AsyncIterator[bytes]
+    stream: AsyncIterator[bytes] | None
+    local_path: Path | None = None
+    content_range: tuple[int, int] | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -134,7 +138,7 @@ class DeleteSoftwareOutput:
 @dataclass(frozen=True, slots=True)
 class ListSoftwareInput:
     actor_id: str
-    offset: int = 0
+    cursor: UUID | None = None
     limit: int = 100
 
 
@@ -197,5 +201,5 @@ class AdminSoftwareItem:
 
 @dataclass(frozen=True, slots=True)
 class ListAdminSoftwareInput:
-    offset: int = 0
+    cursor: UUID | None = None
     limit: int = 100
@@ -17,3 +17,13 @@ class ForbiddenError(ApplicationError):
 class ValidationError(ApplicationError):
     pass
 
+
+class InvalidCursorError(ValidationError):
+    pass
+
+
+class RangeNotSatisfiableError(ApplicationError):
+    def __init__(self, size_bytes: int) -> None:
+        super().__init__("requested range not satisfiable")
+        self.size_bytes = size_bytes
+
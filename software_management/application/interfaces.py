@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import AsyncIterable, AsyncIterator, Protocol
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Mapping, Protocol
 from uuid import UUID
 
 from .dtos import StoredObject
@@ -151,6 +152,9 @@ class SoftwareRepository(Protocol):
     async def get_software_owner(self, software_id: UUID) -> str | None:
         ...
 
+    async def find_artifact_storage_key(self, file_hash: str) -> str | None:
+        ...
+
     async def create_version(self, command: CreateVersionCommand) -> CreateVersionResult:
         ...
 
@@ -189,6 +193,9 @@ class SoftwareRepository(Protocol):
     async def increment_download_count(self, version_id: UUID) -> None:
         ...
 
+    async def add_download_counts(self, counts: Mapping[UUID, int]) -> None:
+        ...
+
     async def delete_software(
         self,
         actor_id: str,
@@ -201,7 +208,7 @@ class SoftwareRepository(Protocol):
         self,
         actor_id: str,
         *,
-        offset: int = 0,
+        cursor: UUID | None = None,
         limit: int = 100,
     ) -> list[SoftwareListRecord]:
         ...
@@ -221,7 +228,7 @@ class SoftwareRepository(Protocol):
     async def list_admin_softwares(
         self,
         *,
-        offset: int = 0,
+        cursor: UUID | None = None,
         limit: int = 100,
     ) -> list[AdminSoftwareRecord]:
         ...
@@ -262,6 +269,12 @@ class StorageService(Protocol):
     ) -> AsyncIterator[bytes]:
         ...
 
+    async def local_path(self, storage_key: str) -> Path | None:
+        ...
+
+    async def link_duplicate(self, storage_key: str, existing_storage_key: str) -> bool:
+        ...
+
     async def delete(self, storage_key: str) -> None:
         ...
 
@@ -291,6 +304,11 @@ class VirusScannerService(Protocol):
         ...
 
 
+class DownloadCounter(Protocol):
+    async def record(self, version_id: UUID) -> None:
+        ...
+
+
 class EventPublisher(Protocol):
     async def publish(self, event: object) -> None:
         ...
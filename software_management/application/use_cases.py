@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import hashlib
 import json
+import time
 from uuid import UUID
 
 from software_management.domain.events import SoftwareDeleted, VersionPublished, VersionRevoked
@@ -30,10 +31,11 @@ from .dtos import (
     UploadSoftwareOutput,
     VersionListItem,
 )
-from .errors import ConflictError, NotFoundError, ValidationError
+from .errors import ConflictError, NotFoundError, RangeNotSatisfiableError, ValidationError
 from .interfaces import (
     AccessControlService,
     CreateVersionCommand,
+    DownloadCounter,
     EventPublisher,
     SoftwareRepository,
     StorageService,
@@ -83,6 +85,22 @@ def _validate_version(version: str) -> None:
         raise ValidationError(str(exc)) from exc
 
 
+def _resolve_byte_range(
+    byte_range: tuple[int | None, int | None],
+    size_bytes: int,
+) -> tuple[int, int]:
+    start, end = byte_range
+    if start is None:
+        # Suffix form "bytes=-N": the last N bytes of the artifact.
+        if not end or size_bytes <= 0:
+            raise RangeNotSatisfiableError(size_bytes)
+        return max(0, size_bytes - end), size_bytes - 1
+    if start >= size_bytes or (end is not None and end < start):
+        raise RangeNotSatisfiableError(size_bytes)
+    last = size_bytes - 1
+    return start, last if end is None else min(end, last)
+
+
 def _decode_upload_output(raw_json: str) -> UploadSoftwareOutput:
     data = json.loads(raw_json)
     return UploadSoftwareOutput(
@@ -206,6 +224,11 @@ class UploadSoftware:
             if expected_hash != stored_object.file_hash:
                 await self.storage.delete(stored_object.storage_key)
                 raise ValidationError("artifact hash mismatch")
+        existing_storage_key = await self.repository.find_artifact_storage_key(
+            stored_object.file_hash
+        )
+        if existing_storage_key is not None:
+            await self.storage.link_duplicate(stored_object.storage_key, existing_storage_key)
         command = CreateVersionCommand(
             actor_id=dto.actor_id,
             software_name=dto.software_name,
@@ -345,6 +368,7 @@ class DownloadSoftware:
     repository: SoftwareRepository
     storage: StorageService
     access_control: AccessControlService
+    download_counter: DownloadCounter
     chunk_size: int
 
     async def execute(self, dto: DownloadSoftwareInput) -> DownloadSoftwareOutput:
@@ -357,11 +381,24 @@ class DownloadSoftware:
             descriptor.owner_id,
             descriptor.published,
         )
-        stream = await self.storage.open_stream(
-            descriptor.storage_key,
-            chunk_size=self.chunk_size,
-        )
-        await self.repository.increment_download_count(descriptor.version_id)
+        content_range = None
+        stream = None
+        if dto.byte_range is not None:
+            content_range = _resolve_byte_range(dto.byte_range, descriptor.size_bytes)
+        # Storage backed by a local file lets the transport serve it directly;
+        # only fall back to a chunked Python stream when there is no path.
+        local_path = await self.storage.local_path(descriptor.storage_key)
+        if local_path is None:
+            start, end = content_range if content_range is not None else (0, None)
+            stream = await self.storage.open_stream(
+                descriptor.storage_key,
+                chunk_size=self.chunk_size,
+                start=start,
+                end=end,
+            )
+        # Resumed or segmented fetches only count once, on the leading range.
+        if content_range is None or content_range[0] == 0:
+            await self.download_counter.record(descriptor.version_id)
         return DownloadSoftwareOutput(
             software_id=descriptor.software_id,
             version_id=descriptor.version_id,
@@ -371,6 +408,8 @@ class DownloadSoftware:
             size_bytes=descriptor.size_bytes,
             file_hash=descriptor.file_hash,
             stream=stream,
+            local_path=local_path,
+            content_range=content_range,
         )
 
 
@@ -518,7 +557,7 @@ class ListSoftware:
     async def execute(self, dto: ListSoftwareInput) -> list[SoftwareListItem]:
         rows = await self.repository.list_softwares(
             dto.actor_id,
-            offset=dto.offset,
+            cursor=dto.cursor,
             limit=dto.limit,
         )
         return [
@@ -569,16 +608,27 @@ class ListVersions:
 @dataclass(slots=True)
 class GetAdminSummary:
     repository: SoftwareRepository
+    cache_ttl_seconds: float = 0.0
+    _cached: tuple[float, AdminSummaryOutput] | None = field(default=None, init=False, repr=False)
 
     async def execute(self) -> AdminSummaryOutput:
+        # The summary is four full-table aggregates; dashboard totals can be
+        # a minute stale, so one result is reused until the TTL lapses.
+        now = time.monotonic()
+        cached = self._cached
+        if cached is not None and cached[0] > now:
+            return cached[1]
         row = await self.repository.get_admin_summary()
-        return AdminSummaryOutput(
+        output = AdminSummaryOutput(
             total_packages=row.total_packages,
             private_packages=row.private_packages,
             public_packages=row.public_packages,
             total_versions=row.total_versions,
             total_downloads=row.total_downloads,
         )
+        if self.cache_ttl_seconds > 0:
+            self._cached = (now + self.cache_ttl_seconds, output)
+        return output
 
 
 @dataclass(slots=True)
@@ -586,7 +636,7 @@ class ListAdminSoftware:
     repository: SoftwareRepository
 
     async def execute(self, dto: ListAdminSoftwareInput) -> list[AdminSoftwareItem]:
-        rows = await self.repository.list_admin_softwares(offset=dto.offset, limit=dto.limit)
+        rows = await self.repository.list_admin_softwares(cursor=dto.cursor, limit=dto.limit)
         return [
             AdminSoftwareItem(
                 package_id=row.package_id,
@@ -24,6 +24,8 @@ from software_management.infrastructure import (
     AccessControlAdapter,
     AsyncDatabase,
     AsyncVirusScannerAdapter,
+    BufferPool,
+    BufferedDownloadCounter,
     DatabaseConfig,
     LocalAsyncStorageService,
     LocalStorageConfig,
@@ -49,11 +51,15 @@ class SMSBootstrapConfig:
     database_url: str
     storage_root: Path
     upload_chunk_size: int = 1024 * 1024
+    download_chunk_size: int = 4 * 1024 * 1024
     upload_max_size_bytes: int | None = None
+    max_concurrent_uploads: int = 32
     upload_rate_limit: int = 30
     upload_rate_window_seconds: int = 60
     download_rate_limit: int = 120
     download_rate_window_seconds: int = 60
+    admin_summary_cache_ttl_seconds: float = 60.0
+    download_count_flush_interval_seconds: float = 0.0
     pool_size: int = 20
     max_overflow: int = 40
     pool_timeout: int = 30
@@ -65,11 +71,14 @@ class SMSBootstrapConfig:
 class SMSModule:
     router: APIRouter
     database: AsyncDatabase
+    download_counter: BufferedDownloadCounter
 
     async def initialize(self) -> None:
         await self.database.verify_schema()
+        self.download_counter.start()
 
     async def close(self) -> None:
+        await self.download_counter.stop()
         await self.database.dispose()
 
 
@@ -121,11 +130,16 @@ def build_sms_module(
         access_control=access_control,
         event_publisher=publisher,
     )
+    download_counter = BufferedDownloadCounter(
+        repository,
+        flush_interval_seconds=config.download_count_flush_interval_seconds,
+    )
     download_software = DownloadSoftware(
         repository=repository,
         storage=storage,
         access_control=access_control,
-        chunk_size=config.upload_chunk_size,
+        download_counter=download_counter,
+        chunk_size=config.download_chunk_size,
     )
     delete_software = DeleteSoftware(
         repository=repository,
@@ -135,7 +149,10 @@ def build_sms_module(
     )
     list_software = ListSoftware(repository=repository)
     list_versions = ListVersions(repository=repository)
-    get_admin_summary = GetAdminSummary(repository=repository)
+    get_admin_summary = GetAdminSummary(
+        repository=repository,
+        cache_ttl_seconds=config.admin_summary_cache_ttl_seconds,
+    )
     list_admin_software = ListAdminSoftware(repository=repository)
     router = create_router(
         upload_software=upload_software,
@@ -149,11 +166,14 @@ def build_sms_module(
         get_admin_summary=get_admin_summary,
         list_admin_software=list_admin_software,
         current_actor_dependency=current_actor_dependency,
-        upload_chunk_size=config.upload_chunk_size,
-        upload_max_size_bytes=config.upload_max_size_bytes,
+        buffer_pool=BufferPool(
+            buffer_size=config.upload_chunk_size,
+            max_buffers=config.max_concurrent_uploads * 2,
+        ),
+        download_chunk_size=config.download_chunk_size,
         upload_rate_limit=config.upload_rate_limit,
         upload_rate_window_seconds=config.upload_rate_window_seconds,
         download_rate_limit=config.download_rate_limit,
         download_rate_window_seconds=config.download_rate_window_seconds,
     )
-    return SMSModule(router=router, database=database)
+    return SMSModule(router=router, database=database, download_counter=download_counter)
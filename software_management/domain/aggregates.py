@@ -21,9 +21,9 @@ class Software:
     versions: dict[str, Version] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        if not self.owner_id.strip():
+        if not self.owner_id or self.owner_id.isspace():
             raise ValueError("owner id is required")
-        if not self.name.strip():
+        if not self.name or self.name.isspace():
             raise ValueError("software name is required")
         if self.row_version < 1:
             raise ValueError("row_version must be >= 1")
@@ -18,9 +18,10 @@ class Artifact:
     created_at: datetime
 
     def __post_init__(self) -> None:
-        if not self.storage_key.strip():
+        # isspace() covers the blank case without allocating a stripped copy.
+        if not self.storage_key or self.storage_key.isspace():
             raise ValueError("storage key is required")
-        if not self.file_name.strip():
+        if not self.file_name or self.file_name.isspace():
             raise ValueError("file name is required")
         if self.size_bytes <= 0:
             raise ValueError("artifact size must be positive")
@@ -5,14 +5,16 @@ from enum import Enum
 from dataclasses import dataclass
 
 
+# Applied with fullmatch: "$" in a match() pattern would let a trailing
+# newline through.
 _SEMVER_RE = re.compile(
-    r"^(0|[1-9]\d*)\."
+    r"(0|[1-9]\d*)\."
     r"(0|[1-9]\d*)\."
     r"(0|[1-9]\d*)"
     r"(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?"
-    r"(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$"
+    r"(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?"
 )
-_SHA256_RE = re.compile(r"^[a-f0-9]{64}$")
+_SHA256_RE = re.compile(r"[a-f0-9]{64}")
 
 
 class VersionStatus(str, Enum):
@@ -31,7 +33,7 @@ class VersionNumber:
     value: str
 
     def __post_init__(self) -> None:
-        if not _SEMVER_RE.match(self.value):
+        if not _SEMVER_RE.fullmatch(self.value):
             raise ValueError("version must follow semantic versioning (e.g. 1.2.3)")
 
 
@@ -40,7 +42,11 @@ class FileHash:
     value: str
 
     def __post_init__(self) -> None:
+        # Digests produced by storage are already canonical; only normalize
+        # (and allocate) for client-supplied values that are not.
+        if _SHA256_RE.fullmatch(self.value):
+            return
         normalized = self.value.strip().lower()
-        if not _SHA256_RE.match(normalized):
+        if not _SHA256_RE.fullmatch(normalized):
             raise ValueError("file hash must be a valid sha256 hex digest")
         object.__setattr__(self, "value", normalized)
@@ -1,5 +1,7 @@
 from .access_control import AccessControlAdapter
+from .buffer_pool import BufferPool
 from .db import AsyncDatabase, DatabaseConfig
+from .download_counter import BufferedDownloadCounter
 from .event_publisher import NoOpEventPublisher
 from .repository import SQLAlchemySoftwareRepository
 from .storage import LocalAsyncStorageService, LocalStorageConfig
@@ -9,6 +11,8 @@ __all__ = [
     "AccessControlAdapter",
     "AsyncDatabase",
     "AsyncVirusScannerAdapter",
+    "BufferPool",
+    "BufferedDownloadCounter",
     "DatabaseConfig",
     "LocalAsyncStorageService",
     "LocalStorageConfig",
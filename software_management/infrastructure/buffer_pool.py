@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+
+class BufferPool:
+    """Bounded pool of fixed-size ``bytearray`` slabs reused across upload streams."""
+
+    def __init__(self, *, buffer_size: int, max_buffers: int) -> None:
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be positive")
+        self._buffer_size = buffer_size
+        self._max_buffers = max(0, max_buffers)
+        self._free: deque[bytearray] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def buffer_size(self) -> int:
+        return self._buffer_size
+
+    def acquire(self) -> bytearray:
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return bytearray(self._buffer_size)
+
+    def release(self, buffer: bytearray) -> None:
+        if len(buffer) != self._buffer_size:
+            return
+        with self._lock:
+            if len(self._free) < self._max_buffers:
+                self._free.append(buffer)
@@ -33,12 +33,14 @@ class DatabaseConfig:
 class AsyncDatabase:
     def __init__(self, config: DatabaseConfig) -> None:
         normalized_url = normalize_async_database_url(config.database_url)
+        is_sqlite = normalized_url.startswith("sqlite+aiosqlite://")
         engine_kwargs = {
-            "pool_pre_ping": True,
+            # Pre-ping only pays off for networked databases.
+            "pool_pre_ping": not is_sqlite,
             "pool_recycle": config.pool_recycle,
             "echo": config.echo,
         }
-        if not normalized_url.startswith("sqlite+aiosqlite://"):
+        if not is_sqlite:
             engine_kwargs.update(
                 {
                     "pool_size": config.pool_size,
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from uuid import UUID
+
+from software_management.application.interfaces import SoftwareRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedDownloadCounter:
+    """Coalesces download increments in memory and flushes them as ``+N`` updates.
+
+    With a non-positive ``flush_interval_seconds`` every download is written
+    through to the repository immediately.
+    """
+
+    def __init__(self, repository: SoftwareRepository, *, flush_interval_seconds: float) -> None:
+        self._repository = repository
+        self._flush_interval_seconds = flush_interval_seconds
+        self._pending: dict[UUID, int] = {}
+        self._stop_event: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def record(self, version_id: UUID) -> None:
+        if self._task is None:
+            await self._repository.increment_download_count(version_id)
+            return
+        self._pending[version_id] = self._pending.get(version_id, 0) + 1
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        try:
+            await self._repository.add_download_counts(pending)
+        except Exception:
+            # Keep the counts for the next tick rather than losing them.
+            for version_id, delta in pending.items():
+                self._pending[version_id] = self._pending.get(version_id, 0) + delta
+            logger.exception("Failed to flush %s download counter(s)", len(pending))
+
+    def start(self) -> None:
+        if self._flush_interval_seconds <= 0 or self._task is not None:
+            return
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run(self._stop_event))
+
+    async def stop(self) -> None:
+        task, stop_event = self._task, self._stop_event
+        if task is None or stop_event is None:
+            return
+        stop_event.set()
+        await task
+        self._task = None
+        self._stop_event = None
+        await self.flush()
+
+    async def _run(self, stop_event: asyncio.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self._flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
@@ -10,10 +10,13 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
+    TypeDecorator,
     UniqueConstraint,
     Uuid,
+    desc,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -26,12 +29,33 @@ class SMSBase(DeclarativeBase):
     pass
 
 
+class Sha256Digest(TypeDecorator):
+    """Raw 32-byte SHA-256 column that reads and writes lowercase hex strings."""
+
+    impl = LargeBinary(32)
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect) -> bytes | None:
+        return None if value is None else bytes.fromhex(value)
+
+    def process_result_value(self, value: bytes | None, dialect) -> str | None:
+        return None if value is None else value.hex()
+
+
 class SoftwareModel(SMSBase):
     __tablename__ = "sms_softwares"
     __table_args__ = (
         UniqueConstraint("owner_id", "name", name="uq_sms_software_owner_name"),
         Index("ix_sms_softwares_created_at", "created_at"),
         Index("ix_sms_softwares_current_version_id", "current_version_id"),
+        # Keyset order plus the listing payload, so admin pages on Postgres
+        # are answered by an index-only scan.
+        Index(
+            "ix_sms_softwares_updated_cover",
+            desc("updated_at"),
+            desc("id"),
+            postgresql_include=["owner_id", "name", "is_public", "created_at"],
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
@@ -66,7 +90,7 @@ class ArtifactModel(SMSBase):
     storage_key: Mapped[str] = mapped_column(String(512), nullable=False, unique=True)
     file_name: Mapped[str] = mapped_column(String(255), nullable=False)
     content_type: Mapped[str] = mapped_column(String(255), nullable=False, default="application/octet-stream")
-    file_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    file_hash: Mapped[str] = mapped_column(Sha256Digest, nullable=False, index=True)
     size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utc_now)
 
@@ -78,12 +102,16 @@ class VersionModel(SMSBase):
     __table_args__ = (
         UniqueConstraint("software_id", "version", name="uq_sms_versions_software_version"),
         Index("ix_sms_versions_created_at", "created_at"),
+        # Serves software_id lookups and the newest-first version listing
+        # without a sort node.
+        Index("ix_sms_versions_software_created", "software_id", desc("created_at")),
         Index("ix_sms_versions_software_id_version", "software_id", "version"),
         Index("ix_sms_versions_status", "status"),
         CheckConstraint(
             "status IN ('DRAFT', 'PUBLISHED', 'DEPRECATED', 'REVOKED')",
             name="ck_sms_versions_status",
         ),
+        CheckConstraint("download_count >= 0", name="ck_sms_versions_download_count"),
     )
 
     id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
@@ -91,7 +119,6 @@ class VersionModel(SMSBase):
         Uuid(as_uuid=True),
         ForeignKey("sms_softwares.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     artifact_id: Mapped[UUID] = mapped_column(
         Uuid(as_uuid=True),
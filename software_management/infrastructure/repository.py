@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import bindparam, delete, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import raiseload
 
-from software_management.application.errors import ConflictError, ForbiddenError, NotFoundError
+from software_management.application.errors import (
+    ConflictError,
+    ForbiddenError,
+    InvalidCursorError,
+    NotFoundError,
+)
 from software_management.application.interfaces import (
     AdminSoftwareRecord,
     AdminSummaryRecord,
@@ -37,6 +46,25 @@ _STATUS_DEPRECATED = "DEPRECATED"
 _STATUS_REVOKED = "REVOKED"
 
 
+def _after_cursor(cursor: UUID):
+    # Keyset on (updated_at, id) descending: rows strictly after the cursor row,
+    # served by ix_sms_softwares_updated_cover instead of an OFFSET scan.
+    # A row-value comparison is a single index bound, where the equivalent
+    # OR/AND expansion leaves Postgres filtering rows past the first key.
+    cursor_updated_at = (
+        select(SoftwareModel.updated_at).where(SoftwareModel.id == cursor).scalar_subquery()
+    )
+    return tuple_(SoftwareModel.updated_at, SoftwareModel.id) < tuple_(cursor_updated_at, cursor)
+
+
+async def _ensure_cursor_exists(session, cursor: UUID) -> None:
+    # A deleted cursor row makes the keyset bound NULL, which matches nothing;
+    # without this an empty page would read as the end of the listing.
+    found = await session.execute(select(SoftwareModel.id).where(SoftwareModel.id == cursor))
+    if found.scalar_one_or_none() is None:
+        raise InvalidCursorError("unknown cursor")
+
+
 class SQLAlchemySoftwareRepository(SoftwareRepository):
     def __init__(self, sessionmaker: async_sessionmaker) -> None:
         self._sessionmaker = sessionmaker
@@ -46,6 +74,15 @@ class SQLAlchemySoftwareRepository(SoftwareRepository):
             owner_stmt = select(SoftwareModel.owner_id).where(SoftwareModel.id == software_id)
             return (await session.execute(owner_stmt)).scalar_one_or_none()
 
+    async def find_artifact_storage_key(self, file_hash: str) -> str | None:
+        async with self._sessionmaker() as session:
+            stmt = (
+                select(ArtifactModel.storage_key)
+                .where(ArtifactModel.file_hash == file_hash)
+                .limit(1)
+            )
+            return (await session.execute(stmt)).scalar_one_or_none()
+
     async def create_version(self, command: CreateVersionCommand) -> CreateVersionResult:
         now = _utc_now()
         try:
@@ -288,12 +325,29 @@ class SQLAlchemySoftwareRepository(SoftwareRepository):
     async def increment_download_count(self, version_id: UUID) -> None:
         async with self._sessionmaker() as session:
             async with session.begin():
-                stmt = select(VersionModel).where(VersionModel.id == version_id).with_for_update()
-                version_row = (await session.execute(stmt)).scalar_one_or_none()
-                if version_row is None:
+                # Single atomic "+1" instead of a locked read-modify-write.
+                stmt = (
+                    update(VersionModel)
+                    .where(VersionModel.id == version_id)
+                    .values(download_count=VersionModel.download_count + 1)
+                    .returning(VersionModel.id)
+                    .execution_options(synchronize_session=False)
+                )
+                if (await session.execute(stmt)).scalar_one_or_none() is None:
                     raise NotFoundError("software version not found")
-                version_row.download_count += 1
-                await session.flush()
+
+    async def add_download_counts(self, counts: Mapping[UUID, int]) -> None:
+        # One executemany of "+delta" updates for a whole flush window.
+        versions = VersionModel.__table__
+        stmt = (
+            update(versions)
+            .where(versions.c.id == bindparam("version_id"))
+            .values(download_count=versions.c.download_count + bindparam("delta"))
+        )
+        params = [{"version_id": version_id, "delta": delta} for version_id, delta in counts.items()]
+        async with self._sessionmaker() as session:
+            async with session.begin():
+                await session.execute(stmt, params)
 
     async def delete_software(
         self,
@@ -318,15 +372,25 @@ class SQLAlchemySoftwareRepository(SoftwareRepository):
                     raise ConflictError("software version conflict")
 
                 rows_stmt = (
-                    select(VersionModel, ArtifactModel)
-                    .join(ArtifactModel, ArtifactModel.id == VersionModel.artifact_id)
+                    select(ArtifactModel.id, ArtifactModel.storage_key)
+                    .join(VersionModel, VersionModel.artifact_id == ArtifactModel.id)
                     .where(VersionModel.software_id == software_id)
                 )
                 rows = (await session.execute(rows_stmt)).all()
-                storage_keys = tuple(dict.fromkeys(artifact.storage_key for _, artifact in rows))
-                for version_row, artifact in rows:
-                    await session.delete(version_row)
-                    await session.delete(artifact)
+                storage_keys = tuple(dict.fromkeys(row.storage_key for row in rows))
+                # Set-based deletes: two statements however many versions the
+                # software has, instead of one DELETE per loaded row.
+                if rows:
+                    await session.execute(
+                        delete(VersionModel)
+                        .where(VersionModel.software_id == software_id)
+                        .execution_options(synchronize_session=False)
+                    )
+                    await session.execute(
+                        delete(ArtifactModel)
+                        .where(ArtifactModel.id.in_([row.id for row in rows]))
+                        .execution_options(synchronize_session=False)
+                    )
                 await session.delete(software)
                 return DeleteSoftwareResult(
                     software_id=software_id,
@@ -335,11 +399,14 @@ class SQLAlchemySoftwareRepository(SoftwareRepository):
                     storage_keys=storage_keys,
                 )
 
+    # The list queries join everything they map into records up front; raiseload
+    # turns any relationship access that would lazy-load per row into an error
+    # instead of a silent N+1.
     async def list_softwares(
         self,
         actor_id: str,
         *,
-        offset: int = 0,
+        cursor: UUID | None = None,
         limit: int = 100,
     ) -> list[SoftwareListRecord]:
         latest_subq = (
@@ -359,12 +426,16 @@ class SQLAlchemySoftwareRepository(SoftwareRepository):
                 & (VersionModel.created_at == latest_subq.c.max_created_at),
             )
             .where(or_(SoftwareModel.is_public.is_(True), SoftwareModel.owner_id == actor_id))
-            .order_by(SoftwareModel.updated_at.desc())
-            .offset(offset)
+            .order_by(SoftwareModel.updated_at.desc(), SoftwareModel.id.desc())
             .limit(limit)
+            .options(raiseload("*"))
         )
+        if cursor is not None:
+            stmt = stmt.where(_after_cursor(cursor))
         async with self._sessionmaker() as session:
             rows = (await session.execute(stmt)).all()
+            if not rows and cursor is not None:
+                await _ensure_cursor_exists(session, cursor)
         return [
             SoftwareListRecord(
                 id=software.id,
@@ -388,21 +459,35 @@ class SQLAlchemySoftwareRepository(SoftwareRepository):
         *,
         limit: int = 20,
     ) -> list[VersionListRecord]:
-        async with self._sessionmaker() as session:
-            software = (await session.execute(select(SoftwareModel).where(SoftwareModel.id == software_id))).scalar_one_or_none()
-            if software is None:
-                raise NotFoundError("software not found")
-            if not software.is_public and software.owner_id != actor_id:
-                raise ForbiddenError("actor cannot access versions for this software")
-
-            stmt = (
-                select(VersionModel, ArtifactModel)
-                .join(ArtifactModel, ArtifactModel.id == VersionModel.artifact_id)
-                .where(VersionModel.software_id == software_id)
-                .order_by(VersionModel.created_at.desc())
-                .limit(limit)
+        # The visibility check rides along as a join, so a readable software
+        # with versions costs one round trip; the probe below only runs when
+        # nothing came back and has to tell "missing"/"forbidden"/"empty" apart.
+        stmt = (
+            select(VersionModel, ArtifactModel)
+            .join(ArtifactModel, ArtifactModel.id == VersionModel.artifact_id)
+            .join(SoftwareModel, SoftwareModel.id == VersionModel.software_id)
+            .where(
+                VersionModel.software_id == software_id,
+                or_(SoftwareModel.is_public.is_(True), SoftwareModel.owner_id == actor_id),
             )
+            .order_by(VersionModel.created_at.desc())
+            .limit(limit)
+            .options(raiseload("*"))
+        )
+        async with self._sessionmaker() as session:
             rows = (await session.execute(stmt)).all()
+            if not rows:
+                probe = (
+                    await session.execute(
+                        select(SoftwareModel.is_public, SoftwareModel.owner_id).where(
+                            SoftwareModel.id == software_id
+                        )
+                    )
+                ).one_or_none()
+                if probe is None:
+                    raise NotFoundError("software not found")
+                if not probe.is_public and probe.owner_id != actor_id:
+                    raise ForbiddenError("actor cannot access versions for this software")
         return [
             VersionListRecord(
                 id=version_row.id,
@@ -441,7 +526,7 @@ class SQLAlchemySoftwareRepository(SoftwareRepository):
     async def list_admin_softwares(
         self,
         *,
-        offset: int = 0,
+        cursor: UUID | None = None,
         limit: int = 100,
     ) -> list[AdminSoftwareRecord]:
         latest_subq = (
@@ -452,32 +537,46 @@ class SQLAlchemySoftwareRepository(SoftwareRepository):
             .group_by(VersionModel.software_id)
             .subquery()
         )
+        # Only the columns carried by ix_sms_softwares_updated_cover are read
+        # from sms_softwares, so that side never touches the heap.
         stmt = (
-            select(SoftwareModel, VersionModel)
+            select(
+                SoftwareModel.id,
+                SoftwareModel.name,
+                SoftwareModel.owner_id,
+                SoftwareModel.is_public,
+                SoftwareModel.created_at,
+                SoftwareModel.updated_at,
+                VersionModel.version,
+                VersionModel.download_count,
+            )
             .outerjoin(latest_subq, latest_subq.c.software_id == SoftwareModel.id)
             .outerjoin(
                 VersionModel,
                 (VersionModel.software_id == SoftwareModel.id)
                 & (VersionModel.created_at == latest_subq.c.max_created_at),
             )
-            .order_by(SoftwareModel.updated_at.desc())
-            .offset(offset)
+            .order_by(SoftwareModel.updated_at.desc(), SoftwareModel.id.desc())
             .limit(limit)
         )
+        if cursor is not None:
+            stmt = stmt.where(_after_cursor(cursor))
         async with self._sessionmaker() as session:
             rows = (await session.execute(stmt)).all()
+            if not rows and cursor is not None:
+                await _ensure_cursor_exists(session, cursor)
         return [
             AdminSoftwareRecord(
-                package_id=software.id,
-                name=software.name,
-                owner_id=software.owner_id,
-                is_public=software.is_public,
-                latest_version=version_row.version if version_row else None,
-                download_count=version_row.download_count if version_row else 0,
-                created_at=software.created_at,
-                updated_at=software.updated_at,
+                package_id=row.id,
+                name=row.name,
+                owner_id=row.owner_id,
+                is_public=row.is_public,
+                latest_version=row.version,
+                download_count=row.download_count or 0,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
             )
-            for software, version_row in rows
+            for row in rows
         ]
 
     async def get_idempotency_record(
@@ -566,27 +665,11 @@ class SQLAlchemySoftwareRepository(SoftwareRepository):
             software.updated_at = now
             return software
 
-        stmt = (
-            select(SoftwareModel)
-            .where(
-                SoftwareModel.owner_id == command.actor_id,
-                SoftwareModel.name == command.software_name.strip(),
-            )
-            .with_for_update()
-        )
-        software = (await session.execute(stmt)).scalar_one_or_none()
-        if software is not None:
-            if (
-                command.expected_software_row_version is not None
-                and software.row_version != command.expected_software_row_version
-            ):
-                raise ConflictError("software version conflict")
-            software.description = command.software_description.strip()
-            software.is_public = command.is_public
-            software.updated_at = now
-            return software
-
-        software = SoftwareModel(
+        # One INSERT .. ON CONFLICT (owner_id, name) DO UPDATE .. RETURNING
+        # both creates and locks/updates the row; a row-version mismatch makes
+        # the conflict branch a no-op, which comes back as no row.
+        insert = pg_insert if session.bind.dialect.name == "postgresql" else sqlite_insert
+        insert_stmt = insert(SoftwareModel).values(
             owner_id=command.actor_id,
             name=command.software_name.strip(),
             description=command.software_description.strip(),
@@ -595,6 +678,22 @@ class SQLAlchemySoftwareRepository(SoftwareRepository):
             created_at=now,
             updated_at=now,
         )
-        session.add(software)
-        await session.flush()
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[SoftwareModel.owner_id, SoftwareModel.name],
+            set_={
+                "description": insert_stmt.excluded.description,
+                "is_public": insert_stmt.excluded.is_public,
+                "updated_at": insert_stmt.excluded.updated_at,
+            },
+            where=(
+                SoftwareModel.row_version == command.expected_software_row_version
+                if command.expected_software_row_version is not None
+                else None
+            ),
+        ).returning(SoftwareModel)
+        software = (
+            await session.scalars(stmt, execution_options={"populate_existing": True})
+        ).one_or_none()
+        if software is None:
+            raise ConflictError("software version conflict")
         return software
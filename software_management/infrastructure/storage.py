@@ -2,25 +2,66 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import AsyncIterable, AsyncIterator
 from uuid import uuid4
 
-import aiofiles
-import aiofiles.os as aioos
-import aiofiles.ospath as aiospath
 
 from software_management.application.dtos import StoredObject
 from software_management.application.errors import NotFoundError, ValidationError
 from software_management.application.interfaces import StorageService
 
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+# Small producer chunks are coalesced up to this size before they are hashed
+# and written, so each hash update and thread handoff covers a full MiB.
+_FEED_SIZE = 1024 * 1024
+
+
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _open_for_write(path: str) -> int:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return os.open(path, _WRITE_FLAGS, 0o644)
+
+
+def _open_for_sequential_read(path: str) -> int:
+    fd = os.open(path, _READ_FLAGS)
+    if hasattr(os, "posix_fadvise"):
+        # Doubles the kernel readahead window for the whole file.
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return fd
+
+
+def _write_all(fd: int, data: bytes | memoryview) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+async def _hash_and_write(hasher: hashlib._Hash, fd: int, data: bytes | memoryview) -> None:
+    # Digest and disk write read the same buffer independently, so they run on
+    # separate worker threads: hashlib drops the GIL for large buffers, and the
+    # feed costs max(hash, write) instead of their sum. Both finish before the
+    # buffer is handed back, so pooled views stay valid.
+    # Wait for both even if one fails, so no thread still reads the buffer.
+    results = await asyncio.gather(
+        asyncio.to_thread(hasher.update, data),
+        asyncio.to_thread(_write_all, fd, data),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 @dataclass(frozen=True, slots=True)
 class LocalStorageConfig:
     root: Path
@@ -32,6 +73,7 @@ class LocalAsyncStorageService(StorageService):
         self._root = config.root
         self._max_upload_size_bytes = config.max_upload_size_bytes
         self._root.mkdir(parents=True, exist_ok=True)
+        self._root_str = str(self._root.resolve())
 
     async def store_stream(
         self,
@@ -43,23 +85,37 @@ class LocalAsyncStorageService(StorageService):
         object_id = uuid4().hex
         storage_key = f"artifacts/{object_id[:2]}/{object_id}"
         file_path = self._resolve(storage_key)
-        await asyncio.to_thread(file_path.parent.mkdir, parents=True, exist_ok=True)
 
         total_bytes = 0
         hasher = hashlib.sha256()
+        pending = bytearray()
         try:
-            async with aiofiles.open(file_path, "wb") as handle:
+            # A raw descriptor, opened in the same thread hop as the mkdir,
+            # costs one worker handoff per chunk and no aiofiles wrapper.
+            fd = await asyncio.to_thread(_open_for_write, file_path)
+            try:
                 async for chunk in stream:
+                    # Producers never yield empty chunks mid-stream, so one
+                    # only ever marks the end of the body.
                     if not chunk:
-                        continue
+                        break
                     total_bytes += len(chunk)
                     if (
                         self._max_upload_size_bytes is not None
                         and total_bytes > self._max_upload_size_bytes
                     ):
                         raise ValidationError("upload exceeds maximum allowed size")
-                    hasher.update(chunk)
-                    await handle.write(chunk)
+                    if not pending and len(chunk) >= _FEED_SIZE:
+                        await _hash_and_write(hasher, fd, chunk)
+                        continue
+                    pending += chunk
+                    if len(pending) >= _FEED_SIZE:
+                        await _hash_and_write(hasher, fd, pending)
+                        pending.clear()
+                if pending:
+                    await _hash_and_write(hasher, fd, pending)
+            finally:
+                os.close(fd)
         except Exception:
             await self.delete(storage_key)
             raise
@@ -85,39 +141,78 @@ class LocalAsyncStorageService(StorageService):
         end: int | None = None,
     ) -> AsyncIterator[bytes]:
         path = self._resolve(storage_key)
-        if not await aiospath.exists(path):
+        if not os.path.exists(path):
             raise NotFoundError("artifact not found in storage")
 
         async def _stream() -> AsyncIterator[bytes]:
-            async with aiofiles.open(path, "rb") as handle:
-                if start > 0:
-                    await handle.seek(start)
+            # pread carries its own offset, so there is no seek and no file
+            # object state to drive from the event loop.
+            fd = await asyncio.to_thread(_open_for_sequential_read, path)
+            try:
+                offset = start
                 remaining = None if end is None else max(0, end - start + 1)
                 while True:
                     read_size = chunk_size if remaining is None else min(chunk_size, remaining)
                     if read_size <= 0:
                         break
-                    chunk = await handle.read(read_size)
+                    chunk = await asyncio.to_thread(os.pread, fd, read_size, offset)
                     if not chunk:
                         break
+                    offset += len(chunk)
                     if remaining is not None:
                         remaining -= len(chunk)
                     yield chunk
+            finally:
+                os.close(fd)
 
         return _stream()
 
-    async def delete(self, storage_key: str) -> None:
+    async def local_path(self, storage_key: str) -> Path | None:
+        # Single stat/unlink calls stay on the loop: a worker-thread handoff
+        # costs more than the cache-hot syscall itself.
+        path = self._resolve(storage_key)
+        if not os.path.exists(path):
+            raise NotFoundError("artifact not found in storage")
+        return Path(path)
+
+    async def link_duplicate(self, storage_key: str, existing_storage_key: str) -> bool:
+        # Swap the freshly written copy for a hard link to the identical blob
+        # already on disk. Each artifact keeps its own key; the bytes are only
+        # released once the last link is deleted.
         path = self._resolve(storage_key)
+        existing_path = self._resolve(existing_storage_key)
+        if path == existing_path:
+            return False
+        staging_path = f"{path}.link"
         try:
-            await aioos.remove(path)
-        except FileNotFoundError:
-            return
-        except Exception:
+            await asyncio.to_thread(os.link, existing_path, staging_path)
+            await asyncio.to_thread(os.replace, staging_path, path)
+        except OSError:
+            # Existing blob vanished or the filesystem refuses hard links;
+            # the uploaded copy stays in place.
+            await self._discard(staging_path)
+            return False
+        return True
+
+    async def _discard(self, path: str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
             return
 
-    def _resolve(self, storage_key: str) -> Path:
-        candidate = (self._root / storage_key).resolve()
-        root = self._root.resolve()
-        if not str(candidate).startswith(str(root)):
+    async def delete(self, storage_key: str) -> None:
+        await self._discard(self._resolve(storage_key))
+
+    def _resolve(self, storage_key: str) -> str:
+        # Keys are "/"-separated relative paths, so a single scan of the padded
+        # key catches every ".." segment without normalizing the joined path.
+        # Backslashes are never generated and would be separators on Windows.
+        if (
+            not storage_key
+            or storage_key[0] == "/"
+            or "\x00" in storage_key
+            or "\\" in storage_key
+            or "/../" in f"/{storage_key}/"
+        ):
             raise ValidationError("invalid storage key")
-        return candidate
+        return os.path.join(self._root_str, storage_key)
@@ -21,8 +21,6 @@ class AsyncVirusScannerAdapter(VirusScannerService):
         async def _scan() -> AsyncIterator[bytes]:
             carry = b""
             async for chunk in stream:
-                if not chunk:
-                    continue
                 payload = carry + chunk
                 if self._SIGNATURE in payload:
                     raise ValidationError("virus signature detected")
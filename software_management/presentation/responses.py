@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Mapping
+
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+_ZEROCOPY_EXTENSION = "http.response.zerocopy"
+_DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class FileRangeResponse(Response):
+    """Serves ``[start, end]`` of a local file without an async generator per chunk.
+
+    Servers advertising the ASGI zero-copy extension get the open file and
+    splice it to the socket themselves; otherwise slices are read with
+    ``os.pread`` so no file position has to be kept in sync.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        start: int,
+        end: int,
+        status_code: int = 206,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.path = path
+        self.start = start
+        self.count = end - start + 1
+        self.chunk_size = chunk_size
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.body = b""
+        self.init_headers(headers)
+        self.headers["content-length"] = str(self.count)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        with open(self.path, "rb", buffering=0) as file:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                }
+            )
+            if scope["method"].upper() == "HEAD":
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+                return
+            if _ZEROCOPY_EXTENSION in scope.get("extensions", {}):
+                await send(
+                    {
+                        "type": _ZEROCOPY_EXTENSION,
+                        "file": file,
+                        "offset": self.start,
+                        "count": self.count,
+                        "more_body": False,
+                    }
+                )
+                return
+            await self._send_chunks(file.fileno(), send)
+
+    async def _send_chunks(self, fd: int, send: Send) -> None:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, self.start, self.count, os.POSIX_FADV_SEQUENTIAL)
+        offset = self.start
+        remaining = self.count
+        while remaining > 0:
+            chunk = await run_in_threadpool(os.pread, fd, min(self.chunk_size, remaining), offset)
+            if not chunk:
+                break
+            offset += len(chunk)
+            remaining -= len(chunk)
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": remaining > 0,
+                }
+            )
+        if remaining > 0:
+            # File shrank underneath us; close the body rather than hang.
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
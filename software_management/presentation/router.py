@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import re
 import threading
 import time
 from typing import Any, AsyncIterator, Callable
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Query, Request, UploadFile, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 
 from software_management.application.dtos import (
     DeleteSoftwareInput,
@@ -22,7 +25,9 @@ from software_management.application.dtos import (
 from software_management.application.errors import (
     ConflictError,
     ForbiddenError,
+    InvalidCursorError,
     NotFoundError,
+    RangeNotSatisfiableError,
     ValidationError,
 )
 from software_management.application.use_cases import (
@@ -37,23 +42,54 @@ from software_management.application.use_cases import (
     RevokeVersion,
     UploadSoftware,
 )
+from software_management.infrastructure.buffer_pool import BufferPool
 
+from .responses import FileRangeResponse
 from .schemas import (
+    AdminSoftwareListAdapter,
     AdminSoftwareResponse,
     AdminSummaryResponse,
     DeleteSoftwareResponse,
     DeprecateVersionResponse,
     PublishVersionResponse,
     RevokeVersionResponse,
+    SoftwareListAdapter,
     SoftwareListResponse,
     UploadSoftwareResponse,
+    VersionListAdapter,
     VersionListResponse,
+    from_trusted,
 )
 
 
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def _parse_range(range_header: str | None) -> tuple[int | None, int | None] | None:
+    # Only single ranges are honoured; anything else (multi-range, other units,
+    # malformed values) falls back to a full 200 response as RFC 9110 allows.
+    if not range_header:
+        return None
+    match = _RANGE_RE.fullmatch(range_header.strip())
+    if match is None:
+        return None
+    start_s, end_s = match.groups()
+    if not start_s and not end_s:
+        return None
+    return (int(start_s) if start_s else None, int(end_s) if end_s else None)
+
+
 def _raise_http_error(exc: Exception) -> None:
     if isinstance(exc, HTTPException):
         raise exc
+    if isinstance(exc, RangeNotSatisfiableError):
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail=str(exc),
+            headers={"Content-Range": f"bytes */{exc.size_bytes}"},
+        )
+    if isinstance(exc, InvalidCursorError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     if isinstance(exc, ValidationError):
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
     if isinstance(exc, ConflictError):
@@ -65,6 +101,20 @@ def _raise_http_error(exc: Exception) -> None:
     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="internal server error")
 
 
+def _json_list(adapter: TypeAdapter[list[Any]], items: list[Any]) -> Response:
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
+
+def _reject_offset(offset: int | None) -> None:
+    # Listings moved from OFFSET to keyset paging; answering an old ?offset=N
+    # with page 1 would silently repeat rows, so it is refused outright.
+    if offset is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="offset pagination is no longer supported; pass the last item's id as cursor",
+        )
+
+
 def _assert_admin(current_actor: dict) -> None:
     if str(current_actor.get("role", "")).upper() != "ADMIN":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="admin access required")
@@ -83,14 +133,18 @@ def create_router(
     get_admin_summary: GetAdminSummary,
     list_admin_software: ListAdminSoftware,
     current_actor_dependency: Callable[..., Any],
-    upload_chunk_size: int,
-    upload_max_size_bytes: int | None,
+    buffer_pool: BufferPool,
+    download_chunk_size: int,
     upload_rate_limit: int,
     upload_rate_window_seconds: int,
     download_rate_limit: int,
     download_rate_window_seconds: int,
 ) -> APIRouter:
-    router = APIRouter(prefix="/api/v1/software-management", tags=["Software Management"])
+    router = APIRouter(
+        prefix="/api/v1/software-management",
+        tags=["Software Management"],
+        default_response_class=ORJSONResponse,
+    )
     rate_buckets: dict[str, tuple[int, int]] = {}
     rate_lock = threading.Lock()
 
@@ -122,16 +176,18 @@ def create_router(
                 headers={"Retry-After": str(retry_after)},
             )
 
-    async def _upload_stream(file: UploadFile) -> AsyncIterator[bytes]:
-        total_read = 0
-        while True:
-            chunk = await file.read(upload_chunk_size)
-            if not chunk:
-                break
-            total_read += len(chunk)
-            if upload_max_size_bytes is not None and total_read > upload_max_size_bytes:
-                raise ValidationError("upload exceeds maximum allowed size")
-            yield chunk
+    async def _upload_stream(file: UploadFile) -> AsyncIterator[memoryview]:
+        # Read straight into a pooled slab instead of allocating a fresh bytes
+        # object per chunk. Each view is only valid until the consumer asks for
+        # the next one, which holds for the scanner -> storage pipeline. The
+        # size cap is enforced once, by the storage writer.
+        buffer = buffer_pool.acquire()
+        view = memoryview(buffer)
+        try:
+            while read := await run_in_threadpool(file.file.readinto, buffer):
+                yield view[:read]
+        finally:
+            buffer_pool.release(buffer)
 
     @router.post("/upload", response_model=UploadSoftwareResponse, status_code=status.HTTP_201_CREATED)
     async def upload_endpoint(
@@ -180,19 +236,21 @@ def create_router(
 
     @router.get("", response_model=list[SoftwareListResponse], status_code=status.HTTP_200_OK)
     async def list_software_endpoint(
-        offset: int = Query(0, ge=0),
+        cursor: UUID | None = Query(None),
         limit: int = Query(100, ge=1, le=300),
+        offset: int | None = Query(None, deprecated=True),
         current_actor: dict = Depends(current_actor_dependency),
-    ) -> list[SoftwareListResponse]:
+    ) -> Response:
+        _reject_offset(offset)
         try:
             items = await list_software.execute(
                 ListSoftwareInput(
                     actor_id=str(current_actor["user_id"]),
-                    offset=offset,
+                    cursor=cursor,
                     limit=limit,
                 )
             )
-            return [SoftwareListResponse.model_validate(item) for item in items]
+            return _json_list(SoftwareListAdapter, [from_trusted(SoftwareListResponse, item) for item in items])
         except Exception as exc:
             _raise_http_error(exc)
 
@@ -201,7 +259,7 @@ def create_router(
         software_id: UUID,
         limit: int = Query(20, ge=1, le=100),
         current_actor: dict = Depends(current_actor_dependency),
-    ) -> list[VersionListResponse]:
+    ) -> Response:
         try:
             items = await list_versions.execute(
                 ListVersionsInput(
@@ -210,7 +268,7 @@ def create_router(
                     limit=limit,
                 )
             )
-            return [VersionListResponse.model_validate(item) for item in items]
+            return _json_list(VersionListAdapter, [from_trusted(VersionListResponse, item) for item in items])
         except Exception as exc:
             _raise_http_error(exc)
 
@@ -296,7 +354,7 @@ def create_router(
         software_id: UUID,
         version: str,
         current_actor: dict = Depends(current_actor_dependency),
-    ) -> StreamingResponse:
+    ) -> Response:
         try:
             actor_id = str(current_actor["user_id"])
             _enforce_rate_limit(
@@ -311,12 +369,50 @@ def create_router(
                     actor_id=actor_id,
                     software_id=software_id,
                     version=version.strip(),
+                    byte_range=_parse_range(request.headers.get("range")),
+                )
+            )
+            headers = {
+                "ETag": output.file_hash,
+                "Content-Disposition": f'attachment; filename="{output.file_name}"',
+                "Accept-Ranges": "bytes",
+            }
+            if output.content_range is not None:
+                start, end = output.content_range
+                headers["Content-Range"] = f"bytes {start}-{end}/{output.size_bytes}"
+                if output.local_path is not None:
+                    return FileRangeResponse(
+                        output.local_path,
+                        start=start,
+                        end=end,
+                        media_type=output.content_type,
+                        headers=headers,
+                        chunk_size=download_chunk_size,
+                    )
+                headers["Content-Length"] = str(end - start + 1)
+                return StreamingResponse(
+                    output.stream,
+                    status_code=status.HTTP_206_PARTIAL_CONTENT,
+                    media_type=output.content_type,
+                    headers=headers,
                 )
+            if output.local_path is not None:
+                # FileResponse stats the file for Content-Length and lets servers
+                # with the pathsend extension hand the fd to the kernel. Its own
+                # 64 KiB read size is raised so fallback reads cross fewer threads.
+                response = FileResponse(
+                    output.local_path,
+                    media_type=output.content_type,
+                    headers=headers,
+                )
+                response.chunk_size = download_chunk_size
+                return response
+            response = StreamingResponse(
+                output.stream,
+                media_type=output.content_type,
+                headers=headers,
             )
-            response = StreamingResponse(output.stream, media_type=output.content_type)
             response.headers["Content-Length"] = str(output.size_bytes)
-            response.headers["ETag"] = output.file_hash
-            response.headers["Content-Disposition"] = f'attachment; filename="{output.file_name}"'
             return response
         except Exception as exc:
             _raise_http_error(exc)
@@ -349,16 +445,21 @@ def create_router(
     ) -> AdminSummaryResponse:
         _assert_admin(current_actor)
         output = await get_admin_summary.execute()
-        return AdminSummaryResponse.model_validate(output)
+        return from_trusted(AdminSummaryResponse, output)
 
     @router.get("/admin/packages", response_model=list[AdminSoftwareResponse], status_code=status.HTTP_200_OK)
     async def admin_packages_endpoint(
-        offset: int = Query(0, ge=0),
+        cursor: UUID | None = Query(None),
         limit: int = Query(100, ge=1, le=300),
+        offset: int | None = Query(None, deprecated=True),
         current_actor: dict = Depends(current_actor_dependency),
-    ) -> list[AdminSoftwareResponse]:
+    ) -> Response:
         _assert_admin(current_actor)
-        items = await list_admin_software.execute(ListAdminSoftwareInput(offset=offset, limit=limit))
-        return [AdminSoftwareResponse.model_validate(item) for item in items]
+        _reject_offset(offset)
+        try:
+            items = await list_admin_software.execute(ListAdminSoftwareInput(cursor=cursor, limit=limit))
+        except Exception as exc:
+            _raise_http_error(exc)
+        return _json_list(AdminSoftwareListAdapter, [from_trusted(AdminSoftwareResponse, item) for item in items])
 
     return router
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
 
 
 class UploadSoftwareResponse(BaseModel):
@@ -113,3 +116,15 @@ class AdminSoftwareResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     detail: str = Field(..., min_length=1)
+
+
+def from_trusted(model: type[_ModelT], obj: object) -> _ModelT:
+    """Build a response model from a use-case DTO without re-validating it."""
+    return model.model_construct(**{name: getattr(obj, name) for name in model.model_fields})
+
+
+# Built once at import: list endpoints dump the whole page in a single
+# pydantic-core call instead of re-validating it against response_model.
+SoftwareListAdapter = TypeAdapter(list[SoftwareListResponse])
+VersionListAdapter = TypeAdapter(list[VersionListResponse])
+AdminSoftwareListAdapter = TypeAdapter(list[AdminSoftwareResponse])
@@ -5,9 +5,9 @@ import hashlib
 import os
 import shutil
 import uuid
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from fastapi import FastAPI, Header
 from fastapi.testclient import TestClient
@@ -40,6 +40,7 @@ def sms_test_client(
     upload_rate_window_seconds: int = 60,
     download_rate_limit: int = 120,
     download_rate_window_seconds: int = 60,
+    download_count_flush_interval_seconds: float = 0.0,
 ) -> Generator[TestClient, None, None]:
     with writable_temp_dir() as base_path:
         database_path = base_path / "sms.db"
@@ -51,7 +52,16 @@ def sms_test_client(
         ) -> dict:
             return {"user_id": x_actor_user, "role": x_actor_role}
 
-        app = FastAPI()
+        @asynccontextmanager
+        async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+            # Started on the client's loop so the download flush task lives there.
+            await sms_module.initialize()
+            try:
+                yield
+            finally:
+                await sms_module.close()
+
+        app = FastAPI(lifespan=lifespan)
         sms_module = build_sms_module(
             config=SMSBootstrapConfig(
                 database_url=f"sqlite:///{database_path}",
@@ -62,18 +72,17 @@ def sms_test_client(
                 upload_rate_window_seconds=upload_rate_window_seconds,
                 download_rate_limit=download_rate_limit,
                 download_rate_window_seconds=download_rate_window_seconds,
+                download_count_flush_interval_seconds=download_count_flush_interval_seconds,
             ),
             current_actor_dependency=current_actor_dependency,
         )
         # In integration tests we bootstrap a temporary SQLite DB directly.
         asyncio.run(sms_module.database.create_schema())
-        asyncio.run(sms_module.initialize())
+        app.state.sms_module = sms_module
+        app.state.storage_root = storage_path
         app.include_router(sms_module.router)
-        try:
-            with TestClient(app) as client:
-                yield client
-        finally:
-            asyncio.run(sms_module.close())
+        with TestClient(app) as client:
+            yield client
 
 
 def test_unauthorized_download_does_not_increment_count() -> None:
@@ -147,6 +156,111 @@ def test_successful_download_increments_count_and_streams() -> None:
         assert versions[0]["download_count"] == 1
 
 
+def test_buffered_download_counts_are_flushed_on_close() -> None:
+    with sms_test_client(
+        max_upload_size_bytes=1024,
+        download_count_flush_interval_seconds=3600,
+    ) as client:
+        owner_headers = {"X-Actor-User": "owner-5"}
+        upload_response = client.post(
+            "/api/v1/software-management/upload",
+            headers=owner_headers,
+            data={
+                "software_name": "buffered-package",
+                "software_description": "buffered artifact",
+                "version": "1.0.0",
+                "is_public": "true",
+                "publish_now": "true",
+            },
+            files={"file": ("artifact.bin", b"buffered-content", "application/octet-stream")},
+        )
+        assert upload_response.status_code == 201
+        software_id = upload_response.json()["software_id"]
+        download_url = f"/api/v1/software-management/{software_id}/versions/1.0.0/download"
+        versions_url = f"/api/v1/software-management/{software_id}/versions"
+
+        for _ in range(2):
+            assert client.get(download_url, headers={"X-Actor-User": "consumer-1"}).status_code == 200
+        assert client.get(versions_url, headers=owner_headers).json()[0]["download_count"] == 0
+
+        client.portal.call(client.app.state.sms_module.close)
+
+        versions = client.get(versions_url, headers=owner_headers).json()
+        assert versions[0]["download_count"] == 2
+
+
+def test_range_download_returns_partial_content() -> None:
+    with sms_test_client(max_upload_size_bytes=1024) as client:
+        owner_headers = {"X-Actor-User": "owner-3"}
+        payload = b"0123456789abcdef"
+        upload_response = client.post(
+            "/api/v1/software-management/upload",
+            headers=owner_headers,
+            data={
+                "software_name": "ranged-package",
+                "software_description": "ranged artifact",
+                "version": "1.0.0",
+                "is_public": "true",
+                "publish_now": "true",
+            },
+            files={"file": ("artifact.bin", payload, "application/octet-stream")},
+        )
+        assert upload_response.status_code == 201
+        software_id = upload_response.json()["software_id"]
+        download_url = f"/api/v1/software-management/{software_id}/versions/1.0.0/download"
+
+        partial = client.get(download_url, headers={"X-Actor-User": "consumer-1", "Range": "bytes=2-5"})
+        assert partial.status_code == 206
+        assert partial.content == payload[2:6]
+        assert partial.headers["Content-Range"] == f"bytes 2-5/{len(payload)}"
+
+        suffix = client.get(download_url, headers={"X-Actor-User": "consumer-1", "Range": "bytes=-4"})
+        assert suffix.status_code == 206
+        assert suffix.content == payload[-4:]
+
+        unsatisfiable = client.get(download_url, headers={"X-Actor-User": "consumer-1", "Range": "bytes=99-"})
+        assert unsatisfiable.status_code == 416
+        assert unsatisfiable.headers["Content-Range"] == f"bytes */{len(payload)}"
+
+
+def test_duplicate_upload_survives_deleting_the_original() -> None:
+    with sms_test_client(max_upload_size_bytes=1024) as client:
+        owner_headers = {"X-Actor-User": "owner-4"}
+        payload = b"shared-sdk-bundle"
+        software_ids = []
+        for name in ("template-a", "template-b"):
+            response = client.post(
+                "/api/v1/software-management/upload",
+                headers=owner_headers,
+                data={
+                    "software_name": name,
+                    "software_description": "",
+                    "version": "1.0.0",
+                    "is_public": "true",
+                    "publish_now": "true",
+                },
+                files={"file": ("bundle.zip", payload, "application/zip")},
+            )
+            assert response.status_code == 201
+            software_ids.append(response.json()["software_id"])
+
+        artifacts = [path for path in client.app.state.storage_root.rglob("*") if path.is_file()]
+        assert len(artifacts) == 2
+        first, second = (os.stat(path) for path in artifacts)
+        assert first.st_ino == second.st_ino
+        assert first.st_nlink == 2
+
+        deleted = client.delete(f"/api/v1/software-management/{software_ids[0]}", headers=owner_headers)
+        assert deleted.status_code == 200
+
+        download = client.get(
+            f"/api/v1/software-management/{software_ids[1]}/versions/1.0.0/download",
+            headers={"X-Actor-User": "consumer-1"},
+        )
+        assert download.status_code == 200
+        assert download.content == payload
+
+
 def test_upload_rejected_when_exceeding_max_size() -> None:
     with sms_test_client(max_upload_size_bytes=8) as client:
         response = client.post(
@@ -351,3 +465,54 @@ def test_deprecate_and_revoke_version_flow() -> None:
         )
         assert revoke.status_code == 200
         assert revoke.json()["version"] == "1.0.0"
+
+
+def test_software_listing_pages_by_cursor() -> None:
+    with sms_test_client(max_upload_size_bytes=1024) as client:
+        owner_headers = {"X-Actor-User": "owner-9"}
+        for index in range(3):
+            response = client.post(
+                "/api/v1/software-management/upload",
+                headers=owner_headers,
+                data={
+                    "software_name": f"paged-{index}",
+                    "software_description": "",
+                    "version": "1.0.0",
+                    "is_public": "true",
+                    "publish_now": "true",
+                },
+                files={"file": ("bundle.bin", f"payload-{index}".encode(), "application/octet-stream")},
+            )
+            assert response.status_code == 201
+
+        first_page = client.get("/api/v1/software-management?limit=2", headers=owner_headers)
+        assert first_page.status_code == 200
+        first_ids = [item["id"] for item in first_page.json()]
+        assert len(first_ids) == 2
+
+        second_page = client.get(
+            f"/api/v1/software-management?limit=2&cursor={first_ids[-1]}",
+            headers=owner_headers,
+        )
+        assert second_page.status_code == 200
+        second_ids = [item["id"] for item in second_page.json()]
+        assert len(second_ids) == 1
+        assert not set(first_ids) & set(second_ids)
+
+        end_page = client.get(
+            f"/api/v1/software-management?limit=2&cursor={second_ids[-1]}",
+            headers=owner_headers,
+        )
+        assert end_page.status_code == 200
+        assert end_page.json() == []
+
+        deleted = client.delete(f"/api/v1/software-management/{first_ids[-1]}", headers=owner_headers)
+        assert deleted.status_code == 200
+        stale = client.get(
+            f"/api/v1/software-management?limit=2&cursor={first_ids[-1]}",
+            headers=owner_headers,
+        )
+        assert stale.status_code == 400
+
+        legacy = client.get("/api/v1/software-management?offset=2", headers=owner_headers)
+        assert legacy.status_code == 400
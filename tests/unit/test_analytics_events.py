@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import analytics
+from app.core.security import get_current_user
+
+
+def _client(captured: list[dict], monkeypatch) -> TestClient:
+    async def fake_submit(**kwargs) -> None:
+        captured.append(kwargs)
+
+    monkeypatch.setattr(analytics, "submit_http_audit_event", fake_submit)
+    app = FastAPI()
+    app.include_router(analytics.router)
+    app.dependency_overrides[get_current_user] = lambda: {"user_id": 1, "role": "USER"}
+    return TestClient(app)
+
+
+def test_metadata_orjson_cannot_encode_is_stringified(monkeypatch) -> None:
+    captured: list[dict] = []
+    client = _client(captured, monkeypatch)
+    body = (
+        '{"event_type": "user_activity", "action": "click",'
+        ' "metadata": {"big": [1180591620717411303424], "bad": {"b": "\\ud800"}}}'
+    )
+
+    response = client.post(
+        "/api/v1/analytics/events",
+        content=body,
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 202
+    metadata = captured[0]["metadata"]
+    assert metadata["big"] == "[1180591620717411303424]"
+    assert isinstance(metadata["bad"], str)
+
+
+def test_cookie_consent_action_is_case_insensitive(monkeypatch) -> None:
+    captured: list[dict] = []
+    client = _client(captured, monkeypatch)
+
+    accepted = client.post(
+        "/api/v1/analytics/events",
+        json={"event_type": "cookie_consent", "action": "Accepted"},
+    )
+    rejected = client.post(
+        "/api/v1/analytics/events",
+        json={"event_type": "cookie_consent", "action": "maybe"},
+    )
+
+    assert accepted.status_code == 202
+    assert captured[0]["event_type"] == "cookie.consent.accepted"
+    assert rejected.status_code == 422
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import security
+from app.core.abuse_protection import AbuseProtection
+from app.core.config import settings
+
+
+def _client(monkeypatch) -> tuple[TestClient, list[str]]:
+    decoded: list[str] = []
+    real_decode = security.jwt.decode
+
+    def counting_decode(token, *args, **kwargs):
+        decoded.append(token)
+        return real_decode(token, *args, **kwargs)
+
+    limiter = AbuseProtection()
+    limiter._redis_checked = True  # in-memory windows only
+    monkeypatch.setattr(security, "abuse_protection", limiter)
+    monkeypatch.setattr(security, "_bad_token_cache", {})
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+
+    app = FastAPI()
+
+    @app.get("/me")
+    def me(current_user: dict = Depends(security.get_current_user)) -> dict:
+        return current_user
+
+    return TestClient(app), decoded
+
+
+def _get(client: TestClient, token: str):
+    return client.get("/me", headers={"Authorization": f"Bearer {token}"})
+
+
+def test_repeated_bad_token_is_rejected_without_decoding(monkeypatch) -> None:
+    client, decoded = _client(monkeypatch)
+
+    first = _get(client, "not-a-jwt")
+    second = _get(client, "not-a-jwt")
+
+    assert first.status_code == 401
+    assert second.status_code == 401
+    assert decoded == ["not-a-jwt"]
+
+
+def test_valid_token_is_never_short_circuited(monkeypatch) -> None:
+    client, decoded = _client(monkeypatch)
+    token = security.create_login_token({"sub": "7", "role": "USER"})
+    _get(client, "not-a-jwt")
+
+    responses = [_get(client, token) for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert responses[0].json() == {"user_id": 7, "role": "USER"}
+    assert decoded.count(token) == 3
+
+
+def test_distinct_bad_tokens_are_rate_limited(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "AUTH_BAD_TOKEN_RATE_LIMIT", 3)
+    client, _ = _client(monkeypatch)
+
+    statuses = [_get(client, f"bad-{index}").status_code for index in range(3)]
+    limited = _get(client, "bad-3")
+
+    assert statuses == [401, 401, 401]
+    assert limited.status_code == 429
+    assert int(limited.headers["Retry-After"]) >= 1
+
+
+def test_bad_token_cache_evicts_oldest_entry(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "AUTH_BAD_TOKEN_CACHE_MAX_SIZE", 2)
+    client, decoded = _client(monkeypatch)
+
+    for token in ("bad-a", "bad-b", "bad-c"):
+        _get(client, token)
+
+    assert len(security._bad_token_cache) == 2
+    assert security._token_digest("bad-a") not in security._bad_token_cache
+    _get(client, "bad-a")
+    _get(client, "bad-c")
+    assert decoded == ["bad-a", "bad-b", "bad-c", "bad-a"]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import resources, users
+from app.core.security import get_current_user
+from app.core.unit_of_work import service_dep
+from app.models.enums import GenderEnum, RoleEnum
+from app.services.resource_service import ResourceService
+from app.services.user_service import UserService
+
+
+class _FakeUserService:
+    def __init__(self) -> None:
+        self.user = SimpleNamespace(
+            id=1,
+            full_name="Ada Lovelace",
+            username="ada",
+            email="ada@example.com",
+            gender=GenderEnum.PREFER_NOT_TO_SAY,
+            created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            role=RoleEnum.USER,
+        )
+
+    def get_user_by_id(self, user_id: int):
+        return self.user
+
+
+class _FakeResourceService:
+    def __init__(self) -> None:
+        self.items = [
+            {
+                "id": 1,
+                "title": "Guide",
+                "slug": "guide",
+                "type": "doc",
+                "description": "A guide",
+                "url": None,
+                "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            }
+        ]
+
+    def list_resources(self, type_filter: str | None = None):
+        return self.items
+
+    def get_by_slug(self, slug: str):
+        return SimpleNamespace(**self.items[0])
+
+
+def _client() -> tuple[TestClient, _FakeUserService, _FakeResourceService]:
+    user_service = _FakeUserService()
+    resource_service = _FakeResourceService()
+    app = FastAPI()
+    app.include_router(users.router)
+    app.include_router(resources.router)
+    app.dependency_overrides[get_current_user] = lambda: {"user_id": 1, "role": "USER"}
+    app.dependency_overrides[service_dep(UserService)] = lambda: user_service
+    app.dependency_overrides[service_dep(ResourceService)] = lambda: resource_service
+    return TestClient(app), user_service, resource_service
+
+
+def test_profile_etag_revalidates() -> None:
+    client, user_service, _ = _client()
+
+    first = client.get("/api/v1/users/me")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+
+    weak = client.get("/api/v1/users/me", headers={"If-None-Match": etag})
+    strong = client.get("/api/v1/users/me", headers={"If-None-Match": etag.removeprefix("W/")})
+    listed = client.get("/api/v1/users/me", headers={"If-None-Match": f'"other", {etag}'})
+    wildcard = client.get("/api/v1/users/me", headers={"If-None-Match": "*"})
+    assert [weak.status_code, strong.status_code, listed.status_code, wildcard.status_code] == [304] * 4
+    assert weak.headers["ETag"] == etag
+    assert weak.content == b""
+
+    user_service.user.full_name = "Ada King"
+    changed = client.get("/api/v1/users/me", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["full_name"] == "Ada King"
+
+
+def test_resource_list_and_detail_etags_revalidate() -> None:
+    client, _, resource_service = _client()
+
+    for path in ("/api/v1/resources", "/api/v1/resources/guide"):
+        first = client.get(path)
+        etag = first.headers["ETag"]
+        assert first.status_code == 200
+        assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+        assert client.get(path, headers={"If-None-Match": '"stale"'}).status_code == 200
+
+    etag = client.get("/api/v1/resources").headers["ETag"]
+    resource_service.items[0]["title"] = "Updated guide"
+    changed = client.get("/api/v1/resources", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()[0]["title"] == "Updated guide"
@@ -9,7 +9,8 @@ from pathlib import Path
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.exc import InvalidRequestError
 
 from software_management.application.errors import ConflictError
 from software_management.application.interfaces import CreateVersionCommand
@@ -182,3 +183,53 @@ def test_current_version_self_heals() -> None:
                 assert software.current_version_id is None
 
         asyncio.run(scenario())
+
+
+def test_list_queries_raise_on_lazy_relationship_loads() -> None:
+    with writable_temp_dir() as temp_dir:
+        db_path = Path(temp_dir) / "sms.db"
+        database = AsyncDatabase(DatabaseConfig(database_url=f"sqlite:///{db_path}"))
+        asyncio.run(database.create_schema())
+        repository = SQLAlchemySoftwareRepository(database.sessionmaker)
+        errors: list[Exception] = []
+
+        def touch(relationship: str):
+            # Runs inside the list query's session, where a lazy load would
+            # otherwise quietly issue one SELECT per row.
+            def on_load(target, context) -> None:
+                try:
+                    getattr(target, relationship)
+                except InvalidRequestError as exc:
+                    errors.append(exc)
+
+            return on_load
+
+        async def scenario() -> None:
+            created = await repository.create_version(
+                _create_command(
+                    actor_id="owner-3",
+                    software_name="listed",
+                    version="1.0.0",
+                    publish_now=True,
+                )
+            )
+            listeners = [
+                (SoftwareModel, touch("versions")),
+                (VersionModel, touch("artifact")),
+            ]
+            for model, listener in listeners:
+                event.listen(model, "load", listener)
+            try:
+                assert len(await repository.list_softwares("owner-3")) == 1
+                assert len(await repository.list_versions("owner-3", created.software_id)) == 1
+            finally:
+                for model, listener in listeners:
+                    event.remove(model, "load", listener)
+
+        asyncio.run(scenario())
+        asyncio.run(database.dispose())
+
+        # list_softwares loads a software and its latest version; list_versions
+        # loads one more version.
+        assert len(errors) == 3
+        assert all("lazy='raise'" in str(exc) for exc in errors)